@@ -11,7 +11,7 @@ from alembic import context
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from app.db.base import Base  # noqa: E402
-from app.core.config import DATABASE_URL
+from app.core.config import SYNC_DATABASE_URL
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -19,7 +19,7 @@ config = context.config
 fileConfig(config.config_file_name)
 
 # set SQLAlchemy URL
-config.set_main_option("sqlalchemy.url", DATABASE_URL)
+config.set_main_option("sqlalchemy.url", SYNC_DATABASE_URL)
 
 target_metadata = Base.metadata
 
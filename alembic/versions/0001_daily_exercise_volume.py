@@ -0,0 +1,37 @@
+"""Add the daily_exercise_volume rollup table.
+
+Revision ID: 0001
+Revises:
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "daily_exercise_volume",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("exercise_id", sa.Integer(), sa.ForeignKey("exercises.id"), primary_key=True),
+        sa.Column("volume", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sets", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("reps", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Backfill from existing sets; scripts/rebuild_rollups.py does the same on demand.
+    op.execute(
+        "INSERT INTO daily_exercise_volume (user_id, day, exercise_id, volume, sets, reps) "
+        "SELECT w.user_id, date(w.date), s.exercise_id, "
+        "SUM(CASE WHEN s.weight IS NOT NULL AND s.reps IS NOT NULL THEN s.weight * s.reps ELSE 0 END), "
+        "COUNT(s.id), SUM(COALESCE(s.reps, 0)) "
+        "FROM workout_sets s JOIN workouts w ON w.id = s.workout_id "
+        "GROUP BY w.user_id, date(w.date), s.exercise_id"
+    )
+
+
+def downgrade():
+    op.drop_table("daily_exercise_volume")
@@ -0,0 +1,19 @@
+"""Add a composite (user_id, date) index on workouts for range analytics.
+
+Revision ID: 0002
+Revises: 0001
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_workouts_user_id_date", "workouts", ["user_id", "date"])
+
+
+def downgrade():
+    op.drop_index("ix_workouts_user_id_date", table_name="workouts")
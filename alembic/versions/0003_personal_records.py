@@ -0,0 +1,49 @@
+"""Add personal_records and rep_records.
+
+Existing history is not backfilled here; run scripts/rebuild_records.py
+after upgrading.
+
+Revision ID: 0003
+Revises: 0002
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "personal_records",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("exercise_id", sa.Integer(), sa.ForeignKey("exercises.id"), primary_key=True),
+        sa.Column("best_weight", sa.Integer(), nullable=True),
+        sa.Column("best_weight_reps", sa.Integer(), nullable=True),
+        sa.Column("best_weight_workout_id", sa.Integer(), sa.ForeignKey("workouts.id"), nullable=True),
+        sa.Column("best_weight_at", sa.DateTime(), nullable=True),
+        sa.Column("best_e1rm", sa.Float(), nullable=True),
+        sa.Column("best_e1rm_weight", sa.Integer(), nullable=True),
+        sa.Column("best_e1rm_reps", sa.Integer(), nullable=True),
+        sa.Column("best_e1rm_workout_id", sa.Integer(), sa.ForeignKey("workouts.id"), nullable=True),
+        sa.Column("best_e1rm_at", sa.DateTime(), nullable=True),
+        sa.Column("best_session_volume", sa.Integer(), nullable=True),
+        sa.Column("best_session_workout_id", sa.Integer(), sa.ForeignKey("workouts.id"), nullable=True),
+        sa.Column("best_session_at", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "rep_records",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("exercise_id", sa.Integer(), sa.ForeignKey("exercises.id"), primary_key=True),
+        sa.Column("weight", sa.Integer(), primary_key=True),
+        sa.Column("reps", sa.Integer(), nullable=False),
+        sa.Column("workout_id", sa.Integer(), sa.ForeignKey("workouts.id"), nullable=True),
+        sa.Column("achieved_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table("rep_records")
+    op.drop_table("personal_records")
@@ -0,0 +1,33 @@
+"""Add goal progress tracking columns.
+
+Progress starts at zero here; run scripts/evaluate_goals.py after upgrading
+to compute it for existing goals.
+
+Revision ID: 0004
+Revises: 0003
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("goals") as batch:
+        batch.add_column(sa.Column("exercise_id", sa.Integer(), nullable=True))
+        batch.add_column(sa.Column("progress", sa.Integer(), nullable=False, server_default="0"))
+        batch.add_column(sa.Column("achieved_at", sa.DateTime(), nullable=True))
+        batch.create_foreign_key("fk_goals_exercise_id", "exercises", ["exercise_id"], ["id"])
+        batch.create_index("ix_goals_user_kind_exercise", ["user_id", "kind", "exercise_id"])
+
+
+def downgrade():
+    with op.batch_alter_table("goals") as batch:
+        batch.drop_index("ix_goals_user_kind_exercise")
+        batch.drop_constraint("fk_goals_exercise_id", type_="foreignkey")
+        batch.drop_column("achieved_at")
+        batch.drop_column("progress")
+        batch.drop_column("exercise_id")
@@ -0,0 +1,26 @@
+"""Add user_data_versions for conditional GET.
+
+Users start without a row, which reads as version 0.
+
+Revision ID: 0006
+Revises: 0005
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user_data_versions",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("user_data_versions")
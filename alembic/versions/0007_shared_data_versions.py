@@ -0,0 +1,24 @@
+"""Add shared_data_versions for caches of data shared by all users.
+
+Revision ID: 0007
+Revises: 0006
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "shared_data_versions",
+        sa.Column("name", sa.String(length=64), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("shared_data_versions")
@@ -1 +1,6 @@
 """App package initialiser."""
+from app.core.config import STARTUP_PROFILE
+from app.core.startup import startup_report
+
+if STARTUP_PROFILE:
+    startup_report.profile_imports()
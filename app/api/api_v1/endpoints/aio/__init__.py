@@ -0,0 +1 @@
+"""Async (AsyncSession) variants of the core endpoints, mounted when ASYNC_DATABASE is set."""
@@ -0,0 +1,41 @@
+"""Async authentication endpoints: register, login.
+
+``/me`` comes from the shared auth router; its cached dependency needs no session on a hit.
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import config, security
+from app.core.hashing import password_hasher
+from app.db.async_session import get_async_db
+from app.repositories.aio.user_repo import AsyncUserRepository
+from app.schemas.user import Token, UserCreate, UserRead
+
+router = APIRouter()
+
+
+@router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+async def register(user_in: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """Register a new user. Returns created user (without password)."""
+    users = AsyncUserRepository(db)
+    if await users.get_by_email(user_in.email):
+        raise HTTPException(status_code=400, detail="Email already registered")
+    hashed = await password_hasher.hash(user_in.password)
+    return await users.create(email=user_in.email, hashed_password=hashed, username=user_in.username)
+
+
+@router.post("/login", response_model=Token)
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    """Obtain JWT token using email (username field) and password."""
+    users = AsyncUserRepository(db)
+    user = await users.get_by_email(form_data.username)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    valid, new_hash = await password_hasher.verify_and_update(form_data.password, user.hashed_password)
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        user = await users.update_password(user, new_hash)
+    token = security.create_access_token(subject=str(user.id), expires_delta=config.get_access_token_expires())
+    return Token(access_token=token)
@@ -0,0 +1,25 @@
+"""Async endpoints for managing goals."""
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import decode_cursor, encode_cursor, page_size
+from app.db.async_session import get_async_db
+from app.repositories.aio.goal_repo import AsyncGoalRepository
+from app.schemas.common import Page
+from app.schemas.goal import GoalCreate, GoalRead
+
+router = APIRouter()
+
+
+@router.post("/", response_model=GoalRead, status_code=status.HTTP_201_CREATED)
+async def create_goal(payload: GoalCreate, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncGoalRepository(db).create(user_id=payload.user_id, title=payload.title, kind=payload.kind, target=payload.target, start_date=payload.start_date, end_date=payload.end_date, exercise_id=payload.exercise_id)
+
+
+@router.get("/user/{user_id}", response_model=Page[GoalRead])
+async def list_goals(user_id: int, limit: int | None = None, cursor: str | None = None, db: AsyncSession = Depends(get_async_db)):
+    size = page_size(limit)
+    after_id = decode_cursor(cursor, int)[0] if cursor else None
+    goals = await AsyncGoalRepository(db).list_for_user(user_id, limit=size + 1, after_id=after_id)
+    next_cursor = encode_cursor(goals[size - 1].id) if len(goals) > size else None
+    return {"items": goals[:size], "next_cursor": next_cursor}
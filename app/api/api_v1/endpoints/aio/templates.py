@@ -0,0 +1,39 @@
+"""Async endpoints for managing templates."""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_session import get_async_db
+from app.repositories.aio.template_repo import AsyncTemplateRepository
+from app.repositories.aio.workout_repo import AsyncWorkoutRepository
+from app.repositories.template_repo import planned_sets
+from app.schemas.template import TemplateCreate, TemplateRead, TemplateExerciseCreate, TemplateStart
+from app.schemas.workout import WorkoutRead
+
+router = APIRouter()
+
+
+@router.post("/", response_model=TemplateRead, status_code=status.HTTP_201_CREATED)
+async def create_template(payload: TemplateCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a template and all of its exercises in one transaction."""
+    return await AsyncTemplateRepository(db).create(user_id=payload.user_id, name=payload.name, description=payload.description, exercises=[ex.model_dump() for ex in payload.exercises or []])
+
+
+@router.post("/{template_id}/start", response_model=WorkoutRead, status_code=status.HTTP_201_CREATED)
+async def start_workout(template_id: int, payload: TemplateStart, db: AsyncSession = Depends(get_async_db)):
+    """Start a workout from a template: one set per planned set (sets x reps) of each exercise, weights left empty."""
+    template = await AsyncTemplateRepository(db).get_with_exercises(template_id)
+    if not template or template.user_id not in (None, payload.user_id):
+        raise HTTPException(status_code=404, detail="Template not found")
+    sets = planned_sets(template)
+    workout, ids = await AsyncWorkoutRepository(db).create_with_sets(user_id=payload.user_id, name=payload.name or template.name, date=payload.date, notes=payload.notes, sets=sets, template_id=template.id)
+    return {"id": workout.id, "user_id": workout.user_id, "date": workout.date, "sets": [{"id": set_id, **s} for set_id, s in zip(ids, sets)]}
+
+
+@router.post("/{template_id}/exercises", status_code=status.HTTP_201_CREATED)
+async def add_exercise(template_id: int, payload: TemplateExerciseCreate, db: AsyncSession = Depends(get_async_db)):
+    repo = AsyncTemplateRepository(db)
+    template = await repo.get(template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Template not found")
+    te = await repo.add_exercise(template, exercise_id=payload.exercise_id, order=payload.order, sets=payload.sets, reps=payload.reps)
+    return {"id": te.id}
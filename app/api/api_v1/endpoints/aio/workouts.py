@@ -0,0 +1,70 @@
+"""Async workouts endpoints: create workout, add sets, get workout, delete workout."""
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.conditional import data_etag, matches, not_modified, tag
+from app.db.async_session import get_async_db
+from app.repositories.aio.version_repo import AsyncDataVersionRepository
+from app.repositories.aio.workout_repo import AsyncWorkoutRepository
+from app.schemas.workout import SetCreate, WorkoutWithSetsCreate, SetBatchCreated, WorkoutWithSetsCreated, WorkoutRead
+
+router = APIRouter()
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+async def create_workout(payload: dict, db: AsyncSession = Depends(get_async_db)):
+    user_id = payload.get("user_id")
+    if not user_id:
+        raise HTTPException(status_code=400, detail="user_id is required")
+    workout = await AsyncWorkoutRepository(db).create(user_id=user_id, name=payload.get("name"), notes=payload.get("notes"))
+    return {"id": workout.id}
+
+
+@router.post("/with-sets", response_model=WorkoutWithSetsCreated, status_code=status.HTTP_201_CREATED)
+async def create_workout_with_sets(payload: WorkoutWithSetsCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a workout and all of its sets in one transaction."""
+    workout, set_ids = await AsyncWorkoutRepository(db).create_with_sets(user_id=payload.user_id, name=payload.name, date=payload.date, notes=payload.notes, sets=[s.model_dump() for s in payload.sets])
+    return {"id": workout.id, "set_ids": set_ids}
+
+
+@router.post("/{workout_id}/sets/batch", response_model=SetBatchCreated, status_code=status.HTTP_201_CREATED)
+async def add_sets(workout_id: int, payload: list[SetCreate], db: AsyncSession = Depends(get_async_db)):
+    """Add many sets to a workout with a single insert and commit."""
+    repo = AsyncWorkoutRepository(db)
+    workout = await repo.get(workout_id)
+    if not workout:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    return {"ids": await repo.add_sets(workout, [s.model_dump() for s in payload])}
+
+
+@router.post("/{workout_id}/sets", status_code=status.HTTP_201_CREATED)
+async def add_set(workout_id: int, payload: dict, db: AsyncSession = Depends(get_async_db)):
+    repo = AsyncWorkoutRepository(db)
+    workout = await repo.get(workout_id)
+    if not workout:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    wset = await repo.add_set(workout, exercise_id=payload.get("exercise_id"), reps=payload.get("reps"), weight=payload.get("weight"), rest_seconds=payload.get("rest_seconds"), order=payload.get("order"))
+    return {"id": wset.id}
+
+
+@router.get("/{workout_id}", response_model=WorkoutRead)
+async def get_workout(workout_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    owner = await AsyncDataVersionRepository(db).for_workout(workout_id)
+    if owner is not None:
+        etag = data_etag(owner[1])
+        if matches(request, etag):
+            return not_modified(etag)
+        tag(response, etag)
+    workout = await AsyncWorkoutRepository(db).get(workout_id, with_sets=True)
+    if not workout:
+        raise HTTPException(status_code=404, detail="Not found")
+    return workout
+
+
+@router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_workout(workout_id: int, db: AsyncSession = Depends(get_async_db)):
+    repo = AsyncWorkoutRepository(db)
+    workout = await repo.get(workout_id)
+    if not workout:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    await repo.delete(workout)
@@ -1,41 +1,161 @@
 """Simple analytics endpoints for progress and summaries."""
-from fastapi import APIRouter, Depends
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 
-from app.db.session import get_db
-from app.models.workout import Workout, WorkoutSet
+from app.api.conditional import data_etag, matches, not_modified, tag
+from app.core.responses import dumps
+from app.core.result_cache import analytics_cache
+from app.db.session import get_read_db
+from app.repositories.analytics_repo import AnalyticsRepository
+from app.repositories.rollup_repo import RollupRepository
+from app.repositories.version_repo import DataVersionRepository
+from app.schemas.analytics import Bucket, E1RMProgressionRead, Metric, MonthlySessionsRead, SeriesPoint, SeriesRead, TrainingLoadRead, WeeklyChangesRead, WeeklyVolumeRead
 
 router = APIRouter()
 
 
-@router.get("/weekly-volume/{user_id}")
-def weekly_volume(user_id: int, db: Session = Depends(get_db)):
-    """Return total volume (weight * reps) per day for the last 7 days."""
-    now = datetime.utcnow()
-    start = now - timedelta(days=7)
-    workouts = db.query(Workout).filter(Workout.user_id == user_id, Workout.date >= start).all()
-    per_day = {}
-    for w in workouts:
-        day = w.date.date().isoformat()
-        total = 0
-        for s in w.sets:
-            if s.weight and s.reps:
-                total += s.weight * (s.reps or 0)
-        per_day.setdefault(day, 0)
-        per_day[day] += total
-    return {"weekly_volume": per_day}
-
-
-@router.get("/monthly-sessions/{user_id}")
-def monthly_sessions(user_id: int, db: Session = Depends(get_db)):
-    """Return count of workout sessions per month for the last 6 months."""
-    now = datetime.utcnow()
-    start = now - timedelta(days=180)
-    workouts = db.query(Workout).filter(Workout.user_id == user_id, Workout.date >= start).all()
-    per_month = {}
-    for w in workouts:
-        key = f"{w.date.year}-{w.date.month:02d}"
-        per_month.setdefault(key, 0)
-        per_month[key] += 1
-    return {"monthly_sessions": per_month}
+def _cached(endpoint: str, user_id: int, params: dict, version: int, etag: str, compute) -> Response:
+    """Serve the body from the analytics cache, computing and storing it on a miss."""
+    body = analytics_cache.get_or_compute(endpoint, user_id, params, version, lambda: dumps(compute()))
+    response = Response(content=body, media_type="application/json")
+    tag(response, etag)
+    return response
+
+
+def _params_tag(params: dict) -> str:
+    """Short digest of the query parameters, for ETags of responses that depend on more than the version."""
+    return hashlib.blake2b(dumps(params), digest_size=8).hexdigest()
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    """``value`` as naive UTC, the way datetimes are stored; naive values are taken to be UTC already."""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _progression(db: Session):
+    # NumPy is imported with the first progression request instead of at worker boot.
+    from app.services.progression_service import ProgressionService
+
+    return ProgressionService(db)
+
+
+def _progression_window(start: date | None, end: date | None) -> tuple[date | None, date]:
+    """Days ``[start, end)``; ``end`` defaults to tomorrow so today is included."""
+    end = end or datetime.utcnow().date() + timedelta(days=1)
+    if start is not None and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    return start, end
+
+
+@router.get("/cache/stats")
+def analytics_cache_stats():
+    """Backend, size and hit ratio of the analytics result cache (hits and misses are per process)."""
+    return analytics_cache.stats()
+
+
+@router.get("/weekly-volume/{user_id}", response_model=WeeklyVolumeRead)
+def weekly_volume(user_id: int, request: Request, db: Session = Depends(get_read_db)):
+    """Return total volume (weight * reps) per day for the last 7 days, read from the daily rollup."""
+    today = datetime.utcnow().date()
+    version = DataVersionRepository(db).get(user_id)
+    etag = data_etag(version, today)
+    if matches(request, etag):
+        return not_modified(etag)
+    start = today - timedelta(days=7)
+    return _cached("weekly-volume", user_id, {"start": start}, version, etag, lambda: {"weekly_volume": RollupRepository(db).volume_by_day(user_id, start)})
+
+
+@router.get("/monthly-sessions/{user_id}", response_model=MonthlySessionsRead)
+def monthly_sessions(user_id: int, request: Request, db: Session = Depends(get_read_db)):
+    """Return count of workout sessions per month over the 180 days up to the end of today."""
+    today = datetime.utcnow().date()
+    version = DataVersionRepository(db).get(user_id)
+    etag = data_etag(version, today)
+    if matches(request, etag):
+        return not_modified(etag)
+    # Whole days, so the result only changes with the data or the date the ETag carries.
+    end = datetime.combine(today + timedelta(days=1), time.min)
+
+    def compute():
+        rows = AnalyticsRepository(db).series(user_id, start=end - timedelta(days=181), end=end, bucket="month", metric="sessions")
+        return {"monthly_sessions": {key: int(value) for key, value in rows}}
+
+    return _cached("monthly-sessions", user_id, {"end": end}, version, etag, compute)
+
+
+@router.get("/series/{user_id}", response_model=SeriesRead)
+def series(
+    user_id: int,
+    request: Request,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    bucket: Bucket = "day",
+    metric: Metric = "volume",
+    exercise_id: int | None = None,
+    muscle_group: str | None = None,
+    db: Session = Depends(get_read_db),
+):
+    """Return ``metric`` grouped into ``bucket`` periods over ``[start, end)`` (default: the last 30 days).
+
+    Only requests giving an explicit ``end`` are cached and tagged; the default window moves with the clock.
+    """
+    start, end = _naive_utc(start), _naive_utc(end)
+    bounded = end is not None
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=30)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    def compute():
+        rows = AnalyticsRepository(db).series(user_id, start=start, end=end, bucket=bucket, metric=metric, exercise_id=exercise_id, muscle_group=muscle_group)
+        return SeriesRead(user_id=user_id, metric=metric, bucket=bucket, start=start, end=end, points=[SeriesPoint(bucket=k, value=v) for k, v in rows])
+
+    if not bounded:
+        return compute()
+    params = {"start": start, "end": end, "bucket": bucket, "metric": metric, "exercise_id": exercise_id, "muscle_group": muscle_group}
+    version = DataVersionRepository(db).get(user_id)
+    etag = data_etag(version, _params_tag(params))
+    if matches(request, etag):
+        return not_modified(etag)
+    return _cached("series", user_id, params, version, etag, lambda: compute().model_dump(mode="json"))
+
+
+@router.get("/e1rm/{user_id}", response_model=E1RMProgressionRead)
+def e1rm_progression(user_id: int, request: Request, start: date | None = None, end: date | None = None, exercise_id: int | None = None, db: Session = Depends(get_read_db)):
+    """Estimated 1RM per exercise: the best set of each day over ``[start, end)`` (default: all history up to today) and its trend."""
+    start, end = _progression_window(start, end)
+    params = {"start": start, "end": end, "exercise_id": exercise_id}
+    version = DataVersionRepository(db).get(user_id)
+    etag = data_etag(version, _params_tag(params))
+    if matches(request, etag):
+        return not_modified(etag)
+    return _cached("e1rm", user_id, params, version, etag, lambda: _progression(db).e1rm(user_id, start=start, end=end, exercise_id=exercise_id))
+
+
+@router.get("/training-load/{user_id}", response_model=TrainingLoadRead)
+def training_load(user_id: int, request: Request, start: date | None = None, end: date | None = None, db: Session = Depends(get_read_db)):
+    """Daily volume with 7-day acute and 28-day chronic load and their ratio (ACWR) over ``[start, end)``."""
+    start, end = _progression_window(start, end)
+    params = {"start": start, "end": end}
+    version = DataVersionRepository(db).get(user_id)
+    etag = data_etag(version, _params_tag(params))
+    if matches(request, etag):
+        return not_modified(etag)
+    return _cached("training-load", user_id, params, version, etag, lambda: _progression(db).training_load(user_id, start=start, end=end))
+
+
+@router.get("/weekly-changes/{user_id}", response_model=WeeklyChangesRead)
+def weekly_changes(user_id: int, request: Request, start: date | None = None, end: date | None = None, db: Session = Depends(get_read_db)):
+    """Volume, sets, reps and sessions per week (Monday to Sunday) with week-over-week deltas."""
+    start, end = _progression_window(start, end)
+    params = {"start": start, "end": end}
+    version = DataVersionRepository(db).get(user_id)
+    etag = data_etag(version, _params_tag(params))
+    if matches(request, etag):
+        return not_modified(etag)
+    return _cached("weekly-changes", user_id, params, version, etag, lambda: _progression(db).weekly(user_id, start=start, end=end))
@@ -9,23 +9,25 @@ from app.schemas.user import UserCreate, UserRead, Token
 from app.services.auth_service import get_auth_service, AuthService
 from app.db.session import get_db
 from app.core import config, security
-from app.repositories.user_repo import UserRepository
+from app.core.cache import token_cache, user_cache
+from app.core.hashing import password_hasher
+from app.api.deps import get_current_user
 
 router = APIRouter()
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register(user_in: UserCreate, db: Session = Depends(get_db), svc: AuthService = Depends(get_auth_service)):
+async def register(user_in: UserCreate, db: Session = Depends(get_db), svc: AuthService = Depends(get_auth_service)):
     """Register a new user. Returns created user (without password)."""
-    user = svc.register(user_in=user_in)
+    user = await svc.register(user_in=user_in)
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """Obtain JWT token using email (username field) and password."""
     svc = AuthService(db)
-    user = svc.authenticate(email=form_data.username, password=form_data.password)
+    user = await svc.authenticate(email=form_data.username, password=form_data.password)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
@@ -33,31 +35,19 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     return token
 
 
-def _get_current_user(db: Session = Depends(get_db), token: str = Depends(security.create_access_token)):
-    # This function is intentionally simple; proper dependency below.
-    ...
-
+@router.get("/me", response_model=UserRead)
+async def me(current_user: UserRead = Depends(get_current_user)):
+    """Get current user profile from JWT token."""
+    return current_user
 
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-oauth2_scheme = HTTPBearer()
+@router.get("/hashing/stats")
+def hashing_stats():
+    """Queue depth, rejections and latency of the password hashing pool."""
+    return password_hasher.stats()
 
 
-@router.get("/me", response_model=UserRead)
-def me(credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    """Get current user profile from JWT token."""
-    token = credentials.credentials
-    try:
-        payload = security.decode_access_token(token)
-    except Exception:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
-
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-
-    repo = UserRepository(db)
-    user = repo.get_by_id(int(user_id))
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return user
+@router.get("/cache/stats")
+def auth_cache_stats():
+    """Size and hit ratio of the decoded-token and user caches behind get_current_user."""
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
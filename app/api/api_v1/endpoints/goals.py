@@ -4,7 +4,9 @@ from sqlalchemy.orm import Session
 
 from app.services.goal_service import GoalService
 from app.schemas.goal import GoalCreate, GoalRead
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
+from app.core.pagination import decode_cursor, encode_cursor, page_size
+from app.schemas.common import Page
 
 router = APIRouter()
 
@@ -12,11 +14,15 @@ router = APIRouter()
 @router.post("/", response_model=GoalRead, status_code=status.HTTP_201_CREATED)
 def create_goal(payload: GoalCreate, db: Session = Depends(get_db)):
     svc = GoalService(db)
-    g = svc.create_goal(user_id=payload.user_id, title=payload.title, kind=payload.kind, target=payload.target, start_date=payload.start_date, end_date=payload.end_date)
+    g = svc.create_goal(user_id=payload.user_id, title=payload.title, kind=payload.kind, target=payload.target, start_date=payload.start_date, end_date=payload.end_date, exercise_id=payload.exercise_id)
     return g
 
 
-@router.get("/user/{user_id}", response_model=list[GoalRead])
-def list_goals(user_id: int, db: Session = Depends(get_db)):
+@router.get("/user/{user_id}", response_model=Page[GoalRead])
+def list_goals(user_id: int, limit: int | None = None, cursor: str | None = None, db: Session = Depends(get_read_db)):
     svc = GoalService(db)
-    return svc.list_goals(user_id)
+    size = page_size(limit)
+    after_id = decode_cursor(cursor, int)[0] if cursor else None
+    goals = svc.list_goals(user_id, limit=size + 1, after_id=after_id)
+    next_cursor = encode_cursor(goals[size - 1].id) if len(goals) > size else None
+    return {"items": goals[:size], "next_cursor": next_cursor}
@@ -0,0 +1,29 @@
+"""Personal records endpoints: every lookup reads precomputed rows."""
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.db.session import get_read_db
+from app.repositories.record_repo import PersonalRecordRepository
+from app.schemas.record import PersonalRecordRead, RepRecordRead
+
+router = APIRouter()
+
+
+@router.get("/user/{user_id}", response_model=list[PersonalRecordRead])
+def list_records(user_id: int, db: Session = Depends(get_read_db)):
+    """The user's records for every exercise they have logged."""
+    return PersonalRecordRepository(db).list_for_user(user_id)
+
+
+@router.get("/user/{user_id}/exercise/{exercise_id}", response_model=PersonalRecordRead)
+def get_record(user_id: int, exercise_id: int, db: Session = Depends(get_read_db)):
+    record = PersonalRecordRepository(db).get(user_id, exercise_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="No records for this exercise")
+    return record
+
+
+@router.get("/user/{user_id}/exercise/{exercise_id}/reps", response_model=list[RepRecordRead])
+def rep_records(user_id: int, exercise_id: int, db: Session = Depends(get_read_db)):
+    """Most reps done at each weight, lightest first."""
+    return PersonalRecordRepository(db).rep_records(user_id, exercise_id)
@@ -3,21 +3,62 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.services.template_service import TemplateService
-from app.schemas.template import TemplateCreate, TemplateRead, TemplateExerciseCreate
-from app.db.session import get_db
+from app.schemas.template import TemplateCreate, TemplateDetailRead, TemplateRead, TemplateExerciseCreate, TemplateStart
+from app.schemas.workout import WorkoutRead
+from app.db.session import get_db, get_read_db
+from app.core.pagination import decode_cursor, encode_cursor, page_size
+from app.schemas.common import Page
 
 router = APIRouter()
 
 
 @router.post("/", response_model=TemplateRead, status_code=status.HTTP_201_CREATED)
 def create_template(payload: TemplateCreate, db: Session = Depends(get_db)):
+    """Create a template and all of its exercises in one transaction."""
     svc = TemplateService(db)
-    t = svc.create_template(user_id=payload.user_id, name=payload.name, description=payload.description)
-    # optionally add exercises
-    if payload.exercises:
-        for ex in payload.exercises:
-            svc.add_exercise(t.id, exercise_id=ex.exercise_id, order=ex.order, sets=ex.sets, reps=ex.reps)
-    return t
+    return svc.create_template(user_id=payload.user_id, name=payload.name, description=payload.description, exercises=[ex.model_dump() for ex in payload.exercises or []])
+
+
+@router.get("/user/{user_id}", response_model=Page[TemplateRead])
+def list_templates(user_id: int, limit: int | None = None, cursor: str | None = None, db: Session = Depends(get_read_db)):
+    svc = TemplateService(db)
+    size = page_size(limit)
+    after_id = decode_cursor(cursor, int)[0] if cursor else None
+    templates = svc.list_templates(user_id, limit=size + 1, after_id=after_id)
+    next_cursor = encode_cursor(templates[size - 1].id) if len(templates) > size else None
+    return {"items": templates[:size], "next_cursor": next_cursor}
+
+
+@router.get("/public", response_model=Page[TemplateDetailRead])
+def list_public_templates(limit: int | None = None, cursor: str | None = None, db: Session = Depends(get_read_db)):
+    """The public template library with exercises, served from memory."""
+    svc = TemplateService(db)
+    size = page_size(limit)
+    after_id = decode_cursor(cursor, int)[0] if cursor else None
+    templates = svc.list_public(limit=size + 1, after_id=after_id)
+    next_cursor = encode_cursor(templates[size - 1]["id"]) if len(templates) > size else None
+    return {"items": templates[:size], "next_cursor": next_cursor}
+
+
+@router.get("/{template_id}", response_model=TemplateDetailRead)
+def get_template(template_id: int, user_id: int | None = None, db: Session = Depends(get_read_db)):
+    """A public template or one of ``user_id``'s own, with its ordered exercises and their names; public templates are served from memory."""
+    svc = TemplateService(db)
+    try:
+        return svc.get_template(template_id, user_id=user_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Template not found")
+
+
+@router.post("/{template_id}/start", response_model=WorkoutRead, status_code=status.HTTP_201_CREATED)
+def start_workout(template_id: int, payload: TemplateStart, db: Session = Depends(get_db)):
+    """Start a workout from a template: one set per planned set (sets x reps) of each exercise, weights left empty."""
+    svc = TemplateService(db)
+    try:
+        workout, sets = svc.start_workout(template_id, user_id=payload.user_id, name=payload.name, date=payload.date, notes=payload.notes)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Template not found")
+    return {"id": workout.id, "user_id": workout.user_id, "date": workout.date, "sets": sets}
 
 
 @router.post("/{template_id}/exercises", status_code=status.HTTP_201_CREATED)
@@ -0,0 +1,24 @@
+"""User endpoints: full training history export."""
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.db.session import get_read_db, read_session_factory
+from app.repositories.user_repo import UserRepository
+from app.services.export_service import MEDIA_TYPES, stream_history
+
+router = APIRouter()
+
+
+@router.get("/{user_id}/export")
+def export_history(user_id: int, format: Literal["ndjson", "csv"] = "ndjson", db: Session = Depends(get_read_db)):
+    """Stream every set the user has logged, joined with its workout and exercise."""
+    if not UserRepository(db).get_by_id(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+    return StreamingResponse(
+        stream_history(read_session_factory(user_id), user_id, fmt=format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="user-{user_id}-history.{format}"'},
+    )
@@ -1,11 +1,20 @@
-"""Workouts endpoints: create workout, add set, get workout."""
-from fastapi import APIRouter, Depends, HTTPException, status
+"""Workouts endpoints: create workout, add sets, list/get workouts, delete workout."""
+import io
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
+from app.api.conditional import data_etag, matches, not_modified, tag
 from app.services.workout_service import WorkoutService
-from app.db.session import get_db
+from app.services.import_service import FORMATS, ImportService, iter_records
+from app.db.session import get_db, get_read_db
 from app.repositories.user_repo import UserRepository
+from app.repositories.version_repo import DataVersionRepository
 from app.schemas.user import UserRead
+from app.schemas.workout import SetCreate, WorkoutWithSetsCreate, SetBatchCreated, WorkoutWithSetsCreated, WorkoutRead, ImportReportRead
+from app.schemas.common import Page
+from app.core.pagination import decode_cursor, encode_cursor, page_size
 
 router = APIRouter()
 
@@ -20,6 +29,47 @@ def create_workout(payload: dict, db: Session = Depends(get_db)):
     return {"id": workout.id}
 
 
+@router.post("/with-sets", response_model=WorkoutWithSetsCreated, status_code=status.HTTP_201_CREATED)
+def create_workout_with_sets(payload: WorkoutWithSetsCreate, db: Session = Depends(get_db)):
+    """Create a workout and all of its sets in one transaction."""
+    svc = WorkoutService(db)
+    workout, set_ids = svc.create_workout_with_sets(user_id=payload.user_id, sets=[s.model_dump() for s in payload.sets], name=payload.name, date=payload.date, notes=payload.notes)
+    return {"id": workout.id, "set_ids": set_ids}
+
+
+@router.get("/user/{user_id}", response_model=Page[WorkoutRead])
+def list_workouts(user_id: int, limit: int | None = None, cursor: str | None = None, db: Session = Depends(get_read_db)):
+    """Newest-first page of a user's workouts with their sets."""
+    svc = WorkoutService(db)
+    size = page_size(limit)
+    after = decode_cursor(cursor, datetime, int) if cursor else None
+    workouts = svc.list_workouts(user_id, limit=size + 1, after=after)
+    next_cursor = encode_cursor(workouts[size - 1].date, workouts[size - 1].id) if len(workouts) > size else None
+    return {"items": workouts[:size], "next_cursor": next_cursor}
+
+
+@router.post("/import/{user_id}", response_model=ImportReportRead)
+def import_history(user_id: int, file: UploadFile, format: str | None = None, chunk_size: int = 1000, db: Session = Depends(get_db)):
+    """Stream-import a CSV or NDJSON workout log; the format defaults to the file extension."""
+    fmt = format or (file.filename or "").rsplit(".", 1)[-1].lower()
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(FORMATS)}")
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    report = ImportService(db, chunk_size=max(1, chunk_size)).import_records(user_id, iter_records(stream, fmt))
+    return report.as_dict()
+
+
+@router.post("/{workout_id}/sets/batch", response_model=SetBatchCreated, status_code=status.HTTP_201_CREATED)
+def add_sets(workout_id: int, payload: list[SetCreate], db: Session = Depends(get_db)):
+    """Add many sets to a workout with a single insert and commit."""
+    svc = WorkoutService(db)
+    try:
+        ids = svc.add_sets(workout_id=workout_id, sets=[s.model_dump() for s in payload])
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    return {"ids": ids}
+
+
 @router.post("/{workout_id}/sets", status_code=status.HTTP_201_CREATED)
 def add_set(workout_id: int, payload: dict, db: Session = Depends(get_db)):
     svc = WorkoutService(db)
@@ -30,15 +80,34 @@ def add_set(workout_id: int, payload: dict, db: Session = Depends(get_db)):
     return {"id": wset.id}
 
 
-@router.get("/{workout_id}")
-def get_workout(workout_id: int, db: Session = Depends(get_db)):
+@router.get("/{workout_id}", response_model=WorkoutRead)
+def get_workout(workout_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    owner = DataVersionRepository(db).for_workout(workout_id)
+    if owner is not None:
+        etag = data_etag(owner[1])
+        if matches(request, etag):
+            return not_modified(etag)
+        tag(response, etag)
     svc = WorkoutService(db)
-    workout = svc.repo.get(workout_id)
+    workout = svc.get_workout(workout_id, with_sets=True)
     if not workout:
         raise HTTPException(status_code=404, detail="Not found")
-    return {
-        "id": workout.id,
-        "user_id": workout.user_id,
-        "date": workout.date,
-        "sets": [{"id": s.id, "exercise_id": s.exercise_id, "reps": s.reps, "weight": s.weight} for s in workout.sets],
-    }
+    return workout
+
+
+@router.delete("/{workout_id}/sets/{set_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_set(workout_id: int, set_id: int, db: Session = Depends(get_db)):
+    svc = WorkoutService(db)
+    try:
+        svc.delete_set(workout_id, set_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Set not found")
+
+
+@router.delete("/{workout_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_workout(workout_id: int, db: Session = Depends(get_db)):
+    svc = WorkoutService(db)
+    try:
+        svc.delete_workout(workout_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Workout not found")
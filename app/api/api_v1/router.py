@@ -1,12 +1,34 @@
 """API router for v1 endpoints."""
 from fastapi import APIRouter
 
-from app.api.api_v1.endpoints import auth, workouts, templates, goals, analytics
+from app.api.api_v1.endpoints import auth, users, workouts, templates, goals, analytics, records
+from app.core import config
+
+
+def _overlay(primary: APIRouter, fallback: APIRouter) -> APIRouter:
+    """Routes of ``primary`` plus the ``fallback`` routes it does not redefine (same path and method)."""
+    taken = {(route.path, method) for route in primary.routes for method in route.methods}
+    merged = APIRouter()
+    merged.routes.extend(primary.routes)
+    merged.routes.extend(route for route in fallback.routes if not any((route.path, method) in taken for method in route.methods))
+    return merged
+
+
+auth_router, workouts_router, templates_router, goals_router = auth.router, workouts.router, templates.router, goals.router
+if config.ASYNC_DATABASE:
+    from app.api.api_v1.endpoints.aio import auth as aio_auth, workouts as aio_workouts, templates as aio_templates, goals as aio_goals
+
+    auth_router = _overlay(aio_auth.router, auth.router)
+    workouts_router = _overlay(aio_workouts.router, workouts.router)
+    templates_router = _overlay(aio_templates.router, templates.router)
+    goals_router = _overlay(aio_goals.router, goals.router)
 
 api_router = APIRouter()
 
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(workouts.router, prefix="/workouts", tags=["workouts"])
-api_router.include_router(templates.router, prefix="/templates", tags=["templates"])
-api_router.include_router(goals.router, prefix="/goals", tags=["goals"])
+api_router.include_router(auth_router, prefix="/auth", tags=["auth"])
+api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(workouts_router, prefix="/workouts", tags=["workouts"])
+api_router.include_router(templates_router, prefix="/templates", tags=["templates"])
+api_router.include_router(goals_router, prefix="/goals", tags=["goals"])
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(records.router, prefix="/records", tags=["records"])
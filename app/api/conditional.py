@@ -0,0 +1,35 @@
+"""Conditional GET support for read endpoints backed by per-user data versions.
+
+Every transaction that writes a user's data bumps their version (see
+``app.db.tracking``), so ``"v<version>"`` plus whatever else a response
+depends on (such as the current day for rolling windows) is a strong ETag.
+Endpoints read the version before anything else, answer a matching
+``If-None-Match`` with 304 straight away, and only run their queries
+otherwise.
+"""
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def data_etag(version: int, *parts) -> str:
+    return '"' + "-".join([f"v{version}", *map(str, parts)]) + '"'
+
+
+def matches(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` lists ``etag`` (weak comparison, as RFC 9110 specifies for this header)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def tag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -0,0 +1,57 @@
+"""Shared FastAPI dependencies."""
+import time
+
+from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core import security
+from app.core.cache import token_cache, user_cache
+from app.db.session import SessionLocal
+from app.repositories.user_repo import UserRepository
+from app.schemas.user import UserRead
+
+bearer_scheme = HTTPBearer()
+
+
+def _decode(token: str) -> dict:
+    payload = token_cache.get(token)
+    if payload is None:
+        try:
+            payload = security.decode_access_token(token)
+        except Exception:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+        exp = payload.get("exp")
+        if exp is not None:
+            token_cache.set(token, payload, ttl=exp - time.time())
+    return payload
+
+
+def _load_user(user_id: int) -> UserRead | None:
+    db = SessionLocal()
+    try:
+        user = UserRepository(db).get_by_id(user_id)
+        return UserRead.model_validate(user) if user else None
+    finally:
+        db.close()
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> UserRead:
+    """Resolve the bearer token to a user.
+
+    Cache hits cost neither a signature check nor a query, and never leave the
+    event loop; only a user-cache miss borrows a threadpool thread for the lookup.
+    """
+    payload = _decode(credentials.credentials)
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+
+    user_id = int(user_id)
+    user = user_cache.get(user_id)
+    if user is None:
+        user = await run_in_threadpool(_load_user, user_id)
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        user_cache.set(user_id, user)
+    return user
@@ -1,6 +1,7 @@
 """Configuration for the application."""
 from __future__ import annotations
 import os
+import tempfile
 from datetime import timedelta
 
 from dotenv import load_dotenv
@@ -15,5 +16,108 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
 # SQLite for development; change to PostgreSQL in production
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./dev.db")
 
+# An async driver in DATABASE_URL (sqlite+aiosqlite, postgresql+asyncpg) switches the
+# core endpoints to AsyncSession; scripts, migrations and the remaining endpoints keep
+# using a sync engine on the equivalent sync driver.
+_ASYNC_DRIVERS = {"sqlite+aiosqlite": "sqlite", "postgresql+asyncpg": "postgresql"}
+
+
+def _sync_url(url: str) -> str:
+    scheme, _, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS[scheme]}://{rest}" if scheme in _ASYNC_DRIVERS else url
+
+
+ASYNC_DATABASE = DATABASE_URL.partition("://")[0] in _ASYNC_DRIVERS
+SYNC_DATABASE_URL = _sync_url(DATABASE_URL)
+ASYNC_DATABASE_URL = DATABASE_URL if ASYNC_DATABASE else None
+
+# Optional read replica for analytics, listing and export endpoints. A user who wrote
+# within READ_YOUR_WRITES_SECONDS keeps reading from the primary.
+DATABASE_READ_URL = _sync_url(os.environ["DATABASE_READ_URL"]) if os.getenv("DATABASE_READ_URL") else None
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+RECENT_WRITERS_SIZE = int(os.getenv("RECENT_WRITERS_SIZE", "100000"))
+
+# Connection pool settings per engine; the DB_READ_* values default to the primary's
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "0").lower() in ("1", "true", "yes")
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", str(DB_POOL_SIZE)))
+DB_READ_MAX_OVERFLOW = int(os.getenv("DB_READ_MAX_OVERFLOW", str(DB_MAX_OVERFLOW)))
+DB_READ_POOL_PRE_PING = os.getenv("DB_READ_POOL_PRE_PING", str(DB_POOL_PRE_PING)).lower() in ("1", "true", "yes")
+DB_READ_POOL_RECYCLE = int(os.getenv("DB_READ_POOL_RECYCLE", str(DB_POOL_RECYCLE)))
+
+# SQLite production mode: WAL journal, tuned pragmas on every connection, reads from a
+# pool and all write transactions serialized through one writer connection.
+SQLITE_PRODUCTION = os.getenv("SQLITE_PRODUCTION", "0").lower() in ("1", "true", "yes")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Negative values are KiB, as in PRAGMA cache_size
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+# How long a write transaction waits in line for the writer connection
+SQLITE_WRITE_TIMEOUT_SECONDS = float(os.getenv("SQLITE_WRITE_TIMEOUT_SECONDS", "30"))
+
+# Prometheus text-format metrics served at /metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1").lower() in ("1", "true", "yes")
+
+# Opt-in SQL profiling middleware: Server-Timing headers and JSON logs on "app.sql".
+# A statement run more than SQL_N_PLUS_ONE_THRESHOLD times in one request is flagged.
+SQL_PROFILING = os.getenv("SQL_PROFILING", "0").lower() in ("1", "true", "yes")
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "100"))
+SQL_SLOW_REQUEST_DB_MS = float(os.getenv("SQL_SLOW_REQUEST_DB_MS", "500"))
+
+# Derived data (rollups, personal records, goal progress) is either updated inside each
+# write transaction ("inline") or queued in the outbox table and applied by a background
+# worker ("worker"), so writes return as soon as the primary rows commit. Only the API server
+# runs that worker, so it opts in with OUTBOX_MODE=worker; scripts, imports and benchmarks
+# keep the inline default and never leave derived data waiting on a worker that isn't there.
+OUTBOX_MODE = os.getenv("OUTBOX_MODE", "inline").lower()
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "200"))
+OUTBOX_POLL_INTERVAL_SECONDS = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "1.0"))
+# After being woken by a local commit, wait this long so a burst is drained as one batch
+OUTBOX_COALESCE_SECONDS = float(os.getenv("OUTBOX_COALESCE_SECONDS", "0.05"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+OUTBOX_RETRY_BACKOFF_SECONDS = float(os.getenv("OUTBOX_RETRY_BACKOFF_SECONDS", "2.0"))
+# Processed events are kept this long for inspection, then pruned by the worker
+OUTBOX_RETENTION_SECONDS = float(os.getenv("OUTBOX_RETENTION_SECONDS", "86400"))
+
+# Analytics result cache: "memory" (per process), "sqlite" (a file shared by every worker on
+# the host) or "none". Entries are stamped with the user's data version, so any write by the
+# user makes them stale everywhere; the byte budget is enforced with LRU eviction.
+ANALYTICS_CACHE_BACKEND = os.getenv("ANALYTICS_CACHE_BACKEND", "memory").lower()
+ANALYTICS_CACHE_MAX_BYTES = int(os.getenv("ANALYTICS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+ANALYTICS_CACHE_PATH = os.getenv("ANALYTICS_CACHE_PATH", os.path.join(tempfile.gettempdir(), "gym_analytics_cache.db"))
+# How long other workers wait for the one computing a missing entry before computing it themselves
+ANALYTICS_CACHE_LEASE_SECONDS = float(os.getenv("ANALYTICS_CACHE_LEASE_SECONDS", "5"))
+
+# Public templates are cached per process and stamped with the library's version. Local writes
+# drop the cache at once; other processes see the new version within this many seconds.
+TEMPLATE_LIBRARY_CHECK_SECONDS = float(os.getenv("TEMPLATE_LIBRARY_CHECK_SECONDS", "2"))
+
+# bcrypt cost factor; hashes with a different cost are upgraded on the next successful login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Password hashing runs on its own pool so login bursts cannot starve the request threadpool.
+# Requests beyond workers + queue size are rejected with 503 instead of queueing.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+
+# Authenticated-user dependency caches (decoded tokens and user rows)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+
+# Keyset pagination page sizes for listing endpoints
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "200"))
+
+# Startup schema handling: "auto" runs create_all only when the database is not managed by
+# Alembic (no alembic_version table), "create" always runs it and "migrations" never does.
+DB_SCHEMA_MODE = os.getenv("DB_SCHEMA_MODE", "auto").lower()
+# Log per-module import cost at startup (wraps module loaders, so only for diagnosis)
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "0").lower() in ("1", "true", "yes")
+
 def get_access_token_expires() -> timedelta:
     return timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
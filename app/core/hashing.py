@@ -0,0 +1,84 @@
+"""Bounded executor for bcrypt work.
+
+bcrypt releases the GIL, so a small dedicated thread pool gives real
+parallelism without borrowing threads from Starlette's request threadpool.
+Admission is limited to ``workers + queue_size`` outstanding jobs; anything
+beyond that fails fast with ``HashingBusy`` (served as 503) instead of
+piling up behind a login burst.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app.core import config, security
+from app.core.metrics import metrics
+
+
+class HashingBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def _run(self, fn, args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.observe("password_hash_seconds", (fn.__name__,), elapsed)
+            with self._lock:
+                self._completed += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._outstanding -= 1
+        self._slots.release()
+
+    def submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingBusy("Password hashing capacity exhausted")
+        with self._lock:
+            self._outstanding += 1
+        future = self._executor.submit(self._run, fn, args)
+        future.add_done_callback(self._release)
+        return future
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.wrap_future(self.submit(security.hash_password, password))
+
+    async def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        return await asyncio.wrap_future(self.submit(security.verify_and_update, password, hashed))
+
+    def stats(self) -> dict:
+        with self._lock:
+            outstanding, completed = self._outstanding, self._completed
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "in_flight": min(outstanding, self.workers),
+                "queue_depth": max(0, outstanding - self.workers),
+                "completed": completed,
+                "rejected": self._rejected,
+                "avg_latency_ms": round(self._total_seconds / completed * 1000, 2) if completed else 0.0,
+                "max_latency_ms": round(self._max_seconds * 1000, 2),
+            }
+
+
+password_hasher = PasswordHasher(config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_QUEUE_SIZE)
@@ -0,0 +1,187 @@
+"""In-process Prometheus metrics.
+
+Each thread records into its own shard (plain dicts reached through a
+``threading.local``), so the hot path takes no locks; shards are only summed
+when ``/metrics`` is scraped. Values are per worker process.
+"""
+import bisect
+import threading
+import time
+from typing import Callable
+
+from sqlalchemy.pool import QueuePool
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Shard:
+    __slots__ = ("values", "histograms")
+
+    def __init__(self):
+        self.values: dict = {}
+        self.histograms: dict = {}
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._meta: dict[str, tuple[str, str, tuple[str, ...], tuple[float, ...] | None]] = {}
+        self._callbacks: dict[str, Callable[[], dict[tuple, float]]] = {}
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:
+        self._meta[name] = ("counter", help, labels, None)
+
+    def gauge(self, name: str, help: str, labels: tuple[str, ...] = (), callback: Callable[[], dict[tuple, float]] | None = None) -> None:
+        """Declare a gauge; with ``callback`` its samples are read at scrape time instead of recorded."""
+        self._meta[name] = ("gauge", help, labels, None)
+        if callback is not None:
+            self._callbacks[name] = callback
+
+    def histogram(self, name: str, help: str, labels: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._meta[name] = ("histogram", help, labels, buckets)
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1) -> None:
+        values = self._shard().values
+        key = (name, labels)
+        values[key] = values.get(key, 0) + value
+
+    def observe(self, name: str, labels: tuple, value: float) -> None:
+        histograms = self._shard().histograms
+        key = (name, labels)
+        buckets = self._meta[name][3]
+        h = histograms.get(key)
+        if h is None:
+            # per-bucket counts, the +Inf overflow, then sum and count
+            h = histograms[key] = [0] * (len(buckets) + 3)
+        h[bisect.bisect_left(buckets, value)] += 1
+        h[-2] += value
+        h[-1] += 1
+
+    def _merged(self) -> tuple[dict, dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        values: dict = {}
+        histograms: dict = {}
+        for shard in shards:
+            for key, v in shard.values.copy().items():
+                values[key] = values.get(key, 0) + v
+            for key, h in shard.histograms.copy().items():
+                merged = histograms.setdefault(key, [0] * len(h))
+                for i, v in enumerate(list(h)):
+                    merged[i] += v
+        return values, histograms
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        values, histograms = self._merged()
+        lines = []
+        for name, (kind, help, label_names, buckets) in self._meta.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "histogram":
+                for (metric, labels), h in sorted(histograms.items()):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip((*buckets, float("inf")), h):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_labels(label_names + ('le',), labels + (_number(bound),))} {cumulative}")
+                    lines.append(f"{name}_sum{_labels(label_names, labels)} {_number(h[-2])}")
+                    lines.append(f"{name}_count{_labels(label_names, labels)} {h[-1]}")
+                continue
+            samples = self._callbacks[name]() if name in self._callbacks else {labels: v for (metric, labels), v in values.items() if metric == name}
+            for labels, v in sorted(samples.items()):
+                lines.append(f"{name}{_labels(label_names, labels)} {_number(v)}")
+        return "\n".join(lines) + "\n"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+metrics = MetricsRegistry()
+metrics.counter("http_requests_total", "HTTP requests by route, method and status.", ("method", "route", "status"))
+metrics.histogram("http_request_duration_seconds", "HTTP request latency by route and method.", ("method", "route"))
+metrics.gauge("http_requests_in_flight", "HTTP requests currently being served.")
+metrics.histogram("db_pool_checkout_wait_seconds", "Time spent waiting for a pooled DB connection.", ("engine",), buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0))
+metrics.histogram("password_hash_seconds", "Time spent in a bcrypt hash or verify.", ("operation",), buckets=(0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0))
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited, labelled by ``metrics_name``."""
+
+    metrics_name = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.observe("db_pool_checkout_wait_seconds", (self.metrics_name,), time.perf_counter() - started)
+
+
+def instrumented_pool(name: str) -> type[QueuePool]:
+    return type(f"InstrumentedQueuePool_{name}", (InstrumentedQueuePool,), {"metrics_name": name})
+
+
+def route_template(scope) -> str:
+    """The matched route's path with parameters put back as ``{name}``, keeping label cardinality bounded."""
+    if scope.get("route") is None:
+        return "unmatched"
+    params = list((scope.get("path_params") or {}).items())
+    segments = scope["path"].split("/")
+    for i, segment in enumerate(segments):
+        if params and segment == str(params[0][1]):
+            segments[i] = "{" + params.pop(0)[0] + "}"
+    return "/".join(segments)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts, latency and in-flight requests."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.inc("http_requests_in_flight")
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.inc("http_requests_in_flight", value=-1)
+            route = route_template(scope)
+            metrics.inc("http_requests_total", (scope["method"], route, str(status)))
+            metrics.observe("http_request_duration_seconds", (scope["method"], route), time.perf_counter() - started)
@@ -0,0 +1,34 @@
+"""Keyset pagination helpers: opaque cursors and page-size limits.
+
+A cursor encodes the sort key of the last row on a page; the next page
+starts strictly after it, so deep pages cost the same as the first one.
+"""
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+
+from app.core import config
+
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """Decode a cursor into values of the given types; raises a 400 on anything malformed."""
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("cursor shape")
+        return tuple(datetime.fromisoformat(v) if t is datetime else t(v) for t, v in zip(types, raw))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def page_size(limit: int | None) -> int:
+    if limit is None:
+        return config.PAGE_SIZE_DEFAULT
+    return max(1, min(limit, config.PAGE_SIZE_MAX))
@@ -0,0 +1,112 @@
+"""Opt-in per-request SQL profiling: query counts, DB time, N+1 and slow-query logging.
+
+Cursor events on every ``Engine`` record into the profile of the request
+being served (tracked in a context variable, so it follows sync endpoints
+into the threadpool). The middleware reports each request as a
+``Server-Timing`` header and one JSON log line on ``app.sql``.
+"""
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import SQL_N_PLUS_ONE_THRESHOLD, SQL_SLOW_QUERY_MS, SQL_SLOW_REQUEST_DB_MS
+
+logger = logging.getLogger("app.sql")
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)|\(\s*%\(\w+\)s(?:\s*,\s*%\(\w+\)s)+\s*\)")
+
+
+def statement_template(statement: str) -> str:
+    """Collapse expanded IN lists so batched loads of different sizes share one template."""
+    return _IN_LIST.sub("(?...)", " ".join(statement.split()))
+
+
+@dataclass
+class RequestProfile:
+    queries: int = 0
+    db_seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.queries += 1
+        self.db_seconds += elapsed
+        self.statements[statement_template(statement)] += 1
+
+    def repeated(self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """Statement templates run more than ``threshold`` times, the likely N+1 loops."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n > threshold]
+
+
+current_profile: ContextVar[RequestProfile | None] = ContextVar("current_profile", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    profile = current_profile.get()
+    if profile is not None:
+        profile.record(statement, elapsed)
+    if elapsed * 1000 >= SQL_SLOW_QUERY_MS:
+        logger.warning(json.dumps({"event": "slow_query", "ms": round(elapsed * 1000, 2), "executemany": executemany, "statement": statement_template(statement)[:1000]}))
+
+
+def install_sql_hooks() -> None:
+    """Register the cursor listeners on all engines; safe to call more than once."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SQLProfilingMiddleware:
+    """ASGI middleware attaching a fresh ``RequestProfile`` to each HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+        install_sql_hooks()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                timing = f'db;dur={profile.db_seconds * 1000:.2f};desc="{profile.queries} queries", app;dur={total_ms:.2f}'
+                message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_profile.reset(token)
+            self._log(scope, profile, time.perf_counter() - started)
+
+    @staticmethod
+    def _log(scope, profile: RequestProfile, elapsed: float) -> None:
+        repeated = profile.repeated()
+        entry = {
+            "event": "request_sql",
+            "method": scope["method"],
+            "path": scope["path"],
+            "queries": profile.queries,
+            "db_ms": round(profile.db_seconds * 1000, 2),
+            "total_ms": round(elapsed * 1000, 2),
+        }
+        if repeated:
+            entry["n_plus_one"] = [{"count": n, "statement": sql[:300]} for sql, n in repeated]
+        slow = profile.db_seconds * 1000 >= SQL_SLOW_REQUEST_DB_MS
+        logger.log(logging.WARNING if repeated or slow else logging.INFO, json.dumps(entry))
@@ -0,0 +1,18 @@
+"""Application-wide JSON response class backed by orjson."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """Serialize with orjson, which handles datetimes, UUIDs and dataclasses natively."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,271 @@
+"""Result cache for analytics responses.
+
+Entries are serialized response bodies keyed by (endpoint, user_id, params)
+and stamped with the user's data version when they were computed. A lookup
+passes the current version and anything stamped with another one is a miss,
+so a write by the user invalidates their entries in every worker process,
+and nobody else's. Two backends are available:
+
+- ``MemoryBackend``: a per-process LRU bounded by total bytes. It also drops a
+  user's entries as soon as a local commit touches them.
+- ``SQLiteBackend``: a SQLite file shared by all workers on the host, with
+  approximate LRU eviction under the same byte budget.
+
+Concurrent misses for one key are computed once. Threads of a process queue
+behind a per-key lock, and processes sharing a backend take a short lease
+while the others poll for the result.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable
+
+import orjson
+
+from app.core.config import ANALYTICS_CACHE_BACKEND, ANALYTICS_CACHE_LEASE_SECONDS, ANALYTICS_CACHE_MAX_BYTES, ANALYTICS_CACHE_PATH
+from app.core.metrics import metrics
+from app.db import tracking
+
+# Fixed per-entry overhead counted against the byte budget besides the value itself
+ENTRY_OVERHEAD = 200
+LEASE_POLL_SECONDS = 0.02
+
+
+class MemoryBackend:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._data: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+        self._by_user: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[int, bytes] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+            return entry[1], entry[2]
+
+    def set(self, key: str, user_id: int, version: int, value: bytes) -> None:
+        size = len(key) + len(value) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (user_id, version, value)
+            self._by_user.setdefault(user_id, set()).add(key)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._data)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        self.bytes -= len(key) + len(entry[2]) + ENTRY_OVERHEAD
+        keys = self._by_user.get(entry[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[entry[0]]
+
+    def on_write(self, user_ids) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                for key in list(self._by_user.get(user_id, ())):
+                    self._remove(key)
+
+    def acquire_lease(self, key: str, seconds: float) -> bool:
+        return True
+
+    def release_lease(self, key: str) -> None:
+        pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"backend": "memory", "entries": len(self._data), "bytes": self.bytes, "max_bytes": self.max_bytes}
+
+
+class SQLiteBackend:
+    """Cache entries in a SQLite file; each thread keeps its own autocommit connection."""
+
+    # Access times are only rewritten when older than this, to keep hits read-only
+    TOUCH_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._written = 0
+        conn = self._conn()
+        conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, user_id INTEGER NOT NULL, version INTEGER NOT NULL, value BLOB NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_used ON entries (used)")
+        conn.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, expires REAL NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: str) -> tuple[int, bytes] | None:
+        conn = self._conn()
+        row = conn.execute("SELECT version, value, used FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[2] > self.TOUCH_INTERVAL_SECONDS:
+            conn.execute("UPDATE entries SET used = ? WHERE key = ?", (now, key))
+        return row[0], row[1]
+
+    def set(self, key: str, user_id: int, version: int, value: bytes) -> None:
+        size = len(key) + len(value) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        self._conn().execute("INSERT OR REPLACE INTO entries (key, user_id, version, value, size, used) VALUES (?, ?, ?, ?, ?, ?)", (key, user_id, version, value, size, time.time()))
+        self._written += size
+        # Summing sizes costs a scan, so the budget is checked after every ~1/16th of it is written.
+        if self._written > self.max_bytes // 16:
+            self._written = 0
+            self.trim()
+
+    def trim(self) -> None:
+        conn = self._conn()
+        total = conn.execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY used"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def on_write(self, user_ids) -> None:
+        # Stale rows are unreachable through their version stamp; eviction reclaims them.
+        pass
+
+    def acquire_lease(self, key: str, seconds: float) -> bool:
+        conn = self._conn()
+        now = time.time()
+        conn.execute("DELETE FROM leases WHERE key = ? AND expires < ?", (key, now))
+        return conn.execute("INSERT OR IGNORE INTO leases (key, expires) VALUES (?, ?)", (key, now + seconds)).rowcount == 1
+
+    def release_lease(self, key: str) -> None:
+        self._conn().execute("DELETE FROM leases WHERE key = ?", (key,))
+
+    def stats(self) -> dict:
+        entries, size = self._conn().execute("SELECT count(*), coalesce(sum(size), 0) FROM entries").fetchone()
+        return {"backend": "sqlite", "path": self.path, "entries": entries, "bytes": size, "max_bytes": self.max_bytes}
+
+
+class ResultCache:
+    def __init__(self, backend: MemoryBackend | SQLiteBackend | None, lease_seconds: float = ANALYTICS_CACHE_LEASE_SECONDS):
+        self.backend = backend
+        self.lease_seconds = lease_seconds
+        self._flights: dict[str, list] = {}
+        self._flights_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(endpoint: str, user_id: int, params: dict) -> str:
+        return f"{endpoint}:{user_id}:{orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()}"
+
+    def _lookup(self, key: str, version: int) -> bytes | None:
+        entry = self.backend.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        return None
+
+    @contextmanager
+    def _single_flight(self, key: str):
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = [threading.Lock(), 0]
+            flight[1] += 1
+        try:
+            with flight[0]:
+                yield
+        finally:
+            with self._flights_lock:
+                flight[1] -= 1
+                if not flight[1]:
+                    del self._flights[key]
+
+    def _wait_for_other_process(self, key: str, version: int) -> bytes | None:
+        deadline = time.monotonic() + self.lease_seconds
+        while time.monotonic() < deadline:
+            time.sleep(LEASE_POLL_SECONDS)
+            value = self._lookup(key, version)
+            if value is not None:
+                return value
+        return None
+
+    def _record(self, endpoint: str, outcome: str) -> None:
+        if outcome == "miss":
+            self.misses += 1
+        else:
+            self.hits += 1
+        metrics.inc("analytics_cache_requests_total", (endpoint, outcome))
+
+    def get_or_compute(self, endpoint: str, user_id: int, params: dict, version: int, compute: Callable[[], bytes]) -> bytes:
+        """The cached body for ``version``, or ``compute()`` stored under it; concurrent misses compute once."""
+        if self.backend is None:
+            return compute()
+        key = self.key(endpoint, user_id, params)
+        value = self._lookup(key, version)
+        if value is not None:
+            self._record(endpoint, "hit")
+            return value
+        with self._single_flight(key):
+            value = self._lookup(key, version)
+            if value is not None:
+                self._record(endpoint, "coalesced")
+                return value
+            leased = self.backend.acquire_lease(key, self.lease_seconds)
+            if not leased:
+                value = self._wait_for_other_process(key, version)
+                if value is not None:
+                    self._record(endpoint, "coalesced")
+                    return value
+            try:
+                value = compute()
+                self.backend.set(key, user_id, version, value)
+            finally:
+                if leased:
+                    self.backend.release_lease(key)
+            self._record(endpoint, "miss")
+            return value
+
+    def on_write(self, user_ids) -> None:
+        if self.backend is not None:
+            self.backend.on_write(user_ids)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        stats = self.backend.stats() if self.backend is not None else {"backend": "none"}
+        return {**stats, "hits": self.hits, "misses": self.misses, "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0}
+
+
+def _backend():
+    if ANALYTICS_CACHE_BACKEND == "sqlite":
+        return SQLiteBackend(ANALYTICS_CACHE_PATH, ANALYTICS_CACHE_MAX_BYTES)
+    if ANALYTICS_CACHE_BACKEND == "memory":
+        return MemoryBackend(ANALYTICS_CACHE_MAX_BYTES)
+    return None
+
+
+analytics_cache = ResultCache(_backend())
+tracking.commit_listeners.append(analytics_cache.on_write)
+metrics.counter("analytics_cache_requests_total", "Analytics cache lookups by endpoint and outcome (hit, coalesced, miss).", ("endpoint", "outcome"))
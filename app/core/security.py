@@ -1,24 +1,44 @@
-"""Security helpers: password hashing and JWT handling."""
+"""Security helpers: password hashing and JWT handling.
+
+passlib/bcrypt and python-jose are imported on first use rather than with
+this module, which keeps them off the worker boot path.
+"""
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
-from passlib.context import CryptContext
-from jose import JWTError, jwt
-
 from app.core import config
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=None)
+def pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=config.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=config.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=config.BCRYPT_ROUNDS,
+    )
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return pwd_context().verify(plain_password, hashed_password)
+
+
+def verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password; also return a new hash when the stored one uses an outdated cost."""
+    return pwd_context().verify_and_update(plain_password, hashed_password)
 
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
+
     if expires_delta is None:
         expires_delta = config.get_access_token_expires()
 
@@ -29,8 +49,6 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
 
 
 def decode_access_token(token: str) -> dict:
-    try:
-        payload = jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
-        return payload
-    except JWTError as exc:
-        raise
+    from jose import jwt
+
+    return jwt.decode(token, config.SECRET_KEY, algorithms=[config.ALGORITHM])
@@ -0,0 +1,131 @@
+"""Startup cost accounting.
+
+``startup_report`` is started when the ``app`` package is first imported and
+times each phase of a worker boot: importing the application, building it,
+and every startup step (schema check, catalog load, ...). When the app is
+ready it logs one summary line on ``app.startup``.
+
+With ``STARTUP_PROFILE`` set, an import hook also times every module loaded
+from then on, and the summary adds the most expensive modules (cumulative
+and self time) and the self time per top-level package, much like
+``python -X importtime`` but without restarting the interpreter.
+"""
+import importlib.abc
+import logging
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+logger = logging.getLogger("app.startup")
+
+
+class _TimedLoader:
+    def __init__(self, loader, profiler: "ImportProfiler"):
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        # Put the real loader back first so the module only ever sees that one.
+        module.__loader__ = module.__spec__.loader = self.loader
+        with self.profiler.timing(module.__name__):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Meta path hook recording (self, cumulative) seconds per imported module."""
+
+    def __init__(self):
+        self.modules: dict[str, tuple[float, float]] = {}
+        self._stack: list[list] = []
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    @contextmanager
+    def timing(self, name: str):
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            total = time.perf_counter() - frame[0]
+            self.modules[name] = (total - frame[1], total)
+            if self._stack:
+                self._stack[-1][1] += total
+
+    def top(self, limit: int) -> list[tuple[str, float, float]]:
+        return sorted(((name, *cost) for name, cost in self.modules.items()), key=lambda row: row[2], reverse=True)[:limit]
+
+    def by_package(self) -> dict[str, float]:
+        packages: dict[str, float] = defaultdict(float)
+        for name, (own, _) in self.modules.items():
+            packages[name.partition(".")[0]] += own
+        return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
+
+
+class StartupReport:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.ready_after: float | None = None
+        self.profiler: ImportProfiler | None = None
+        self._mark = self.started
+
+    def profile_imports(self) -> None:
+        self.profiler = ImportProfiler()
+        self.profiler.install()
+
+    def lap(self, name: str) -> None:
+        """Record the time since the previous lap (or since the report started) as phase ``name``."""
+        now = time.perf_counter()
+        self.phases[name] = now - self._mark
+        self._mark = now
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._mark = time.perf_counter()
+            self.phases[name] = self._mark - start
+
+    def ready(self) -> None:
+        """Close the report once the app can serve traffic and log it."""
+        if self.ready_after is not None:
+            return
+        self.ready_after = time.perf_counter() - self.started
+        if self.profiler is not None:
+            self.profiler.uninstall()
+        logger.info("ready in %.3fs (%s)", self.ready_after, ", ".join(f"{name} {seconds:.3f}s" for name, seconds in self.phases.items()))
+        if self.profiler is not None:
+            for name, own, total in self.profiler.top(25):
+                logger.info("import %-50s self %7.1fms cumulative %7.1fms", name, own * 1000, total * 1000)
+            logger.info("import self time by package: %s", ", ".join(f"{name} {own * 1000:.1f}ms" for name, own in list(self.profiler.by_package().items())[:15]))
+
+
+startup_report = StartupReport()
@@ -0,0 +1,17 @@
+"""Async engine/session setup, used when DATABASE_URL names an async driver."""
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import ASYNC_DATABASE_URL, SQLITE_PRODUCTION
+from app.db.session import IS_SQLITE, apply_sqlite_pragmas
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL)
+if IS_SQLITE and SQLITE_PRODUCTION:
+    apply_sqlite_pragmas(async_engine.sync_engine)
+
+# Objects must stay readable after commit without an implicit (sync) refresh.
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,16 +1,127 @@
 """Database session/engine setup."""
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from app.core.config import DATABASE_URL
+from app.core.config import (
+    DATABASE_READ_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_READ_MAX_OVERFLOW,
+    DB_READ_POOL_PRE_PING,
+    DB_READ_POOL_RECYCLE,
+    DB_READ_POOL_SIZE,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE,
+    SQLITE_MMAP_SIZE,
+    SQLITE_PRODUCTION,
+    SQLITE_READ_POOL_SIZE,
+    SQLITE_SYNCHRONOUS,
+    SQLITE_WRITE_TIMEOUT_SECONDS,
+    SYNC_DATABASE_URL,
+)
+from app.core.metrics import instrumented_pool, metrics
+from app.db.tracking import wrote_recently
+
+IS_SQLITE = SYNC_DATABASE_URL.startswith("sqlite")
 
 connect_args = {}
-if DATABASE_URL.startswith("sqlite"):
+if IS_SQLITE:
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def apply_sqlite_pragmas(engine: Engine) -> None:
+    """Enable WAL and the tuned pragmas on every new connection of ``engine``."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+        cursor.close()
+
+
+def _begin_immediate(engine: Engine) -> None:
+    """Take SQLite's write lock at BEGIN so a transaction never fails upgrading from a read lock."""
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+class RoutingSession(Session):
+    """Send flushes and DML to the writer engine and everything else to the reader pool.
+
+    Once a transaction has written it stays on the writer until commit or rollback,
+    so it reads its own uncommitted rows.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get("wrote") or self._flushing or getattr(clause, "is_dml", False):
+            self.info["wrote"] = True
+            return engine
+        return read_engine
+
+
+@event.listens_for(RoutingSession, "after_commit")
+@event.listens_for(RoutingSession, "after_rollback")
+def _release_writer(session):
+    session.info.pop("wrote", None)
+
+
+def _pool_args(url: str, name: str, size: int, overflow: int, pre_ping: bool, recycle: int) -> dict:
+    if url.startswith("sqlite") and ":memory:" in url:
+        return {}
+    return {"poolclass": instrumented_pool(name), "pool_size": size, "max_overflow": overflow, "pool_pre_ping": pre_ping, "pool_recycle": recycle}
+
+
+if IS_SQLITE and SQLITE_PRODUCTION:
+    timeout = SQLITE_BUSY_TIMEOUT_MS / 1000
+    connect_args = {**connect_args, "timeout": timeout}
+    # A single pooled connection is the write queue: writers wait their turn at checkout.
+    engine = create_engine(SYNC_DATABASE_URL, connect_args=connect_args, poolclass=instrumented_pool("primary"), pool_size=1, max_overflow=0, pool_timeout=SQLITE_WRITE_TIMEOUT_SECONDS)
+    read_engine = create_engine(SYNC_DATABASE_URL, connect_args=connect_args, poolclass=instrumented_pool("read"), pool_size=SQLITE_READ_POOL_SIZE, max_overflow=0, pool_timeout=SQLITE_WRITE_TIMEOUT_SECONDS)
+    for _engine in (engine, read_engine):
+        apply_sqlite_pragmas(_engine)
+    _begin_immediate(engine)
+    SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
+else:
+    engine = create_engine(SYNC_DATABASE_URL, connect_args=connect_args, **_pool_args(SYNC_DATABASE_URL, "primary", DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_PRE_PING, DB_POOL_RECYCLE))
+    read_engine = engine
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Replica sessions are read-only by convention and may lag the primary.
+replica_engine = None
+ReplicaSessionLocal = None
+if DATABASE_READ_URL:
+    replica_args = {"check_same_thread": False} if DATABASE_READ_URL.startswith("sqlite") else {}
+    replica_engine = create_engine(DATABASE_READ_URL, connect_args=replica_args, **_pool_args(DATABASE_READ_URL, "replica", DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW, DB_READ_POOL_PRE_PING, DB_READ_POOL_RECYCLE))
+    if DATABASE_READ_URL.startswith("sqlite") and SQLITE_PRODUCTION:
+        apply_sqlite_pragmas(replica_engine)
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
+
+def _checked_out() -> dict[tuple, float]:
+    pools = {"primary": engine.pool}
+    if read_engine is not engine:
+        pools["read"] = read_engine.pool
+    if replica_engine is not None:
+        pools["replica"] = replica_engine.pool
+    return {(name,): pool.checkedout() for name, pool in pools.items() if isinstance(pool, QueuePool)}
+
+
+metrics.gauge("db_pool_checked_out", "Connections currently checked out of each pool.", ("engine",), callback=_checked_out)
 
 
 def get_db():
@@ -19,3 +130,26 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def read_session_factory(user_id: int | None = None) -> sessionmaker:
+    """The replica's sessionmaker, unless there is none or ``user_id`` is inside its read-your-writes window."""
+    if ReplicaSessionLocal is None or (user_id is not None and wrote_recently(user_id)):
+        return SessionLocal
+    return ReplicaSessionLocal
+
+
+def get_read_db(request: Request):
+    """Session for read-only endpoints, routed to the replica when one is configured.
+
+    The user is taken from the ``user_id`` path parameter.
+    """
+    try:
+        user_id = int(request.path_params["user_id"])
+    except (KeyError, ValueError):
+        user_id = None
+    db = read_session_factory(user_id)()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,73 @@
+"""Track which users each transaction writes for.
+
+ORM changes to rows with a ``user_id`` and Core DML whose parameters carry a
+``user_id`` are recorded on ``session.info`` automatically; anything else
+(e.g. rows that only reference a user through a parent) calls ``touch_user``.
+Just before commit each touched user's data version is bumped in the same
+transaction (see ``app.api.conditional``). After commit the users are marked
+as recent writers for the read-your-writes window; that record is per process.
+"""
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import READ_YOUR_WRITES_SECONDS, RECENT_WRITERS_SIZE
+from app.models.user import User
+from app.repositories.version_repo import DataVersionRepository
+
+TOUCHED = "touched_users"
+
+recent_writers = TTLCache(maxsize=RECENT_WRITERS_SIZE, ttl=READ_YOUR_WRITES_SECONDS)
+# Called with the set of touched users after each commit that touched any
+commit_listeners: list[Callable[[set[int]], None]] = []
+
+
+def touch_user(session: Session, user_id: int | None) -> None:
+    if user_id is not None:
+        session.info.setdefault(TOUCHED, set()).add(user_id)
+
+
+def wrote_recently(user_id: int) -> bool:
+    return recent_writers.get(user_id) is not None
+
+
+@event.listens_for(Session, "before_flush")
+def _touch_flushed(session, flush_context, instances):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        touch_user(session, obj.id if isinstance(obj, User) else getattr(obj, "user_id", None))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _touch_dml(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    params = orm_execute_state.parameters
+    for row in params if isinstance(params, (list, tuple)) else [params or {}]:
+        touch_user(orm_execute_state.session, row.get("user_id"))
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_versions(session):
+    # Flush first: touches are recorded by the flush that commit would otherwise run after this hook.
+    session.flush()
+    touched = session.info.get(TOUCHED)
+    if touched:
+        DataVersionRepository(session).bump(list(touched))
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_writers(session):
+    touched = session.info.pop(TOUCHED, None)
+    if not touched:
+        return
+    for user_id in touched:
+        recent_writers.set(user_id, True)
+    for listener in commit_listeners:
+        listener(touched)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_writers(session):
+    session.info.pop(TOUCHED, None)
@@ -0,0 +1,14 @@
+"""Dialect-aware INSERT ... ON CONFLICT helpers."""
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session, model):
+    """Return an ``insert()`` construct supporting ``on_conflict_*`` for the bound dialect, or None."""
+    name = db.get_bind().dialect.name
+    if name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert(model)
@@ -1,27 +1,109 @@
 """FastAPI application entrypoint."""
-from fastapi import FastAPI
+import logging
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.api_v1.router import api_router
 from app.db import session as db_session
+from app.core.config import DB_SCHEMA_MODE, METRICS_ENABLED, SQL_PROFILING
+from app.core.hashing import HashingBusy
+from app.core.metrics import MetricsMiddleware, metrics
+from app.core.profiling import SQLProfilingMiddleware
+from app.core.responses import ORJSONResponse
+from app.core.startup import startup_report
+from app.repositories.exercise_catalog import UnknownExercise, exercise_catalog
+from app.repositories.outbox_repo import deferred
+from app.services.outbox_worker import outbox_worker
+
+startup_report.lap("import")
+
+
+def _migrated(engine) -> bool:
+    """Whether Alembic manages this database's schema."""
+    from sqlalchemy import inspect
+
+    return inspect(engine).has_table("alembic_version")
+
+
+def _missing_columns(engine, metadata) -> list[str]:
+    """Mapped columns absent from tables that already exist; ``create_all`` only ever adds whole tables."""
+    from sqlalchemy import inspect
+
+    inspector = inspect(engine)
+    missing = []
+    for table in metadata.sorted_tables:
+        if inspector.has_table(table.name):
+            present = {column["name"] for column in inspector.get_columns(table.name)}
+            missing += [f"{table.name}.{column.name}" for column in table.columns if column.name not in present]
+    return missing
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Gym Workout Tracker API", version="0.1.0")
+    app = FastAPI(title="Gym Workout Tracker API", version="0.1.0", default_response_class=ORJSONResponse)
 
     app.include_router(api_router, prefix="/api/v1")
 
+    if SQL_PROFILING:
+        app.add_middleware(SQLProfilingMiddleware)
+        sql_logger = logging.getLogger("app.sql")
+        if not sql_logger.handlers:
+            sql_logger.addHandler(logging.StreamHandler())
+            sql_logger.setLevel(logging.INFO)
+
+    startup_logger = logging.getLogger("app.startup")
+    if not startup_logger.handlers:
+        startup_logger.addHandler(logging.StreamHandler())
+        startup_logger.setLevel(logging.INFO)
+
+    if METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", include_in_schema=False)
+        def prometheus_metrics():
+            return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+    @app.exception_handler(HashingBusy)
+    def hashing_busy(request: Request, exc: HashingBusy):
+        return JSONResponse(status_code=503, content={"detail": "Authentication is busy, retry shortly"}, headers={"Retry-After": "1"})
+
+    @app.exception_handler(UnknownExercise)
+    def unknown_exercise(request: Request, exc: UnknownExercise):
+        return JSONResponse(status_code=422, content={"detail": str(exc), "exercise_ids": exc.exercise_ids})
+
     @app.on_event("startup")
     def on_startup():
-        # Create DB tables in dev mode (SQLite). Production should use migrations.
+        # Create DB tables in dev mode (SQLite). Migrated databases are left to Alembic.
         engine = db_session.engine
-        from app.db.base import Base  # local import
+        with startup_report.phase("schema"):
+            if DB_SCHEMA_MODE == "create" or (DB_SCHEMA_MODE == "auto" and not _migrated(engine)):
+                from app.db.base import Base  # local import
 
-        # Import all models so they are registered on Base.metadata
-        import app.models  # noqa: F401
+                # Import all models so they are registered on Base.metadata
+                import app.models  # noqa: F401
+
+                Base.metadata.create_all(bind=engine)
+                missing = _missing_columns(engine, Base.metadata)
+                if missing:
+                    raise RuntimeError(f"Database schema is out of date (missing {', '.join(missing)}); run `alembic upgrade head`")
+
+        with startup_report.phase("exercise_catalog"), db_session.SessionLocal() as db:
+            exercise_catalog.load(db)
+
+    @app.on_event("startup")
+    async def start_outbox_worker():
+        if deferred():
+            with startup_report.phase("outbox_worker"):
+                await outbox_worker.start()
+        startup_report.ready()
 
-        Base.metadata.create_all(bind=engine)
+    @app.on_event("shutdown")
+    async def stop_outbox_worker():
+        await outbox_worker.stop()
 
+    startup_report.lap("create_app")
     return app
 
 
 app = create_app()
+metrics.gauge("app_startup_seconds", "Time spent in each phase of this worker's startup.", ("phase",), callback=lambda: {(name,): seconds for name, seconds in startup_report.phases.items()})
@@ -4,3 +4,7 @@ from . import exercise  # noqa: F401
 from . import workout  # noqa: F401
 from . import template  # noqa: F401
 from . import goal  # noqa: F401
+from . import rollup  # noqa: F401
+from . import record  # noqa: F401
+from . import outbox  # noqa: F401
+from . import version  # noqa: F401
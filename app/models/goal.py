@@ -1,18 +1,22 @@
 """User goals model."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 
 from app.db.base import Base
 
 
 class Goal(Base):
     __tablename__ = "goals"
+    __table_args__ = (Index("ix_goals_user_kind_exercise", "user_id", "kind", "exercise_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     title = Column(String(200), nullable=False)
-    kind = Column(String(50), nullable=False)  # e.g., 'strength' or 'consistency'
+    kind = Column(String(50), nullable=False)  # 'strength', 'volume' or 'consistency'; other kinds are not evaluated
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), nullable=True)  # None means any exercise
     target = Column(Integer, nullable=True)
     start_date = Column(DateTime, default=datetime.utcnow)
     end_date = Column(DateTime, nullable=True)
+    progress = Column(Integer, nullable=False, default=0)  # heaviest weight, total volume or workout count in the window
     achieved = Column(Boolean, default=False)
+    achieved_at = Column(DateTime, nullable=True)
@@ -0,0 +1,23 @@
+"""Outbox events written alongside the rows they describe and drained by the background worker."""
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+
+from app.db.base import Base
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = (Index("ix_outbox_events_pending", "processed_at", "id"),)
+
+    id = Column(Integer, primary_key=True)
+    topic = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # not retried before this time
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    processed_at = Column(DateTime, nullable=True)
+    # set once attempts are exhausted; failed events are no longer claimed
+    failed_at = Column(DateTime, nullable=True)
@@ -0,0 +1,39 @@
+"""Personal records per user and exercise, maintained as sets are written."""
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+
+from app.db.base import Base
+
+
+class PersonalRecord(Base):
+    __tablename__ = "personal_records"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), primary_key=True)
+    # heaviest set, ties broken by reps
+    best_weight = Column(Integer, nullable=True)
+    best_weight_reps = Column(Integer, nullable=True)
+    best_weight_workout_id = Column(Integer, ForeignKey("workouts.id"), nullable=True)
+    best_weight_at = Column(DateTime, nullable=True)
+    # highest Epley estimated one-rep max
+    best_e1rm = Column(Float, nullable=True)
+    best_e1rm_weight = Column(Integer, nullable=True)
+    best_e1rm_reps = Column(Integer, nullable=True)
+    best_e1rm_workout_id = Column(Integer, ForeignKey("workouts.id"), nullable=True)
+    best_e1rm_at = Column(DateTime, nullable=True)
+    # most weight * reps for this exercise within one workout
+    best_session_volume = Column(Integer, nullable=True)
+    best_session_workout_id = Column(Integer, ForeignKey("workouts.id"), nullable=True)
+    best_session_at = Column(DateTime, nullable=True)
+
+
+class RepRecord(Base):
+    """Most reps ever done at a given weight."""
+
+    __tablename__ = "rep_records"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), primary_key=True)
+    weight = Column(Integer, primary_key=True)
+    reps = Column(Integer, nullable=False)
+    workout_id = Column(Integer, ForeignKey("workouts.id"), nullable=True)
+    achieved_at = Column(DateTime, nullable=True)
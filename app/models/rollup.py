@@ -0,0 +1,15 @@
+"""Pre-aggregated training volume, maintained on every set write."""
+from sqlalchemy import Column, Integer, Date, ForeignKey
+
+from app.db.base import Base
+
+
+class DailyExerciseVolume(Base):
+    __tablename__ = "daily_exercise_volume"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), primary_key=True)
+    volume = Column(Integer, nullable=False, default=0)  # sum of weight * reps
+    sets = Column(Integer, nullable=False, default=0)
+    reps = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,21 @@
+"""Data versions: per user, and for data shared by every user (such as the public template library).
+
+Each is bumped by every transaction that writes the data it covers.
+"""
+from sqlalchemy import BigInteger, Column, ForeignKey, Integer, String
+
+from app.db.base import Base
+
+
+class UserDataVersion(Base):
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+class SharedDataVersion(Base):
+    __tablename__ = "shared_data_versions"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,6 @@
+"""AsyncSession counterparts of the repositories.
+
+Reads are issued natively through the AsyncSession. Writes run the sync
+repository code through ``AsyncSession.run_sync`` so the derived-state
+bookkeeping done on write lives in exactly one place.
+"""
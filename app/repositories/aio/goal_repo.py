@@ -0,0 +1,23 @@
+"""Async repository for goals."""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.goal import Goal
+from app.repositories.goal_repo import GoalRepository
+
+
+class AsyncGoalRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, user_id: int, title: str, kind: str, target: int | None = None, start_date=None, end_date=None, exercise_id: int | None = None) -> Goal:
+        return await self.db.run_sync(lambda s: GoalRepository(s).create(user_id=user_id, title=title, kind=kind, target=target, start_date=start_date, end_date=end_date, exercise_id=exercise_id))
+
+    async def get(self, goal_id: int) -> Goal | None:
+        return await self.db.get(Goal, goal_id)
+
+    async def list_for_user(self, user_id: int, *, limit: int, after_id: int | None = None) -> list[Goal]:
+        stmt = select(Goal).where(Goal.user_id == user_id)
+        if after_id is not None:
+            stmt = stmt.where(Goal.id > after_id)
+        return (await self.db.scalars(stmt.order_by(Goal.id).limit(limit))).all()
@@ -0,0 +1,25 @@
+"""Async repository for templates and template exercises."""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.models.template import Template, TemplateExercise
+from app.repositories.template_repo import TemplateRepository
+
+
+class AsyncTemplateRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, user_id: int | None, name: str, description: str | None = None, exercises: list[dict] | None = None) -> Template:
+        return await self.db.run_sync(lambda s: TemplateRepository(s).create(user_id=user_id, name=name, description=description, exercises=exercises))
+
+    async def add_exercise(self, template: Template, exercise_id: int, order: int | None = None, sets: int | None = None, reps: int | None = None) -> TemplateExercise:
+        return await self.db.run_sync(lambda s: TemplateRepository(s).add_exercise(template, exercise_id=exercise_id, order=order, sets=sets, reps=reps))
+
+    async def get(self, template_id: int) -> Template | None:
+        return await self.db.get(Template, template_id)
+
+    async def get_with_exercises(self, template_id: int) -> Template | None:
+        stmt = select(Template).options(joinedload(Template.exercises)).where(Template.id == template_id)
+        return (await self.db.scalars(stmt)).unique().first()
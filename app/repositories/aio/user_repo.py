@@ -0,0 +1,23 @@
+"""Async repository for user persistence operations."""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.repositories.user_repo import UserRepository
+
+
+class AsyncUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_email(self, email: str) -> User | None:
+        return await self.db.scalar(select(User).where(User.email == email))
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        return await self.db.get(User, user_id)
+
+    async def create(self, *, email: str, hashed_password: str, username: str | None = None) -> User:
+        return await self.db.run_sync(lambda s: UserRepository(s).create(email=email, hashed_password=hashed_password, username=username))
+
+    async def update_password(self, user: User, hashed_password: str) -> User:
+        return await self.db.run_sync(lambda s: UserRepository(s).update_password(user, hashed_password))
@@ -0,0 +1,13 @@
+"""Async repository for per-user data versions."""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.version_repo import workout_version_stmt
+
+
+class AsyncDataVersionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def for_workout(self, workout_id: int) -> tuple[int, int] | None:
+        row = (await self.db.execute(workout_version_stmt(workout_id))).first()
+        return tuple(row) if row else None
@@ -0,0 +1,34 @@
+"""Async repository for workouts and sets."""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.workout import Workout, WorkoutSet
+from app.repositories.workout_repo import WorkoutRepository
+
+
+class AsyncWorkoutRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, *, user_id: int, name: str | None = None, date=None, notes: str | None = None) -> Workout:
+        return await self.db.run_sync(lambda s: WorkoutRepository(s).create(user_id=user_id, name=name, date=date, notes=notes))
+
+    async def get(self, workout_id: int, *, with_sets: bool = False) -> Workout | None:
+        """Fetch a workout; ``with_sets`` eager-loads sets since lazy loads are unavailable under asyncio."""
+        stmt = select(Workout).where(Workout.id == workout_id)
+        if with_sets:
+            stmt = stmt.options(selectinload(Workout.sets))
+        return await self.db.scalar(stmt)
+
+    async def delete(self, workout: Workout):
+        await self.db.run_sync(lambda s: WorkoutRepository(s).delete(workout))
+
+    async def add_set(self, workout: Workout, *, exercise_id: int, reps: int | None = None, weight: int | None = None, rest_seconds: int | None = None, order: int | None = None) -> WorkoutSet:
+        return await self.db.run_sync(lambda s: WorkoutRepository(s).add_set(workout, exercise_id=exercise_id, reps=reps, weight=weight, rest_seconds=rest_seconds, order=order))
+
+    async def add_sets(self, workout: Workout, sets: list[dict]) -> list[int]:
+        return await self.db.run_sync(lambda s: WorkoutRepository(s).add_sets(workout, sets))
+
+    async def create_with_sets(self, *, user_id: int, name: str | None = None, date=None, notes: str | None = None, sets: list[dict], template_id: int | None = None) -> tuple[Workout, list[int]]:
+        return await self.db.run_sync(lambda s: WorkoutRepository(s).create_with_sets(user_id=user_id, name=name, date=date, notes=notes, sets=sets, template_id=template_id))
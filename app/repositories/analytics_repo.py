@@ -0,0 +1,51 @@
+"""Repository for aggregate analytics queries pushed down to SQL."""
+from datetime import datetime
+
+from sqlalchemy import case, distinct, func, select
+from sqlalchemy.orm import Session
+
+from app.models.exercise import Exercise
+from app.models.workout import Workout, WorkoutSet
+
+_SQLITE_FORMATS = {"day": "%Y-%m-%d", "month": "%Y-%m", "year": "%Y"}
+_PG_FORMATS = {"day": "YYYY-MM-DD", "week": "YYYY-MM-DD", "month": "YYYY-MM", "year": "YYYY"}
+
+
+class AnalyticsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _bucket_expr(self, bucket: str):
+        """Bucket label as a string; weeks are labelled by their Monday."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return func.to_char(func.date_trunc(bucket, Workout.date), _PG_FORMATS[bucket])
+        if bucket == "week":
+            return func.date(Workout.date, "weekday 0", "-6 days")
+        return func.strftime(_SQLITE_FORMATS[bucket], Workout.date)
+
+    @staticmethod
+    def _metric_expr(metric: str):
+        volume = func.sum(case((WorkoutSet.weight.isnot(None) & WorkoutSet.reps.isnot(None), WorkoutSet.weight * WorkoutSet.reps), else_=0))
+        if metric == "volume":
+            return volume
+        if metric == "tonnage":
+            return volume / 1000.0
+        if metric == "sets":
+            return func.count(WorkoutSet.id)
+        if metric == "reps":
+            return func.sum(func.coalesce(WorkoutSet.reps, 0))
+        return func.count(distinct(Workout.id))
+
+    def series(self, user_id: int, *, start: datetime, end: datetime, bucket: str = "day", metric: str = "volume", exercise_id: int | None = None, muscle_group: str | None = None) -> list[tuple[str, float]]:
+        """Return ``(bucket, value)`` pairs for ``start <= date < end`` from a single GROUP BY query."""
+        label = self._bucket_expr(bucket).label("bucket")
+        stmt = select(label, self._metric_expr(metric)).where(Workout.user_id == user_id, Workout.date >= start, Workout.date < end)
+        # Session counts without set-level filters never need to touch workout_sets.
+        if metric != "sessions" or exercise_id is not None or muscle_group is not None:
+            stmt = stmt.select_from(Workout).join(WorkoutSet, WorkoutSet.workout_id == Workout.id)
+        if exercise_id is not None:
+            stmt = stmt.where(WorkoutSet.exercise_id == exercise_id)
+        if muscle_group is not None:
+            stmt = stmt.join(Exercise, Exercise.id == WorkoutSet.exercise_id).where(Exercise.muscle_group == muscle_group)
+        stmt = stmt.group_by(label).order_by(label)
+        return [(key, value or 0) for key, value in self.db.execute(stmt)]
@@ -0,0 +1,87 @@
+"""Process-wide cache of the exercise catalog.
+
+Exercises are reference data that is written rarely (seeding, catalog
+upserts), so the whole table is held in memory keyed by id and by
+normalized name. Hot paths validate ``exercise_id`` against it without a
+DB round trip. Writes call ``invalidate()`` and the next lookup reloads.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.exercise import Exercise
+
+
+class UnknownExercise(Exception):
+    """Raised when a payload references exercise ids that are not in the catalog."""
+
+    def __init__(self, exercise_ids: Iterable[int]):
+        self.exercise_ids = sorted(exercise_ids)
+        super().__init__(f"Unknown exercise_id: {', '.join(map(str, self.exercise_ids))}")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    id: int
+    name: str
+    category: str | None
+    muscle_group: str | None
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.split()).lower()
+
+
+class ExerciseCatalog:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_id: dict[int, CatalogEntry] | None = None
+        self._by_name: dict[str, CatalogEntry] = {}
+
+    def load(self, db: Session) -> None:
+        rows = db.execute(select(Exercise.id, Exercise.name, Exercise.category, Exercise.muscle_group)).all()
+        by_id = {row.id: CatalogEntry(row.id, row.name, row.category, row.muscle_group) for row in rows}
+        by_name = {normalize_name(entry.name): entry for entry in by_id.values()}
+        with self._lock:
+            self._by_id, self._by_name = by_id, by_name
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._by_id = None
+
+    def _entries(self, db: Session) -> dict[int, CatalogEntry]:
+        by_id = self._by_id
+        if by_id is None:
+            self.load(db)
+            by_id = self._by_id
+        return by_id
+
+    def get(self, db: Session, exercise_id: int) -> CatalogEntry | None:
+        return self._entries(db).get(exercise_id)
+
+    def by_name(self, db: Session, name: str) -> CatalogEntry | None:
+        self._entries(db)
+        return self._by_name.get(normalize_name(name))
+
+    def name_map(self, db: Session) -> dict[str, int]:
+        self._entries(db)
+        return {name: entry.id for name, entry in self._by_name.items()}
+
+    def require(self, db: Session, exercise_ids: Iterable[int]) -> None:
+        """Raise ``UnknownExercise`` unless every id is in the catalog.
+
+        An unknown id triggers one reload first, in case another process added it.
+        """
+        ids = set(exercise_ids)
+        missing = ids - self._entries(db).keys()
+        if missing:
+            self.load(db)
+            missing = ids - self._by_id.keys()
+            if missing:
+                raise UnknownExercise(missing)
+
+
+exercise_catalog = ExerciseCatalog()
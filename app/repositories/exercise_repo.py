@@ -0,0 +1,43 @@
+"""Repository for the exercise catalog."""
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.upsert import dialect_insert
+from app.models.exercise import Exercise
+from app.repositories.exercise_catalog import exercise_catalog
+
+# Rows per multi-VALUES statement, keeping bound parameters well under SQLite's limit.
+UPSERT_BATCH = 2000
+
+
+class ExerciseRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def upsert_many(self, items: list[dict]) -> int:
+        """Insert or update catalog entries by unique ``name``; missing fields keep their stored values."""
+        # Deduplicate by name (last wins): one statement may not update the same row twice.
+        rows = list({i["name"]: {"name": i["name"], "category": i.get("category") or None, "muscle_group": i.get("muscle_group") or None, "description": i.get("description") or None} for i in items}.values())
+        if not rows:
+            return 0
+        stmt = dialect_insert(self.db, Exercise)
+        if stmt is None:
+            for row in rows:
+                existing = self.db.execute(select(Exercise).where(Exercise.name == row["name"])).scalar_one_or_none()
+                if existing is None:
+                    self.db.add(Exercise(**row))
+                else:
+                    for key in ("category", "muscle_group", "description"):
+                        if row[key] is not None:
+                            setattr(existing, key, row[key])
+        else:
+            for start in range(0, len(rows), UPSERT_BATCH):
+                batch = stmt.values(rows[start:start + UPSERT_BATCH])
+                batch = batch.on_conflict_do_update(
+                    index_elements=[Exercise.name],
+                    set_={key: func.coalesce(getattr(batch.excluded, key), getattr(Exercise, key)) for key in ("category", "muscle_group", "description")},
+                )
+                self.db.execute(batch)
+        self.db.commit()
+        exercise_catalog.invalidate()
+        return len(rows)
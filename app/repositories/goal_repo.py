@@ -1,16 +1,61 @@
-"""Repository for goals."""
+"""Repository for goals.
+
+Progress for the evaluated kinds is kept on the goal row and advanced from
+the sets and workouts being written, in the caller's transaction:
+
+- ``strength``: heaviest weight lifted in the window
+- ``volume``: total weight x reps in the window
+- ``consistency``: number of workouts in the window
+
+Strength and volume goals may be limited to one exercise. Only goals whose
+(user, kind, exercise) and date window match a write are loaded, through
+``ix_goals_user_kind_exercise``. Deletes can lower progress, so they
+recompute the affected goals from the remaining history instead.
+"""
+from datetime import datetime
+
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
 from app.models.goal import Goal
+from app.models.workout import Workout, WorkoutSet
+from app.repositories.exercise_catalog import exercise_catalog
+from app.repositories.record_repo import SET_VOLUME, SetFact
+from app.repositories.rollup_repo import set_volume
+
+SET_KINDS = ("strength", "volume")
+EVALUATED_KINDS = (*SET_KINDS, "consistency")
+
+WorkoutFact = tuple[int, datetime]
+
+
+def _in_window(goal: Goal, at: datetime) -> bool:
+    return (goal.start_date is None or goal.start_date <= at) and (goal.end_date is None or at <= goal.end_date)
+
+
+def _settle(goal: Goal, at: datetime | None) -> None:
+    """Mark the goal achieved once progress reaches the target, or un-mark it if progress fell back."""
+    if goal.target is None:
+        return
+    if goal.progress >= goal.target:
+        if not goal.achieved:
+            goal.achieved, goal.achieved_at = True, at or datetime.utcnow()
+    elif goal.achieved:
+        goal.achieved, goal.achieved_at = False, None
 
 
 class GoalRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def create(self, user_id: int, title: str, kind: str, target: int | None = None, start_date=None, end_date=None) -> Goal:
-        g = Goal(user_id=user_id, title=title, kind=kind, target=target, start_date=start_date, end_date=end_date)
+    def create(self, user_id: int, title: str, kind: str, target: int | None = None, start_date=None, end_date=None, exercise_id: int | None = None) -> Goal:
+        if exercise_id is not None:
+            exercise_catalog.require(self.db, [exercise_id])
+        g = Goal(user_id=user_id, title=title, kind=kind, exercise_id=exercise_id, target=target, start_date=start_date or datetime.utcnow(), end_date=end_date, progress=0, achieved=False)
         self.db.add(g)
+        self.db.flush()
+        if kind in EVALUATED_KINDS:
+            self._evaluate(g)
         self.db.commit()
         self.db.refresh(g)
         return g
@@ -18,5 +63,79 @@ class GoalRepository:
     def get(self, goal_id: int) -> Goal | None:
         return self.db.query(Goal).filter(Goal.id == goal_id).first()
 
-    def list_for_user(self, user_id: int):
-        return self.db.query(Goal).filter(Goal.user_id == user_id).all()
+    def list_for_user(self, user_id: int, *, limit: int, after_id: int | None = None) -> list[Goal]:
+        """Goals in id order, starting after ``after_id``."""
+        q = self.db.query(Goal).filter(Goal.user_id == user_id)
+        if after_id is not None:
+            q = q.filter(Goal.id > after_id)
+        return q.order_by(Goal.id).limit(limit).all()
+
+    def _affected(self, user_id: int, kinds, first: datetime | None = None, last: datetime | None = None, exercise_ids=None) -> list[Goal]:
+        stmt = select(Goal).where(Goal.user_id == user_id, Goal.kind.in_(kinds))
+        if exercise_ids is not None:
+            stmt = stmt.where(or_(Goal.exercise_id.is_(None), Goal.exercise_id.in_(set(exercise_ids))))
+        if last is not None:
+            stmt = stmt.where(or_(Goal.start_date.is_(None), Goal.start_date <= last))
+        if first is not None:
+            stmt = stmt.where(or_(Goal.end_date.is_(None), Goal.end_date >= first))
+        return list(self.db.scalars(stmt.with_for_update()))
+
+    def apply_sets(self, user_id: int, sets: list[SetFact]) -> None:
+        """Advance strength and volume goals from newly written sets."""
+        if not sets:
+            return
+        dates = [fact[1] for fact in sets]
+        for goal in self._affected(user_id, SET_KINDS, min(dates), max(dates), {fact[2] for fact in sets}):
+            matching = [fact for fact in sets if _in_window(goal, fact[1]) and goal.exercise_id in (None, fact[2])]
+            if not matching:
+                continue
+            if goal.kind == "strength":
+                heaviest = max((fact[4] for fact in matching if fact[4] is not None), default=None)
+                if heaviest is not None and heaviest > goal.progress:
+                    goal.progress = heaviest
+            else:
+                goal.progress += sum(set_volume(fact[3], fact[4]) for fact in matching)
+            _settle(goal, max(fact[1] for fact in matching))
+
+    def apply_workouts(self, user_id: int, workouts: list[WorkoutFact]) -> None:
+        """Count newly created workouts towards consistency goals."""
+        if not workouts:
+            return
+        dates = [at for _, at in workouts]
+        for goal in self._affected(user_id, ("consistency",), min(dates), max(dates)):
+            matching = [at for at in dates if _in_window(goal, at)]
+            if matching:
+                goal.progress += len(matching)
+                _settle(goal, max(matching))
+
+    def recompute(self, user_id: int, exercise_ids=None, kinds=EVALUATED_KINDS, first: datetime | None = None, last: datetime | None = None) -> None:
+        """Re-evaluate the user's goals of ``kinds`` touching ``exercise_ids`` and the ``first``..``last`` window; pending deletes must be flushed."""
+        for goal in self._affected(user_id, kinds, first, last, exercise_ids):
+            self._evaluate(goal)
+
+    def evaluate_all(self, user_id: int | None = None) -> int:
+        """Recompute every evaluated goal (or one user's) from history and commit. Returns goals evaluated."""
+        stmt = select(Goal).where(Goal.kind.in_(EVALUATED_KINDS))
+        if user_id is not None:
+            stmt = stmt.where(Goal.user_id == user_id)
+        goals = list(self.db.scalars(stmt))
+        for goal in goals:
+            self._evaluate(goal)
+        self.db.commit()
+        return len(goals)
+
+    def _evaluate(self, goal: Goal) -> None:
+        if goal.kind == "consistency":
+            stmt = select(func.count(Workout.id), func.max(Workout.date)).where(Workout.user_id == goal.user_id)
+        else:
+            measure = func.max(WorkoutSet.weight) if goal.kind == "strength" else func.sum(SET_VOLUME)
+            stmt = select(measure, func.max(Workout.date)).join(Workout, Workout.id == WorkoutSet.workout_id).where(Workout.user_id == goal.user_id)
+            if goal.exercise_id is not None:
+                stmt = stmt.where(WorkoutSet.exercise_id == goal.exercise_id)
+        if goal.start_date is not None:
+            stmt = stmt.where(Workout.date >= goal.start_date)
+        if goal.end_date is not None:
+            stmt = stmt.where(Workout.date <= goal.end_date)
+        progress, last = self.db.execute(stmt).one()
+        goal.progress = int(progress or 0)
+        _settle(goal, last)
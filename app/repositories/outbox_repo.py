@@ -0,0 +1,83 @@
+"""Repository for the transactional outbox.
+
+``emit`` adds an event to the caller's session, so it commits or rolls back
+with the rows it describes. Sessions that emitted call the registered
+``listeners`` after commit, which lets an in-process worker wake up without
+waiting for its next poll.
+"""
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from app.core.config import OUTBOX_MAX_ATTEMPTS, OUTBOX_MODE, OUTBOX_RETRY_BACKOFF_SECONDS
+from app.models.outbox import OutboxEvent
+
+EMITTED = "outbox_emitted"
+
+listeners: list[Callable[[], None]] = []
+
+
+def deferred() -> bool:
+    """Whether derived data goes through the outbox rather than being updated inline."""
+    return OUTBOX_MODE == "worker"
+
+
+def emit(db: Session, topic: str, payload: dict) -> None:
+    db.add(OutboxEvent(topic=topic, payload=payload))
+    db.info[EMITTED] = True
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _notify(session):
+    if session.info.pop(EMITTED, False):
+        for listener in listeners:
+            listener()
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard(session):
+    session.info.pop(EMITTED, None)
+
+
+class OutboxRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def claim(self, limit: int) -> list[OutboxEvent]:
+        """The oldest due events, locked where the database supports ``SKIP LOCKED``."""
+        stmt = (
+            select(OutboxEvent)
+            .where(OutboxEvent.processed_at.is_(None), OutboxEvent.failed_at.is_(None), OutboxEvent.available_at <= datetime.utcnow())
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(self.db.scalars(stmt))
+
+    def mark_processed(self, events: list[OutboxEvent]) -> None:
+        ids = [e.id for e in events]
+        self.db.execute(update(OutboxEvent).where(OutboxEvent.id.in_(ids), OutboxEvent.processed_at.is_(None)).values(processed_at=datetime.utcnow()))
+
+    def mark_failed(self, event: OutboxEvent, error: str) -> bool:
+        """Record a failed attempt and schedule a retry with exponential backoff; returns True once attempts are exhausted."""
+        now = datetime.utcnow()
+        attempts = event.attempts + 1
+        values = {"attempts": attempts, "last_error": error[:2000]}
+        if attempts >= OUTBOX_MAX_ATTEMPTS:
+            values["failed_at"] = now
+        else:
+            values["available_at"] = now + timedelta(seconds=OUTBOX_RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1))
+        self.db.execute(update(OutboxEvent).where(OutboxEvent.id == event.id).values(**values))
+        return "failed_at" in values
+
+    def backlog(self) -> tuple[int, datetime | None]:
+        """Number of unprocessed events and the creation time of the oldest."""
+        count, oldest = self.db.execute(select(func.count(OutboxEvent.id), func.min(OutboxEvent.created_at)).where(OutboxEvent.processed_at.is_(None), OutboxEvent.failed_at.is_(None))).one()
+        return count, oldest
+
+    def prune(self, older_than: datetime) -> int:
+        result = self.db.execute(delete(OutboxEvent).where(OutboxEvent.processed_at < older_than))
+        return result.rowcount
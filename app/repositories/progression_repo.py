@@ -0,0 +1,57 @@
+"""Repository loading a user's set history as NumPy columns for progression analytics."""
+from datetime import date, datetime, time
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.orm import Session
+
+from app.models.workout import Workout, WorkoutSet
+
+# Julian day number of 1970-01-01, so julianday() - EPOCH_JULIAN_DAY counts days since the epoch
+EPOCH_JULIAN_DAY = 2440587.5
+
+
+class SetColumns(NamedTuple):
+    """One entry per set; ``day`` counts days since 1970-01-01 (UTC) and missing reps or weight are 0."""
+
+    day: np.ndarray
+    exercise_id: np.ndarray
+    workout_id: np.ndarray
+    reps: np.ndarray
+    weight: np.ndarray
+
+
+def epoch_day(value: date) -> int:
+    return (value - date(1970, 1, 1)).days
+
+
+class ProgressionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _day_expr(self):
+        if self.db.get_bind().dialect.name == "postgresql":
+            return cast(func.floor(func.extract("epoch", Workout.date) / 86400), Integer)
+        return cast(func.julianday(Workout.date) - EPOCH_JULIAN_DAY, Integer)
+
+    def set_columns(self, user_id: int, *, start: date | None = None, end: date | None = None, exercise_id: int | None = None) -> SetColumns:
+        """The user's sets on days ``start <= day < end``, in no particular order, from one query."""
+        stmt = (
+            select(self._day_expr(), WorkoutSet.exercise_id, WorkoutSet.workout_id, func.coalesce(WorkoutSet.reps, 0), func.coalesce(WorkoutSet.weight, 0))
+            .join(Workout, Workout.id == WorkoutSet.workout_id)
+            .where(Workout.user_id == user_id)
+        )
+        if start is not None:
+            stmt = stmt.where(Workout.date >= datetime.combine(start, time.min))
+        if end is not None:
+            stmt = stmt.where(Workout.date < datetime.combine(end, time.min))
+        if exercise_id is not None:
+            stmt = stmt.where(WorkoutSet.exercise_id == exercise_id)
+        result = self.db.connection().execute(stmt)
+        # NumPy converts the driver's plain tuples in C but walks SQLAlchemy Rows one element at a time,
+        # which is over ten times slower for large histories.
+        rows = result.cursor.fetchall()
+        result.close()
+        table = np.array(rows, dtype=np.int64).reshape(-1, 5)
+        return SetColumns(*np.ascontiguousarray(table.T))
@@ -0,0 +1,155 @@
+"""Repository for personal records.
+
+Records are folded forward from new sets in the caller's transaction, so
+lookups are single-row reads. Deletes can lower a record, so they recompute
+the affected (user, exercise) pairs from the remaining sets instead.
+Sets are passed as ``(workout_id, workout_date, exercise_id, reps, weight)``.
+"""
+from datetime import datetime
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.orm import Session
+
+from app.models.record import PersonalRecord, RepRecord
+from app.models.workout import Workout, WorkoutSet
+
+SetFact = tuple[int, datetime, int, int | None, int | None]
+
+SET_VOLUME = case((WorkoutSet.weight.isnot(None) & WorkoutSet.reps.isnot(None), WorkoutSet.weight * WorkoutSet.reps), else_=0)
+
+
+def estimated_1rm(weight: int | None, reps: int | None) -> float | None:
+    """Epley estimate; ``None`` for sets missing weight or reps."""
+    if weight is None or not reps:
+        return None
+    return float(weight) if reps == 1 else round(weight * (1 + reps / 30), 2)
+
+
+def _fold_set(record: PersonalRecord, reps_at: dict, fact: SetFact) -> None:
+    """Raise ``record`` and the rep record for this weight if the set beats them."""
+    workout_id, at, _, reps, weight = fact
+    if weight is None:
+        return
+    if record.best_weight is None or (weight, reps or 0) > (record.best_weight, record.best_weight_reps or 0):
+        record.best_weight, record.best_weight_reps, record.best_weight_workout_id, record.best_weight_at = weight, reps, workout_id, at
+    e1rm = estimated_1rm(weight, reps)
+    if e1rm is not None and (record.best_e1rm is None or e1rm > record.best_e1rm):
+        record.best_e1rm, record.best_e1rm_weight, record.best_e1rm_reps, record.best_e1rm_workout_id, record.best_e1rm_at = e1rm, weight, reps, workout_id, at
+    if reps:
+        rep = reps_at.get(weight)
+        if rep is None:
+            reps_at[weight] = RepRecord(user_id=record.user_id, exercise_id=record.exercise_id, weight=weight, reps=reps, workout_id=workout_id, achieved_at=at)
+        elif reps > rep.reps:
+            rep.reps, rep.workout_id, rep.achieved_at = reps, workout_id, at
+
+
+def _has_records(record: PersonalRecord) -> bool:
+    return record.best_weight is not None or record.best_session_volume is not None
+
+
+def _fold_session(record: PersonalRecord, workout_id: int, at: datetime, volume: int) -> None:
+    if volume and (record.best_session_volume is None or volume > record.best_session_volume):
+        record.best_session_volume, record.best_session_workout_id, record.best_session_at = volume, workout_id, at
+
+
+class PersonalRecordRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: int, exercise_id: int) -> PersonalRecord | None:
+        return self.db.get(PersonalRecord, (user_id, exercise_id))
+
+    def list_for_user(self, user_id: int) -> list[PersonalRecord]:
+        return list(self.db.scalars(select(PersonalRecord).where(PersonalRecord.user_id == user_id).order_by(PersonalRecord.exercise_id)))
+
+    def rep_records(self, user_id: int, exercise_id: int) -> list[RepRecord]:
+        return list(self.db.scalars(select(RepRecord).where(RepRecord.user_id == user_id, RepRecord.exercise_id == exercise_id).order_by(RepRecord.weight)))
+
+    def apply_sets(self, user_id: int, sets: list[SetFact]) -> None:
+        """Fold newly written sets into the user's records; sets must already be flushed or pending."""
+        if not sets:
+            return
+        self.db.flush()
+        exercise_ids = {fact[2] for fact in sets}
+        records = {
+            r.exercise_id: r
+            for r in self.db.scalars(select(PersonalRecord).where(PersonalRecord.user_id == user_id, PersonalRecord.exercise_id.in_(exercise_ids)).with_for_update())
+        }
+        weights = {fact[4] for fact in sets if fact[4] is not None and fact[3]}
+        reps_at: dict[int, dict] = {}
+        if weights:
+            stmt = select(RepRecord).where(RepRecord.user_id == user_id, RepRecord.exercise_id.in_(exercise_ids), RepRecord.weight.in_(weights)).with_for_update()
+            for rep in self.db.scalars(stmt):
+                reps_at.setdefault(rep.exercise_id, {})[rep.weight] = rep
+
+        for fact in sets:
+            exercise_id = fact[2]
+            record = records.get(exercise_id)
+            if record is None:
+                record = records[exercise_id] = PersonalRecord(user_id=user_id, exercise_id=exercise_id)
+            known = reps_at.setdefault(exercise_id, {})
+            before = set(known)
+            _fold_set(record, known, fact)
+            self.db.add_all(known[w] for w in set(known) - before)
+
+        # Session volume covers every set of the workout, not just the new ones.
+        dates = {fact[0]: fact[1] for fact in sets}
+        totals = self.db.execute(
+            select(WorkoutSet.workout_id, WorkoutSet.exercise_id, func.sum(SET_VOLUME))
+            .where(WorkoutSet.workout_id.in_(dates), WorkoutSet.exercise_id.in_(exercise_ids))
+            .group_by(WorkoutSet.workout_id, WorkoutSet.exercise_id)
+        )
+        for workout_id, exercise_id, volume in totals:
+            _fold_session(records[exercise_id], workout_id, dates[workout_id], int(volume or 0))
+        self.db.add_all(r for r in records.values() if _has_records(r))
+
+    def recompute(self, user_id: int, exercise_ids) -> None:
+        """Rebuild the given exercises' records from the sets that remain (after a delete)."""
+        exercise_ids = set(exercise_ids)
+        if exercise_ids:
+            self._rebuild(user_id, exercise_ids)
+
+    def rebuild(self, user_id: int | None = None) -> int:
+        """Recompute every record (or one user's) from ``workout_sets`` and commit. Returns records written."""
+        count = self._rebuild(user_id, None)
+        self.db.commit()
+        return count
+
+    def _rebuild(self, user_id: int | None, exercise_ids: set[int] | None) -> int:
+        clear_records, clear_reps = delete(PersonalRecord), delete(RepRecord)
+        sets = (
+            select(Workout.user_id, Workout.id, Workout.date, WorkoutSet.exercise_id, WorkoutSet.reps, WorkoutSet.weight)
+            .join(Workout, Workout.id == WorkoutSet.workout_id)
+            .order_by(Workout.date, WorkoutSet.id)
+        )
+        sessions = (
+            select(Workout.user_id, Workout.id, Workout.date, WorkoutSet.exercise_id, func.sum(SET_VOLUME))
+            .join(Workout, Workout.id == WorkoutSet.workout_id)
+            .group_by(Workout.user_id, Workout.id, Workout.date, WorkoutSet.exercise_id)
+            .order_by(Workout.date, Workout.id)
+        )
+        if user_id is not None:
+            clear_records, clear_reps = clear_records.where(PersonalRecord.user_id == user_id), clear_reps.where(RepRecord.user_id == user_id)
+            sets, sessions = sets.where(Workout.user_id == user_id), sessions.where(Workout.user_id == user_id)
+        if exercise_ids is not None:
+            clear_records, clear_reps = clear_records.where(PersonalRecord.exercise_id.in_(exercise_ids)), clear_reps.where(RepRecord.exercise_id.in_(exercise_ids))
+            sets, sessions = sets.where(WorkoutSet.exercise_id.in_(exercise_ids)), sessions.where(WorkoutSet.exercise_id.in_(exercise_ids))
+        self.db.execute(clear_records)
+        self.db.execute(clear_reps)
+
+        records: dict[tuple[int, int], PersonalRecord] = {}
+        reps_at: dict[tuple[int, int], dict] = {}
+        for uid, workout_id, at, exercise_id, reps, weight in self.db.execute(sets.execution_options(yield_per=10_000)):
+            key = (uid, exercise_id)
+            record = records.get(key)
+            if record is None:
+                record = records[key] = PersonalRecord(user_id=uid, exercise_id=exercise_id)
+                reps_at[key] = {}
+            _fold_set(record, reps_at[key], (workout_id, at, exercise_id, reps, weight))
+        for uid, workout_id, at, exercise_id, volume in self.db.execute(sessions.execution_options(yield_per=10_000)):
+            _fold_session(records[(uid, exercise_id)], workout_id, at, int(volume or 0))
+
+        self.db.add_all(r for r in records.values() if _has_records(r))
+        self.db.add_all(rep for per_weight in reps_at.values() for rep in per_weight.values())
+        self.db.flush()
+        return sum(1 for r in records.values() if _has_records(r))
@@ -0,0 +1,132 @@
+"""Repository for the daily volume rollup table.
+
+Rows are keyed by (user, day, exercise) and updated in the caller's
+transaction; nothing here commits except ``rebuild``.
+"""
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Date, case, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.upsert import dialect_insert
+from app.models.rollup import DailyExerciseVolume
+from app.models.workout import Workout, WorkoutSet
+
+
+def set_volume(reps: int | None, weight: int | None) -> int:
+    """Volume contributed by one set; sets missing reps or weight count as zero."""
+    if weight and reps:
+        return weight * reps
+    return 0
+
+
+class RollupRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_sets(self, user_id: int, day: date, sets, sign: int = 1) -> None:
+        """Add (``sign=1``) or subtract (``sign=-1``) sets given as (exercise_id, reps, weight) tuples."""
+        deltas: dict[int, list[int]] = {}
+        for exercise_id, reps, weight in sets:
+            d = deltas.setdefault(exercise_id, [0, 0, 0])
+            d[0] += set_volume(reps, weight)
+            d[1] += 1
+            d[2] += reps or 0
+        self._apply(user_id, day, deltas, sign)
+
+    def remove_workout(self, workout: Workout) -> None:
+        """Subtract everything a workout contributed, aggregated in SQL rather than via ``workout.sets``."""
+        rows = self.db.execute(
+            select(
+                WorkoutSet.exercise_id,
+                func.sum(case((WorkoutSet.weight.isnot(None) & WorkoutSet.reps.isnot(None), WorkoutSet.weight * WorkoutSet.reps), else_=0)),
+                func.count(WorkoutSet.id),
+                func.sum(func.coalesce(WorkoutSet.reps, 0)),
+            )
+            .where(WorkoutSet.workout_id == workout.id)
+            .group_by(WorkoutSet.exercise_id)
+        ).all()
+        deltas = {exercise_id: [volume or 0, count, reps or 0] for exercise_id, volume, count, reps in rows}
+        self._apply(workout.user_id, workout.date.date(), deltas, -1)
+
+    def _apply(self, user_id: int, day: date, deltas: dict[int, list[int]], sign: int) -> None:
+        if not deltas:
+            return
+        T = DailyExerciseVolume
+        rows = [
+            {"user_id": user_id, "day": day, "exercise_id": exercise_id, "volume": sign * v, "sets": sign * s, "reps": sign * r}
+            for exercise_id, (v, s, r) in deltas.items()
+        ]
+        stmt = dialect_insert(self.db, T)
+        if stmt is not None:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[T.user_id, T.day, T.exercise_id],
+                set_={"volume": T.volume + stmt.excluded.volume, "sets": T.sets + stmt.excluded.sets, "reps": T.reps + stmt.excluded.reps},
+            )
+            self.db.execute(stmt, rows)
+        else:
+            for row in rows:
+                existing = self.db.get(T, (user_id, day, row["exercise_id"]))
+                if existing is None:
+                    self.db.add(T(**row))
+                else:
+                    existing.volume += row["volume"]
+                    existing.sets += row["sets"]
+                    existing.reps += row["reps"]
+            self.db.flush()
+        if sign < 0:
+            self.db.execute(delete(T).where(T.user_id == user_id, T.day == day, T.sets <= 0))
+
+    def volume_by_day(self, user_id: int, start: date, end: date | None = None) -> dict[str, int]:
+        T = DailyExerciseVolume
+        stmt = select(T.day, func.sum(T.volume)).where(T.user_id == user_id, T.day >= start).group_by(T.day).order_by(T.day)
+        if end is not None:
+            stmt = stmt.where(T.day <= end)
+        return {day.isoformat(): int(total or 0) for day, total in self.db.execute(stmt)}
+
+    def recompute_days(self, user_id: int, days) -> None:
+        """Rebuild the user's rows for ``days`` from ``workout_sets``; idempotent, unlike ``apply_sets``."""
+        days = sorted(set(days))
+        if not days:
+            return
+        T = DailyExerciseVolume
+        day = func.date(Workout.date, type_=Date)
+        source = (
+            select(
+                Workout.user_id,
+                day,
+                WorkoutSet.exercise_id,
+                func.sum(case((WorkoutSet.weight.isnot(None) & WorkoutSet.reps.isnot(None), WorkoutSet.weight * WorkoutSet.reps), else_=0)),
+                func.count(WorkoutSet.id),
+                func.sum(func.coalesce(WorkoutSet.reps, 0)),
+            )
+            .join(Workout, Workout.id == WorkoutSet.workout_id)
+            .where(Workout.user_id == user_id, Workout.date >= datetime.combine(days[0], time.min), Workout.date < datetime.combine(days[-1] + timedelta(days=1), time.min), day.in_(days))
+            .group_by(Workout.user_id, day, WorkoutSet.exercise_id)
+        )
+        self.db.execute(delete(T).where(T.user_id == user_id, T.day.in_(days)))
+        self.db.execute(insert(T).from_select([T.user_id, T.day, T.exercise_id, T.volume, T.sets, T.reps], source))
+
+    def rebuild(self, user_id: int | None = None) -> int:
+        """Recompute rollups from ``workout_sets`` with a single INSERT ... SELECT. Returns rows written."""
+        T = DailyExerciseVolume
+        clear = delete(T)
+        source = (
+            select(
+                Workout.user_id,
+                func.date(Workout.date),
+                WorkoutSet.exercise_id,
+                func.sum(case((WorkoutSet.weight.isnot(None) & WorkoutSet.reps.isnot(None), WorkoutSet.weight * WorkoutSet.reps), else_=0)),
+                func.count(WorkoutSet.id),
+                func.sum(func.coalesce(WorkoutSet.reps, 0)),
+            )
+            .join(Workout, Workout.id == WorkoutSet.workout_id)
+            .group_by(Workout.user_id, func.date(Workout.date), WorkoutSet.exercise_id)
+        )
+        if user_id is not None:
+            clear = clear.where(T.user_id == user_id)
+            source = source.where(Workout.user_id == user_id)
+        self.db.execute(clear)
+        result = self.db.execute(insert(T).from_select([T.user_id, T.day, T.exercise_id, T.volume, T.sets, T.reps], source))
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,78 @@
+"""Process-wide cache of the public template library.
+
+Public templates (no ``user_id``) are shared by every user and written
+rarely, so all of them are held in memory with their ordered exercises,
+ready to serve. The copy is stamped with the library's shared data version
+(``shared_data_versions``), which every write to a public template bumps in
+its own transaction. A commit in this process drops the copy at once; other
+processes notice the new version on their next check, at most once every
+``TEMPLATE_LIBRARY_CHECK_SECONDS``. Between checks reads never touch the DB.
+"""
+import threading
+import time
+from bisect import bisect_right
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import TEMPLATE_LIBRARY_CHECK_SECONDS
+from app.repositories.template_repo import PUBLIC_TEMPLATES, PUBLIC_TEMPLATES_CHANGED, TemplateRepository, template_detail
+from app.repositories.version_repo import SharedVersionRepository
+
+
+class TemplateLibrary:
+    def __init__(self, check_seconds: float = TEMPLATE_LIBRARY_CHECK_SECONDS):
+        self.check_seconds = check_seconds
+        self.version: int | None = None
+        self.rebuilds = 0
+        self._lock = threading.Lock()
+        # (details by id, sorted ids), swapped as one so readers never see a half-built pair
+        self._entries: tuple[dict[int, dict], list[int]] = ({}, [])
+        self._checked = 0.0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.version = None
+
+    def _fresh(self) -> bool:
+        return self.version is not None and time.monotonic() - self._checked < self.check_seconds
+
+    def _current(self, db: Session) -> tuple[dict[int, dict], list[int]]:
+        if self._fresh():
+            return self._entries
+        with self._lock:
+            if self._fresh():
+                return self._entries
+            # Version before rows: a write landing in between leaves the copy stamped older
+            # than its data, so the next check rebuilds it rather than keeping stale rows.
+            version = SharedVersionRepository(db).get(PUBLIC_TEMPLATES)
+            if version != self.version:
+                by_id = {t.id: template_detail(t) for t in TemplateRepository(db).list_public_details()}
+                self._entries = (by_id, sorted(by_id))
+                self.version = version
+                self.rebuilds += 1
+            self._checked = time.monotonic()
+            return self._entries
+
+    def get(self, db: Session, template_id: int) -> dict | None:
+        return self._current(db)[0].get(template_id)
+
+    def page(self, db: Session, *, limit: int, after_id: int | None = None) -> list[dict]:
+        """Public templates in id order, starting after ``after_id``."""
+        by_id, ids = self._current(db)
+        start = bisect_right(ids, after_id) if after_id is not None else 0
+        return [by_id[template_id] for template_id in ids[start : start + limit]]
+
+
+template_library = TemplateLibrary()
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_library(session):
+    if session.info.pop(PUBLIC_TEMPLATES_CHANGED, False):
+        template_library.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_library_change(session):
+    session.info.pop(PUBLIC_TEMPLATES_CHANGED, None)
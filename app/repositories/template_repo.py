@@ -1,26 +1,105 @@
 """Repository for templates and template exercises."""
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, joinedload
 
+from app.db.tracking import touch_user
 from app.models.template import Template, TemplateExercise
+from app.repositories.exercise_catalog import exercise_catalog
+from app.repositories.version_repo import SharedVersionRepository
+
+# Shared data version of the public template library (templates without a user)
+PUBLIC_TEMPLATES = "public_templates"
+PUBLIC_TEMPLATES_CHANGED = "public_templates_changed"
+
+
+def ordered_exercises(template: Template) -> list[TemplateExercise]:
+    """The template's exercises by ``order``, unordered ones last, ties by id."""
+    return sorted(template.exercises, key=lambda te: (te.order is None, te.order or 0, te.id))
+
+
+def planned_sets(template: Template) -> list[dict]:
+    """Set rows for a workout started from ``template``: ``sets`` x ``reps`` per exercise, weights left to the lifter."""
+    sets = []
+    for te in ordered_exercises(template):
+        for _ in range(te.sets or 1):
+            sets.append({"exercise_id": te.exercise_id, "reps": te.reps, "order": len(sets) + 1})
+    return sets
+
+
+def template_detail(template: Template) -> dict:
+    """The template with its ordered exercises and their names; ``template.exercises`` should include ``exercise``."""
+    return {
+        "id": template.id,
+        "user_id": template.user_id,
+        "name": template.name,
+        "description": template.description,
+        "exercises": [
+            {"id": te.id, "exercise_id": te.exercise_id, "exercise_name": te.exercise.name, "order": te.order, "sets": te.sets, "reps": te.reps}
+            for te in ordered_exercises(template)
+        ],
+    }
+
+
+def _detail_options():
+    return joinedload(Template.exercises).joinedload(TemplateExercise.exercise)
 
 
 class TemplateRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def create(self, user_id: int | None, name: str, description: str | None = None) -> Template:
+    def create(self, user_id: int | None, name: str, description: str | None = None, exercises: list[dict] | None = None) -> Template:
+        """Create the template and all of its exercises in one transaction."""
+        exercises = exercises or []
+        exercise_catalog.require(self.db, [ex["exercise_id"] for ex in exercises])
         t = Template(user_id=user_id, name=name, description=description)
         self.db.add(t)
+        self.db.flush()
+        if exercises:
+            self.db.execute(insert(TemplateExercise), [{**ex, "template_id": t.id} for ex in exercises])
+        if user_id is None:
+            self.mark_public_changed()
         self.db.commit()
         self.db.refresh(t)
         return t
 
     def add_exercise(self, template: Template, exercise_id: int, order: int | None = None, sets: int | None = None, reps: int | None = None) -> TemplateExercise:
+        exercise_catalog.require(self.db, [exercise_id])
         te = TemplateExercise(template_id=template.id, exercise_id=exercise_id, order=order, sets=sets, reps=reps)
         self.db.add(te)
+        touch_user(self.db, template.user_id)
+        if template.user_id is None:
+            self.mark_public_changed()
         self.db.commit()
         self.db.refresh(te)
         return te
 
+    def mark_public_changed(self) -> None:
+        """Bump the public library's version in this transaction; ``template_library`` drops its copy on commit."""
+        SharedVersionRepository(self.db).bump(PUBLIC_TEMPLATES)
+        self.db.info[PUBLIC_TEMPLATES_CHANGED] = True
+
     def get(self, template_id: int) -> Template | None:
         return self.db.query(Template).filter(Template.id == template_id).first()
+
+    def get_with_exercises(self, template_id: int) -> Template | None:
+        """The template with its exercises, from one joined query."""
+        stmt = select(Template).options(joinedload(Template.exercises)).where(Template.id == template_id)
+        return self.db.scalars(stmt).unique().first()
+
+    def get_detail(self, template_id: int) -> Template | None:
+        """The template with its exercises and their exercise rows, from one joined query."""
+        stmt = select(Template).options(_detail_options()).where(Template.id == template_id)
+        return self.db.scalars(stmt).unique().first()
+
+    def list_public_details(self) -> list[Template]:
+        """Every public template with its exercises and their exercise rows, in id order, from one joined query."""
+        stmt = select(Template).options(_detail_options()).where(Template.user_id.is_(None)).order_by(Template.id)
+        return list(self.db.scalars(stmt).unique())
+
+    def list_for_user(self, user_id: int, *, limit: int, after_id: int | None = None) -> list[Template]:
+        """Templates in id order, starting after ``after_id``."""
+        q = self.db.query(Template).filter(Template.user_id == user_id)
+        if after_id is not None:
+            q = q.filter(Template.id > after_id)
+        return q.order_by(Template.id).limit(limit).all()
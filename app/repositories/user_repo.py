@@ -1,6 +1,7 @@
 """Repository for user persistence operations."""
 from sqlalchemy.orm import Session
 
+from app.core.cache import user_cache
 from app.models.user import User
 
 
@@ -20,3 +21,10 @@ class UserRepository:
         self.db.commit()
         self.db.refresh(user)
         return user
+
+    def update_password(self, user: User, hashed_password: str) -> User:
+        user.hashed_password = hashed_password
+        self.db.commit()
+        user_cache.invalidate(user.id)
+        self.db.refresh(user)
+        return user
@@ -0,0 +1,62 @@
+"""Repository for per-user and shared data versions.
+
+Versions only ever increase. A user or shared dataset without a row is at version 0.
+"""
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.upsert import dialect_insert
+from app.models.version import SharedDataVersion, UserDataVersion
+from app.models.workout import Workout
+
+
+class DataVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: int) -> int:
+        return self.db.scalar(select(UserDataVersion.version).where(UserDataVersion.user_id == user_id)) or 0
+
+    def for_workout(self, workout_id: int) -> tuple[int, int] | None:
+        """The workout's owner and their data version, or None if the workout does not exist."""
+        row = self.db.execute(workout_version_stmt(workout_id)).first()
+        return tuple(row) if row else None
+
+    def bump(self, user_ids) -> None:
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            return
+        T = UserDataVersion
+        stmt = dialect_insert(self.db, T)
+        if stmt is not None:
+            stmt = stmt.on_conflict_do_update(index_elements=[T.user_id], set_={"version": T.version + 1})
+            self.db.execute(stmt, [{"user_id": user_id, "version": 1} for user_id in user_ids])
+            return
+        self.db.execute(update(T).where(T.user_id.in_(user_ids)).values(version=T.version + 1))
+        existing = set(self.db.scalars(select(T.user_id).where(T.user_id.in_(user_ids))))
+        self.db.add_all(T(user_id=user_id, version=1) for user_id in user_ids if user_id not in existing)
+
+
+class SharedVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, name: str) -> int:
+        return self.db.scalar(select(SharedDataVersion.version).where(SharedDataVersion.name == name)) or 0
+
+    def bump(self, name: str) -> None:
+        T = SharedDataVersion
+        stmt = dialect_insert(self.db, T)
+        if stmt is not None:
+            self.db.execute(stmt.values(name=name, version=1).on_conflict_do_update(index_elements=[T.name], set_={"version": T.version + 1}))
+            return
+        if not self.db.execute(update(T).where(T.name == name).values(version=T.version + 1)).rowcount:
+            self.db.add(T(name=name, version=1))
+
+
+def workout_version_stmt(workout_id: int):
+    return (
+        select(Workout.user_id, func.coalesce(UserDataVersion.version, 0))
+        .outerjoin(UserDataVersion, UserDataVersion.user_id == Workout.user_id)
+        .where(Workout.id == workout_id)
+    )
@@ -1,31 +1,158 @@
 """Repository for workouts and sets."""
-from sqlalchemy.orm import Session
+from datetime import datetime
+
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 
+from app.db.tracking import touch_user
 from app.models.workout import Workout, WorkoutSet
+from app.repositories.exercise_catalog import exercise_catalog
+from app.repositories.goal_repo import EVALUATED_KINDS, SET_KINDS, GoalRepository, WorkoutFact
+from app.repositories.outbox_repo import deferred, emit
+from app.repositories.record_repo import PersonalRecordRepository, SetFact
+from app.repositories.rollup_repo import RollupRepository
+
+
+def insert_returning_ids(db: Session, model, rows: list[dict]) -> list[int]:
+    """Bulk-insert ``rows`` into ``model``'s table and return the new ids in the order of ``rows``."""
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite cannot order RETURNING, so sort_by_parameter_order would make SQLAlchemy send one INSERT per row.
+        # Each multi-row INSERT hands out ascending rowids in VALUES order, and its pages run in input order
+        # inside one transaction, so the sorted ids line up with the input.
+        return sorted(db.scalars(insert(model).returning(model.id), rows))
+    return list(db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows))
 
 
 class WorkoutRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.rollups = RollupRepository(db)
+        self.records = PersonalRecordRepository(db)
+        self.goals = GoalRepository(db)
 
     def create(self, *, user_id: int, name: str | None = None, date=None, notes: str | None = None):
         workout = Workout(user_id=user_id, name=name, date=date, notes=notes)
         self.db.add(workout)
+        self.db.flush()
+        self.record_workouts(user_id, [(workout.id, workout.date)])
         self.db.commit()
         self.db.refresh(workout)
         return workout
 
-    def get(self, workout_id: int) -> Workout | None:
-        return self.db.query(Workout).filter(Workout.id == workout_id).first()
+    def get(self, workout_id: int, *, with_sets: bool = False) -> Workout | None:
+        q = self.db.query(Workout).filter(Workout.id == workout_id)
+        if with_sets:
+            q = q.options(selectinload(Workout.sets))
+        return q.first()
+
+    def list_for_user(self, user_id: int, *, limit: int, after: tuple[datetime, int] | None = None) -> list[Workout]:
+        """Newest first by (date, id), starting after the ``after`` key; sets come from one batched selectinload."""
+        q = self.db.query(Workout).options(selectinload(Workout.sets)).filter(Workout.user_id == user_id)
+        if after is not None:
+            q = q.filter(tuple_(Workout.date, Workout.id) < tuple_(*after))
+        return q.order_by(Workout.date.desc(), Workout.id.desc()).limit(limit).all()
 
     def delete(self, workout: Workout):
+        exercise_ids = self.db.scalars(select(WorkoutSet.exercise_id).where(WorkoutSet.workout_id == workout.id).distinct()).all()
+        if not deferred():
+            self.rollups.remove_workout(workout)
         self.db.delete(workout)
+        self.db.flush()
+        self.record_removal(workout.user_id, workout.date, exercise_ids, workout_removed=True)
+        self.db.commit()
+
+    def get_set(self, workout: Workout, set_id: int) -> WorkoutSet | None:
+        return self.db.scalar(select(WorkoutSet).where(WorkoutSet.id == set_id, WorkoutSet.workout_id == workout.id))
+
+    def delete_set(self, workout: Workout, wset: WorkoutSet):
+        if not deferred():
+            self.rollups.apply_sets(workout.user_id, workout.date.date(), [(wset.exercise_id, wset.reps, wset.weight)], sign=-1)
+        self.db.delete(wset)
+        self.db.flush()
+        self.record_removal(workout.user_id, workout.date, [wset.exercise_id])
         self.db.commit()
 
     def add_set(self, workout: Workout, *, exercise_id: int, reps: int | None = None, weight: int | None = None, rest_seconds: int | None = None, order: int | None = None) -> WorkoutSet:
+        exercise_catalog.require(self.db, [exercise_id])
         wset = WorkoutSet(workout_id=workout.id, exercise_id=exercise_id, reps=reps, weight=weight, rest_seconds=rest_seconds, order=order)
         self.db.add(wset)
+        self.record_sets(workout.user_id, [(workout.id, workout.date, exercise_id, reps, weight)])
         self.db.commit()
         self.db.refresh(wset)
         return wset
+
+    def add_sets(self, workout: Workout, sets: list[dict]) -> list[int]:
+        """Insert many sets with one executemany and a single commit; returns ids in input order."""
+        ids = self._insert_sets(workout, sets)
+        self.db.commit()
+        return ids
+
+    def create_with_sets(self, *, user_id: int, name: str | None = None, date=None, notes: str | None = None, sets: list[dict], template_id: int | None = None) -> tuple[Workout, list[int]]:
+        workout = Workout(user_id=user_id, name=name, date=date, notes=notes, template_id=template_id)
+        self.db.add(workout)
+        self.db.flush()
+        self.record_workouts(user_id, [(workout.id, workout.date)])
+        ids = self._insert_sets(workout, sets)
+        self.db.commit()
+        return workout, ids
+
+    def _insert_sets(self, workout: Workout, sets: list[dict]) -> list[int]:
+        if not sets:
+            return []
+        exercise_catalog.require(self.db, (s["exercise_id"] for s in sets))
+        ids = insert_returning_ids(self.db, WorkoutSet, [{**s, "workout_id": workout.id} for s in sets])
+        self.record_sets(workout.user_id, [(workout.id, workout.date, s["exercise_id"], s.get("reps"), s.get("weight")) for s in sets])
+        return ids
+
+    def record_sets(self, user_id: int, sets: list[SetFact]) -> None:
+        """Update everything derived from newly written sets (daily rollup, personal records, goals), or queue it in the outbox."""
+        touch_user(self.db, user_id)
+        if deferred():
+            emit(self.db, "sets.recorded", {"user_id": user_id, "sets": [[workout_id, date.isoformat(), exercise_id, reps, weight] for workout_id, date, exercise_id, reps, weight in sets]})
+            return
+        per_day: dict = {}
+        for _, date, exercise_id, reps, weight in sets:
+            per_day.setdefault(date.date(), []).append((exercise_id, reps, weight))
+        for day, day_sets in per_day.items():
+            self.rollups.apply_sets(user_id, day, day_sets)
+        self.records.apply_sets(user_id, sets)
+        self.goals.apply_sets(user_id, sets)
+
+    def record_workouts(self, user_id: int, workouts: list[WorkoutFact]) -> None:
+        """Update everything derived from newly created workouts (consistency goals), or queue it in the outbox."""
+        if deferred():
+            emit(self.db, "workouts.created", {"user_id": user_id, "workouts": [[workout_id, date.isoformat()] for workout_id, date in workouts]})
+            return
+        self.goals.apply_workouts(user_id, workouts)
+
+    def record_removal(self, user_id: int, date: datetime, exercise_ids, *, workout_removed: bool = False) -> None:
+        """Recompute records and goals after sets (or a whole workout) were deleted and flushed, or queue it in the outbox.
+
+        Inline, the caller has already subtracted the sets from the daily rollup.
+        """
+        touch_user(self.db, user_id)
+        exercise_ids = list(exercise_ids)
+        if deferred():
+            emit(self.db, "sets.removed", {"user_id": user_id, "date": date.isoformat(), "exercise_ids": exercise_ids, "workout_removed": workout_removed})
+            return
+        self.records.recompute(user_id, exercise_ids)
+        self.goals.recompute(user_id, exercise_ids, kinds=EVALUATED_KINDS if workout_removed else SET_KINDS)
+
+    def refresh_derived(self, user_id: int, *, sets: list[SetFact], dates: list[datetime], exercise_ids: set[int], removed_exercise_ids: set[int], workout_dates: list[datetime]) -> None:
+        """Bring derived data up to date for a coalesced batch of changes by recomputing what they touch.
+
+        Used by the outbox worker. Everything here is idempotent, so replaying a
+        change, or applying it after later changes, leaves the same result.
+        ``dates`` covers every set written or removed; ``workout_dates`` every workout created or removed.
+        """
+        touch_user(self.db, user_id)
+        self.rollups.recompute_days(user_id, {d.date() for d in dates})
+        # Exercises that lost sets are rebuilt from scratch, so only fold the others.
+        live = set(self.db.scalars(select(Workout.id).where(Workout.id.in_({fact[0] for fact in sets})))) if sets else set()
+        self.records.apply_sets(user_id, [fact for fact in sets if fact[0] in live and fact[2] not in removed_exercise_ids])
+        self.records.recompute(user_id, removed_exercise_ids)
+        if dates:
+            self.goals.recompute(user_id, exercise_ids | removed_exercise_ids, kinds=SET_KINDS, first=min(dates), last=max(dates))
+        if workout_dates:
+            self.goals.recompute(user_id, kinds=("consistency",), first=min(workout_dates), last=max(workout_dates))
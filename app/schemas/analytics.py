@@ -0,0 +1,90 @@
+"""Pydantic schemas for analytics responses."""
+from datetime import date, datetime
+from typing import Literal
+from pydantic import BaseModel
+
+Bucket = Literal["day", "week", "month", "year"]
+Metric = Literal["volume", "sessions", "sets", "reps", "tonnage"]
+
+
+class WeeklyVolumeRead(BaseModel):
+    weekly_volume: dict[str, int]
+
+
+class MonthlySessionsRead(BaseModel):
+    monthly_sessions: dict[str, int]
+
+
+class SeriesPoint(BaseModel):
+    bucket: str
+    value: float
+
+
+class SeriesRead(BaseModel):
+    user_id: int
+    metric: Metric
+    bucket: Bucket
+    start: datetime
+    end: datetime
+    points: list[SeriesPoint]
+
+
+class E1RMPoint(BaseModel):
+    day: date
+    e1rm: float
+
+
+class ExerciseProgression(BaseModel):
+    exercise_id: int
+    days: int
+    first: float
+    latest: float
+    best: float
+    change_pct: float
+    trend_per_week: float | None
+    points: list[E1RMPoint]
+
+
+class E1RMProgressionRead(BaseModel):
+    user_id: int
+    start: date | None
+    end: date
+    exercises: list[ExerciseProgression]
+
+
+class LoadPoint(BaseModel):
+    day: date
+    load: int
+    acute: int
+    chronic: float
+    acwr: float | None
+
+
+class TrainingLoadRead(BaseModel):
+    user_id: int
+    start: date | None
+    end: date
+    points: list[LoadPoint]
+
+
+class WeekChange(BaseModel):
+    week: date
+    volume: int
+    volume_delta: int | None
+    volume_change_pct: float | None
+    sets: int
+    sets_delta: int | None
+    sets_change_pct: float | None
+    reps: int
+    reps_delta: int | None
+    reps_change_pct: float | None
+    sessions: int
+    sessions_delta: int | None
+    sessions_change_pct: float | None
+
+
+class WeeklyChangesRead(BaseModel):
+    user_id: int
+    start: date | None
+    end: date
+    weeks: list[WeekChange]
@@ -7,6 +7,7 @@ class GoalCreate(BaseModel):
     user_id: int
     title: str
     kind: str
+    exercise_id: int | None = None
     target: int | None = None
     start_date: datetime | None = None
     end_date: datetime | None = None
@@ -17,7 +18,12 @@ class GoalRead(BaseModel):
     user_id: int
     title: str
     kind: str
+    exercise_id: int | None = None
     target: int | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    progress: int = 0
     achieved: bool
+    achieved_at: datetime | None = None
 
     model_config = {"from_attributes": True}
@@ -0,0 +1,31 @@
+"""Pydantic schemas for personal records."""
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class PersonalRecordRead(BaseModel):
+    user_id: int
+    exercise_id: int
+    best_weight: int | None = None
+    best_weight_reps: int | None = None
+    best_weight_workout_id: int | None = None
+    best_weight_at: datetime | None = None
+    best_e1rm: float | None = None
+    best_e1rm_weight: int | None = None
+    best_e1rm_reps: int | None = None
+    best_e1rm_workout_id: int | None = None
+    best_e1rm_at: datetime | None = None
+    best_session_volume: int | None = None
+    best_session_workout_id: int | None = None
+    best_session_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class RepRecordRead(BaseModel):
+    weight: int
+    reps: int
+    workout_id: int | None = None
+    achieved_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
@@ -1,4 +1,6 @@
 """Pydantic schemas for templates."""
+from datetime import datetime
+
 from pydantic import BaseModel
 
 
@@ -16,6 +18,13 @@ class TemplateCreate(BaseModel):
     exercises: list[TemplateExerciseCreate] | None = None
 
 
+class TemplateStart(BaseModel):
+    user_id: int
+    name: str | None = None
+    date: datetime | None = None
+    notes: str | None = None
+
+
 class TemplateRead(BaseModel):
     id: int
     user_id: int | None = None
@@ -23,3 +32,16 @@ class TemplateRead(BaseModel):
     description: str | None = None
 
     model_config = {"from_attributes": True}
+
+
+class TemplateExerciseRead(BaseModel):
+    id: int
+    exercise_id: int
+    exercise_name: str
+    order: int | None = None
+    sets: int | None = None
+    reps: int | None = None
+
+
+class TemplateDetailRead(TemplateRead):
+    exercises: list[TemplateExerciseRead]
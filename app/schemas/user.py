@@ -1,17 +1,24 @@
 """Pydantic schemas for user-related payloads."""
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, WithJsonSchema
+from pydantic.networks import validate_email
+
+# Validates like EmailStr, but email-validator is only imported by the first validation
+# (EmailStr imports it when the schema is built, which costs ~30ms of worker boot).
+Email = Annotated[str, AfterValidator(lambda value: validate_email(value)[1]), WithJsonSchema({"type": "string", "format": "email"})]
 
 
 class UserCreate(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
     username: str | None = None
 
 
 class UserRead(BaseModel):
     id: int
-    email: EmailStr
+    email: Email
     username: str | None = None
     is_active: bool
     created_at: datetime
@@ -18,6 +18,19 @@ class WorkoutCreate(BaseModel):
     notes: str | None = None
 
 
+class WorkoutWithSetsCreate(WorkoutCreate):
+    sets: list[SetCreate] = []
+
+
+class SetBatchCreated(BaseModel):
+    ids: list[int]
+
+
+class WorkoutWithSetsCreated(BaseModel):
+    id: int
+    set_ids: list[int]
+
+
 class SetRead(BaseModel):
     id: int
     exercise_id: int
@@ -34,3 +47,15 @@ class WorkoutRead(BaseModel):
     sets: list[SetRead] = []
 
     model_config = {"from_attributes": True}
+
+
+class ImportReportRead(BaseModel):
+    rows_read: int
+    sets_imported: int
+    workouts_created: int
+    rows_skipped: int
+    chunks_committed: int
+    chunks_failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: list[str]
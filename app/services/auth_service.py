@@ -3,12 +3,13 @@ from datetime import timedelta
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from jose import JWTError
 
 from app.repositories.user_repo import UserRepository
 from app.schemas.user import UserCreate, Token
 from app.core import security, config
+from app.core.hashing import password_hasher
 from app.db.session import get_db
 
 
@@ -17,21 +18,27 @@ class AuthService:
         self.db = db
         self.users = UserRepository(db)
 
-    def register(self, *, user_in: UserCreate):
-        existing = self.users.get_by_email(user_in.email)
+    # bcrypt runs on the dedicated hashing pool; the short DB calls around it use the threadpool.
+
+    async def register(self, *, user_in: UserCreate):
+        existing = await run_in_threadpool(self.users.get_by_email, user_in.email)
         if existing:
             raise HTTPException(status_code=400, detail="Email already registered")
 
-        hashed = security.hash_password(user_in.password)
-        user = self.users.create(email=user_in.email, hashed_password=hashed, username=user_in.username)
+        hashed = await password_hasher.hash(user_in.password)
+        user = await run_in_threadpool(lambda: self.users.create(email=user_in.email, hashed_password=hashed, username=user_in.username))
         return user
 
-    def authenticate(self, *, email: str, password: str):
-        user = self.users.get_by_email(email)
+    async def authenticate(self, *, email: str, password: str):
+        user = await run_in_threadpool(self.users.get_by_email, email)
         if not user:
             return None
-        if not security.verify_password(password, user.hashed_password):
+        valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            # The configured bcrypt cost changed since this hash was made; upgrade it transparently.
+            user = await run_in_threadpool(self.users.update_password, user, new_hash)
         return user
 
     def create_token(self, user_id: int, expires_delta: Optional[timedelta] = None) -> Token:
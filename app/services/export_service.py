@@ -0,0 +1,67 @@
+"""Streaming export of a user's full training history.
+
+Rows come from one joined query over workouts, workout_sets and exercises,
+fetched in ``yield_per`` batches (a server-side cursor where the driver
+supports it), so memory stays flat regardless of history size. The columns
+match what ``import_service`` accepts, so an export can be re-imported.
+"""
+import csv
+import io
+import json
+from typing import Callable, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.exercise import Exercise
+from app.models.workout import Workout, WorkoutSet
+
+FORMATS = ("ndjson", "csv")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+COLUMNS = ("date", "workout", "workout_id", "set_id", "exercise", "exercise_id", "order", "reps", "weight", "rest_seconds")
+
+
+def history_query(user_id: int, batch_size: int):
+    return (
+        select(Workout.date, Workout.name, Workout.id, WorkoutSet.id, Exercise.name, WorkoutSet.exercise_id, WorkoutSet.order, WorkoutSet.reps, WorkoutSet.weight, WorkoutSet.rest_seconds)
+        .join(WorkoutSet, WorkoutSet.workout_id == Workout.id)
+        .join(Exercise, Exercise.id == WorkoutSet.exercise_id)
+        .where(Workout.user_id == user_id)
+        .order_by(Workout.date, Workout.id, WorkoutSet.order, WorkoutSet.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def _ndjson_chunk(rows) -> bytes:
+    lines = []
+    for row in rows:
+        record = dict(zip(COLUMNS, row))
+        record["date"] = record["date"].isoformat() if record["date"] else None
+        lines.append(json.dumps(record, separators=(",", ":")))
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def _csv_chunk(rows) -> bytes:
+    buf = io.StringIO()
+    csv.writer(buf).writerows((row[0].isoformat() if row[0] else "", *row[1:]) for row in rows)
+    return buf.getvalue().encode()
+
+
+def stream_history(session_factory: Callable[[], Session], user_id: int, fmt: str = "ndjson", batch_size: int = 2000) -> Iterator[bytes]:
+    """Yield the export as encoded chunks, one per fetched batch.
+
+    The generator owns its session because it outlives the request-scoped one.
+    """
+    encode = _csv_chunk if fmt == "csv" else _ndjson_chunk
+    if fmt == "csv":
+        buf = io.StringIO()
+        csv.writer(buf).writerow(COLUMNS)
+        yield buf.getvalue().encode()
+    db = session_factory()
+    try:
+        result = db.execute(history_query(user_id, batch_size))
+        for rows in result.partitions():
+            yield encode(rows)
+    finally:
+        db.close()
@@ -9,8 +9,8 @@ class GoalService:
         self.db = db
         self.repo = GoalRepository(db)
 
-    def create_goal(self, user_id: int, title: str, kind: str, target: int | None = None, start_date=None, end_date=None):
-        return self.repo.create(user_id=user_id, title=title, kind=kind, target=target, start_date=start_date, end_date=end_date)
+    def create_goal(self, user_id: int, title: str, kind: str, target: int | None = None, start_date=None, end_date=None, exercise_id: int | None = None):
+        return self.repo.create(user_id=user_id, title=title, kind=kind, target=target, start_date=start_date, end_date=end_date, exercise_id=exercise_id)
 
-    def list_goals(self, user_id: int):
-        return self.repo.list_for_user(user_id)
+    def list_goals(self, user_id: int, *, limit: int, after_id: int | None = None):
+        return self.repo.list_for_user(user_id, limit=limit, after_id=after_id)
@@ -0,0 +1,194 @@
+"""Streaming import of historical workout logs from CSV or NDJSON.
+
+Records are parsed one at a time from a text stream and written in chunks:
+each chunk bulk-inserts its new workouts and sets and commits on its own, so
+a bad chunk is rolled back without touching chunks committed before it.
+
+Each record describes one set::
+
+    {"date": "2023-01-05", "workout": "Push", "exercise": "Bench Press",
+     "reps": 5, "weight": 80, "rest_seconds": 120, "order": 1}
+
+Records sharing ``date`` and ``workout`` belong to the same workout. A
+record that cannot be parsed or is not an object is skipped and reported
+like any other invalid record.
+"""
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, TextIO
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.workout import Workout, WorkoutSet
+from app.repositories.workout_repo import WorkoutRepository, insert_returning_ids
+from app.repositories.exercise_catalog import exercise_catalog, normalize_name
+
+FORMATS = ("csv", "ndjson")
+MAX_REPORTED_ERRORS = 50
+
+
+@dataclass
+class ImportReport:
+    rows_read: int = 0
+    sets_imported: int = 0
+    workouts_created: int = 0
+    rows_skipped: int = 0
+    chunks_committed: int = 0
+    chunks_failed: int = 0
+    elapsed_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def error(self, message: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def as_dict(self) -> dict:
+        return {
+            "rows_read": self.rows_read,
+            "sets_imported": self.sets_imported,
+            "workouts_created": self.workouts_created,
+            "rows_skipped": self.rows_skipped,
+            "chunks_committed": self.chunks_committed,
+            "chunks_failed": self.chunks_failed,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "errors": self.errors,
+        }
+
+
+def iter_csv(stream: TextIO) -> Iterator[dict]:
+    yield from csv.DictReader(stream)
+
+
+def iter_ndjson(stream: TextIO) -> Iterator[str]:
+    """Non-blank lines, unparsed: ``import_records`` decodes each one so a bad line only skips that record."""
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[dict | str]:
+    if fmt == "csv":
+        return iter_csv(stream)
+    if fmt == "ndjson":
+        return iter_ndjson(stream)
+    raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def _to_int(value) -> int | None:
+    if value is None or value == "":
+        return None
+    return int(round(float(value)))
+
+
+def _to_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date or datetime; offsets are converted to naive UTC, as dates are stored."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class ImportService:
+    def __init__(self, db: Session, chunk_size: int = 1000, on_progress: Callable[[ImportReport], None] | None = None):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.workouts = WorkoutRepository(db)
+
+    def import_records(self, user_id: int, records: Iterable[dict | str]) -> ImportReport:
+        report = ImportReport()
+        exercises = exercise_catalog.name_map(self.db)
+        refreshed = False
+        workouts: dict[tuple[str, str], tuple[int, datetime]] = {}
+        started = time.perf_counter()
+        chunk: list[tuple[tuple[str, str], datetime, str | None, dict]] = []
+
+        for line_no, record in enumerate(records, start=1):
+            report.rows_read += 1
+            try:
+                if isinstance(record, str):
+                    record = json.loads(record)
+                if not isinstance(record, dict):
+                    raise ValueError(f"expected an object, got {type(record).__name__}")
+                exercise_key = normalize_name(str(record.get("exercise") or ""))
+                exercise_id = exercises.get(exercise_key)
+                if exercise_id is None and not refreshed:
+                    # The cached catalog may predate exercises added elsewhere; reload it once per import.
+                    exercise_catalog.load(self.db)
+                    exercises, refreshed = exercise_catalog.name_map(self.db), True
+                    exercise_id = exercises.get(exercise_key)
+                if exercise_id is None:
+                    raise ValueError(f"unknown exercise {record.get('exercise')!r}")
+                date = _to_datetime(str(record["date"]).strip())
+                name = record.get("workout") or None
+                chunk.append(
+                    (
+                        (date.isoformat(), name or ""),
+                        date,
+                        name,
+                        {
+                            "exercise_id": exercise_id,
+                            "reps": _to_int(record.get("reps")),
+                            "weight": _to_int(record.get("weight")),
+                            "rest_seconds": _to_int(record.get("rest_seconds")),
+                            "order": _to_int(record.get("order")),
+                        },
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as exc:
+                report.rows_skipped += 1
+                report.error(f"record {line_no}: {exc}")
+            if len(chunk) >= self.chunk_size:
+                self._flush(user_id, chunk, workouts, report, started)
+                chunk = []
+        if chunk:
+            self._flush(user_id, chunk, workouts, report, started)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def _flush(self, user_id: int, chunk, workouts: dict, report: ImportReport, started: float) -> None:
+        new_keys = []
+        try:
+            pending = {}
+            for key, date, name, _ in chunk:
+                if key not in workouts and key not in pending:
+                    pending[key] = {"user_id": user_id, "date": date, "name": name}
+            if pending:
+                ids = insert_returning_ids(self.db, Workout, list(pending.values()))
+                for key, workout_id in zip(pending, ids):
+                    workouts[key] = (workout_id, pending[key]["date"])
+                    new_keys.append(key)
+                self.workouts.record_workouts(user_id, [workouts[key] for key in new_keys])
+
+            rows = []
+            facts = []
+            for key, _, _, values in chunk:
+                workout_id, date = workouts[key]
+                rows.append({**values, "workout_id": workout_id})
+                facts.append((workout_id, date, values["exercise_id"], values["reps"], values["weight"]))
+            self.db.execute(insert(WorkoutSet), rows)
+            self.workouts.record_sets(user_id, facts)
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            for key in new_keys:
+                workouts.pop(key, None)
+            report.chunks_failed += 1
+            report.rows_skipped += len(chunk)
+            report.error(f"chunk {report.chunks_committed + report.chunks_failed}: {str(exc):.200}")
+        else:
+            report.chunks_committed += 1
+            report.workouts_created += len(new_keys)
+            report.sets_imported += len(chunk)
+        report.elapsed_seconds = time.perf_counter() - started
+        if self.on_progress:
+            self.on_progress(report)
@@ -0,0 +1,214 @@
+"""Background worker that drains the outbox.
+
+Events are claimed oldest first in batches. Each handler receives all of a
+batch's events for its topics at once, so it can coalesce them, and must be
+idempotent: a batch is applied and marked processed in one transaction, and
+may be delivered again if that transaction fails or another worker process
+claims the same rows. When a batch fails, its events are retried one at a
+time so a single bad event cannot hold up the rest; failing events back off
+exponentially and are parked (``failed_at``) after ``OUTBOX_MAX_ATTEMPTS``.
+
+The worker runs as an asyncio task in the app's event loop and does the
+database work in a thread. It polls every ``OUTBOX_POLL_INTERVAL_SECONDS``
+and is also woken right after any local commit that emitted events, then
+waits ``OUTBOX_COALESCE_SECONDS`` so a burst of writes becomes one batch.
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import OUTBOX_BATCH_SIZE, OUTBOX_COALESCE_SECONDS, OUTBOX_POLL_INTERVAL_SECONDS, OUTBOX_RETENTION_SECONDS
+from app.core.metrics import metrics
+from app.db.session import SessionLocal
+from app.models.outbox import OutboxEvent
+from app.repositories import outbox_repo
+from app.repositories.outbox_repo import OutboxRepository
+from app.repositories.workout_repo import WorkoutRepository
+
+logger = logging.getLogger("app.outbox")
+
+PRUNE_INTERVAL_SECONDS = 60.0
+
+Handler = Callable[[Session, list[OutboxEvent]], None]
+HANDLERS: dict[str, Handler] = {}
+
+
+def handles(*topics: str) -> Callable[[Handler], Handler]:
+    def register(handler: Handler) -> Handler:
+        for topic in topics:
+            HANDLERS[topic] = handler
+        return handler
+
+    return register
+
+
+@handles("sets.recorded", "workouts.created", "sets.removed")
+def refresh_derived_data(db: Session, events: list[OutboxEvent]) -> None:
+    """Coalesce workout and set changes per user into one round of recomputes."""
+    changes: dict[int, dict] = defaultdict(lambda: {"sets": [], "dates": [], "exercise_ids": set(), "removed_exercise_ids": set(), "workout_dates": []})
+    for event in events:
+        payload = event.payload
+        change = changes[payload["user_id"]]
+        if event.topic == "sets.recorded":
+            for workout_id, date, exercise_id, reps, weight in payload["sets"]:
+                at = datetime.fromisoformat(date)
+                change["sets"].append((workout_id, at, exercise_id, reps, weight))
+                change["dates"].append(at)
+                change["exercise_ids"].add(exercise_id)
+        elif event.topic == "workouts.created":
+            change["workout_dates"].extend(datetime.fromisoformat(date) for _, date in payload["workouts"])
+        else:
+            at = datetime.fromisoformat(payload["date"])
+            change["dates"].append(at)
+            change["removed_exercise_ids"].update(payload["exercise_ids"])
+            if payload["workout_removed"]:
+                change["workout_dates"].append(at)
+    workouts = WorkoutRepository(db)
+    for user_id, change in changes.items():
+        workouts.refresh_derived(user_id, **change)
+
+
+class OutboxWorker:
+    def __init__(self, session_factory: sessionmaker = SessionLocal, batch_size: int = OUTBOX_BATCH_SIZE, poll_interval: float = OUTBOX_POLL_INTERVAL_SECONDS, coalesce_delay: float = OUTBOX_COALESCE_SECONDS):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.coalesce_delay = coalesce_delay
+        self.backlog = 0
+        self.oldest: datetime | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._last_check = self._last_prune = float("-inf")
+
+    def oldest_age(self) -> float:
+        return (datetime.utcnow() - self.oldest).total_seconds() if self.oldest else 0.0
+
+    def _session(self) -> Session:
+        db = self.session_factory()
+        # Claims, handler reads and writes all go to the writer so they share one snapshot.
+        db.info["wrote"] = True
+        return db
+
+    def drain_once(self) -> int:
+        """Process one batch; returns the number of events claimed."""
+        with self._session() as db:
+            repo = OutboxRepository(db)
+            events = repo.claim(self.batch_size)
+            if not events:
+                return 0
+            try:
+                self._dispatch(db, events)
+                repo.mark_processed(events)
+                db.commit()
+            except Exception:
+                db.rollback()
+                logger.exception("outbox batch of %d events failed, retrying one at a time", len(events))
+                for event in events:
+                    self._process_alone(db, repo, event)
+            else:
+                self._observe(events, "processed")
+            return len(events)
+
+    def _process_alone(self, db: Session, repo: OutboxRepository, event: OutboxEvent) -> None:
+        try:
+            self._dispatch(db, [event])
+            repo.mark_processed([event])
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            exhausted = repo.mark_failed(event, f"{type(exc).__name__}: {exc}")
+            db.commit()
+            logger.warning("outbox event %s (%s) failed%s: %s", event.id, event.topic, ", giving up" if exhausted else "", exc)
+            metrics.inc("outbox_events_total", (event.topic, "failed" if exhausted else "retried"))
+        else:
+            self._observe([event], "processed")
+
+    def _dispatch(self, db: Session, events: list[OutboxEvent]) -> None:
+        by_handler: dict[Handler, list[OutboxEvent]] = defaultdict(list)
+        for event in events:
+            handler = HANDLERS.get(event.topic)
+            if handler is None:
+                raise LookupError(f"no outbox handler for topic {event.topic!r}")
+            by_handler[handler].append(event)
+        for handler, handled in by_handler.items():
+            handler(db, handled)
+
+    def _observe(self, events: list[OutboxEvent], outcome: str) -> None:
+        now = datetime.utcnow()
+        for event in events:
+            metrics.inc("outbox_events_total", (event.topic, outcome))
+            metrics.observe("outbox_lag_seconds", (event.topic,), (now - event.created_at).total_seconds())
+
+    def drain(self) -> int:
+        """Process batches until nothing is due; returns the number of events claimed."""
+        total = 0
+        while True:
+            claimed = self.drain_once()
+            total += claimed
+            if claimed < self.batch_size:
+                return total
+
+    def check_backlog(self) -> None:
+        self._last_check = time.monotonic()
+        with self._session() as db:
+            repo = OutboxRepository(db)
+            self.backlog, self.oldest = repo.backlog()
+            if time.monotonic() - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+                self._last_prune = time.monotonic()
+                repo.prune(datetime.utcnow() - timedelta(seconds=OUTBOX_RETENTION_SECONDS))
+            db.commit()
+
+    def wake(self) -> None:
+        """Thread-safe nudge to drain now rather than at the next poll."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                claimed = await asyncio.to_thread(self.drain_once)
+                if time.monotonic() - self._last_check >= self.poll_interval:
+                    await asyncio.to_thread(self.check_backlog)
+            except Exception:
+                logger.exception("outbox worker iteration failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                    # Let the rest of a burst of writes arrive so it is handled as one batch.
+                    await asyncio.sleep(self.coalesce_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        outbox_repo.listeners.append(self.wake)
+        self._task = asyncio.create_task(self.run(), name="outbox-worker")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        outbox_repo.listeners.remove(self.wake)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = self._loop = self._wake = None
+
+
+outbox_worker = OutboxWorker()
+metrics.counter("outbox_events_total", "Outbox events handled, by topic and outcome.", ("topic", "outcome"))
+metrics.histogram("outbox_lag_seconds", "Time from an outbox event being written to being processed.", ("topic",), buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0))
+metrics.gauge("outbox_backlog", "Outbox events waiting to be processed, as of the worker's last check.", callback=lambda: {(): outbox_worker.backlog})
+metrics.gauge("outbox_oldest_age_seconds", "Age of the oldest unprocessed outbox event, as of the worker's last check.", callback=lambda: {(): outbox_worker.oldest_age()})
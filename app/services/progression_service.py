@@ -0,0 +1,190 @@
+"""Progression analytics over a user's set history, vectorized with NumPy.
+
+Each request loads the sets it needs as columns in one query
+(``ProgressionRepository.set_columns``) and computes its metrics with
+sorts, ``reduceat`` group reductions, ``bincount`` and cumulative sums,
+never looping over sets in Python:
+
+- estimated 1RM (Epley) per exercise: the best set of each day, with the
+  least-squares trend in kg per week
+- training load: daily volume (weight x reps), 7-day acute load, 28-day
+  chronic load (as a weekly average) and their ratio, the ACWR
+- weekly totals (weeks start on Monday) with week-over-week deltas
+"""
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.repositories.progression_repo import ProgressionRepository, SetColumns, epoch_day
+
+# Epley overestimates more and more beyond this many reps, so such sets are left out of e1RM
+E1RM_MAX_REPS = 12
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+
+def estimated_1rm(weight: np.ndarray, reps: np.ndarray) -> np.ndarray:
+    """Epley: ``weight * (1 + reps / 30)``; a single is its own 1RM."""
+    return np.where(reps == 1, weight, weight * (1 + reps / 30))
+
+
+def _dates(days: np.ndarray) -> list[date]:
+    return days.astype("datetime64[D]").tolist()
+
+
+def _rounded(values: np.ndarray, digits: int) -> list:
+    """``values`` rounded (to ints for ``digits=0``), as a list with ``None`` for NaN."""
+    rounded = np.round(values, digits)
+    out = (np.nan_to_num(rounded).astype(np.int64) if digits == 0 else rounded).astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+def _run_starts(*keys: np.ndarray) -> np.ndarray:
+    """Indexes where any of the (sorted) ``keys`` changes value, starting with 0."""
+    changed = np.zeros(len(keys[0]), dtype=bool)
+    changed[0] = True
+    for key in keys:
+        changed[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(changed)
+
+
+def e1rm_by_exercise(columns: SetColumns) -> list[dict]:
+    """Daily best e1RM per exercise, with the first, latest and best values and the trend per week."""
+    usable = (columns.reps > 0) & (columns.reps <= E1RM_MAX_REPS) & (columns.weight > 0)
+    if not usable.any():
+        return []
+    exercise, day = columns.exercise_id[usable], columns.day[usable]
+    value = estimated_1rm(columns.weight[usable].astype(np.float64), columns.reps[usable])
+    order = np.lexsort((day, exercise))
+    exercise, day, value = exercise[order], day[order], value[order]
+
+    days = _run_starts(exercise, day)
+    exercise, day, best = exercise[days], day[days], np.maximum.reduceat(value, days)
+
+    # Least-squares slope of daily best against time, per exercise, from grouped sums
+    groups = _run_starts(exercise)
+    n = np.diff(np.append(groups, len(day)))
+    weeks = (day - day[0]) / 7.0
+    sx, sy = np.add.reduceat(weeks, groups), np.add.reduceat(best, groups)
+    sxx, sxy = np.add.reduceat(weeks * weeks, groups), np.add.reduceat(weeks * best, groups)
+    spread = n * sxx - sx * sx
+    trend = np.divide(n * sxy - sx * sy, spread, out=np.full(len(groups), np.nan), where=spread > 1e-9)
+    first, latest = best[groups], best[np.append(groups[1:], len(best)) - 1]
+    change = (latest - first) / first * 100
+
+    dates, points = _dates(day), np.round(best, 1).tolist()
+    ends = np.append(groups[1:], len(day)).tolist()
+    return [
+        {
+            "exercise_id": exercise_id,
+            "days": count,
+            "first": first_value,
+            "latest": latest_value,
+            "best": best_value,
+            "change_pct": change_pct,
+            "trend_per_week": trend_value,
+            "points": [{"day": d, "e1rm": v} for d, v in zip(dates[lo:hi], points[lo:hi])],
+        }
+        for exercise_id, count, first_value, latest_value, best_value, change_pct, trend_value, lo, hi in zip(
+            exercise[groups].tolist(),
+            n.tolist(),
+            np.round(first, 1).tolist(),
+            np.round(latest, 1).tolist(),
+            np.round(np.maximum.reduceat(best, groups), 1).tolist(),
+            np.round(change, 1).tolist(),
+            _rounded(trend, 2),
+            groups.tolist(),
+            ends,
+        )
+    ]
+
+
+def load_by_day(columns: SetColumns, first: int, end: int) -> list[dict]:
+    """Daily load with acute, chronic and ACWR for epoch days ``first <= day < end``.
+
+    ``columns`` must reach back ``CHRONIC_DAYS - 1`` days before ``first``. The ratio is
+    left out (``None``) until the history covers a whole chronic window, and while the
+    chronic load is zero.
+    """
+    origin = first - (CHRONIC_DAYS - 1)
+    size = end - origin
+    offset = columns.day - origin
+    inside = (offset >= 0) & (offset < size)
+    load = np.bincount(offset[inside], weights=(columns.weight * columns.reps)[inside].astype(np.float64), minlength=size)
+
+    total = np.concatenate(([0.0], np.cumsum(load)))
+    upto = np.arange(1, size + 1)
+    acute = total[upto] - total[np.maximum(upto - ACUTE_DAYS, 0)]
+    chronic = (total[upto] - total[np.maximum(upto - CHRONIC_DAYS, 0)]) * (ACUTE_DAYS / CHRONIC_DAYS)
+    ratio = np.divide(acute, chronic, out=np.full(size, np.nan), where=chronic > 0)
+    if inside.any():
+        ratio[: offset[inside].min() + CHRONIC_DAYS - 1] = np.nan
+    else:
+        ratio[:] = np.nan
+
+    shown = slice(CHRONIC_DAYS - 1, size)
+    return [
+        {"day": d, "load": int(l), "acute": int(a), "chronic": c, "acwr": r}
+        for d, l, a, c, r in zip(
+            _dates(np.arange(first, end)),
+            load[shown].tolist(),
+            acute[shown].tolist(),
+            np.round(chronic[shown], 1).tolist(),
+            _rounded(ratio[shown], 2),
+        )
+    ]
+
+
+def weekly_changes(columns: SetColumns) -> list[dict]:
+    """Totals per Monday-started week, every week from the first to the last, with changes from the week before."""
+    if not len(columns.day):
+        return []
+    # 1970-01-01 was a Thursday, so (day + 3) % 7 is the number of days since Monday.
+    monday = columns.day - (columns.day + 3) % 7
+    first = monday.min()
+    week = (monday - first) // 7
+    size = int(week.max()) + 1
+    totals = {
+        "volume": np.bincount(week, weights=(columns.weight * columns.reps).astype(np.float64), minlength=size),
+        "sets": np.bincount(week, minlength=size).astype(np.float64),
+        "reps": np.bincount(week, weights=columns.reps.astype(np.float64), minlength=size),
+        # Every set of a workout falls in the same week, so one set per workout counts sessions.
+        "sessions": np.bincount(week[np.unique(columns.workout_id, return_index=True)[1]], minlength=size).astype(np.float64),
+    }
+    rows = {"week": _dates(np.arange(first, first + 7 * size, 7))}
+    for name, values in totals.items():
+        previous = np.concatenate(([np.nan], values[:-1]))
+        rows[name] = values.astype(np.int64).tolist()
+        rows[f"{name}_delta"] = _rounded(values - previous, 0)
+        rows[f"{name}_change_pct"] = _rounded(np.divide(values - previous, previous, out=np.full(size, np.nan), where=previous > 0) * 100, 1)
+    return [dict(zip(rows, values)) for values in zip(*rows.values())]
+
+
+class ProgressionService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = ProgressionRepository(db)
+
+    def e1rm(self, user_id: int, *, start: date | None, end: date, exercise_id: int | None = None) -> dict:
+        columns = self.repo.set_columns(user_id, start=start, end=end, exercise_id=exercise_id)
+        return {"user_id": user_id, "start": start, "end": end, "exercises": e1rm_by_exercise(columns)}
+
+    def training_load(self, user_id: int, *, start: date | None, end: date) -> dict:
+        """Daily load from ``start`` (default: the first day with sets) up to ``end``."""
+        columns = self.repo.set_columns(user_id, start=start - timedelta(days=CHRONIC_DAYS - 1) if start else None, end=end)
+        last = epoch_day(end)
+        if start is not None:
+            first = epoch_day(start)
+        else:
+            first = int(columns.day.min()) if len(columns.day) else last
+        points = load_by_day(columns, first, last) if first < last else []
+        return {"user_id": user_id, "start": start, "end": end, "points": points}
+
+    def weekly(self, user_id: int, *, start: date | None, end: date) -> dict:
+        """Weekly totals and deltas; ``start`` is moved back to its Monday so the first week is whole."""
+        if start is not None:
+            start -= timedelta(days=start.weekday())
+        columns = self.repo.set_columns(user_id, start=start, end=end)
+        return {"user_id": user_id, "start": start, "end": end, "weeks": weekly_changes(columns)}
@@ -1,7 +1,10 @@
 """Service layer for templates."""
 from sqlalchemy.orm import Session
 
-from app.repositories.template_repo import TemplateRepository
+from app.models.workout import Workout
+from app.repositories.template_library import template_library
+from app.repositories.template_repo import TemplateRepository, planned_sets, template_detail
+from app.repositories.workout_repo import WorkoutRepository
 
 
 class TemplateService:
@@ -9,11 +12,36 @@ class TemplateService:
         self.db = db
         self.repo = TemplateRepository(db)
 
-    def create_template(self, user_id: int | None, name: str, description: str | None = None):
-        return self.repo.create(user_id=user_id, name=name, description=description)
+    def create_template(self, user_id: int | None, name: str, description: str | None = None, exercises: list[dict] | None = None):
+        return self.repo.create(user_id=user_id, name=name, description=description, exercises=exercises)
 
     def add_exercise(self, template_id: int, exercise_id: int, order: int | None = None, sets: int | None = None, reps: int | None = None):
         template = self.repo.get(template_id)
         if not template:
             raise ValueError("Template not found")
         return self.repo.add_exercise(template, exercise_id=exercise_id, order=order, sets=sets, reps=reps)
+
+    def start_workout(self, template_id: int, user_id: int, name: str | None = None, date=None, notes: str | None = None) -> tuple[Workout, list[dict]]:
+        """Create a workout from a public template or one of the user's own, with every planned set, in one transaction."""
+        template = self.repo.get_with_exercises(template_id)
+        if not template or template.user_id not in (None, user_id):
+            raise ValueError("Template not found")
+        sets = planned_sets(template)
+        workout, ids = WorkoutRepository(self.db).create_with_sets(user_id=user_id, name=name or template.name, date=date, notes=notes, sets=sets, template_id=template.id)
+        return workout, [{"id": set_id, **s} for set_id, s in zip(ids, sets)]
+
+    def get_template(self, template_id: int, user_id: int | None = None) -> dict:
+        """A public template or one of the user's own, with its ordered exercises; public templates come from the in-memory library."""
+        detail = template_library.get(self.db, template_id)
+        if detail is None:
+            template = self.repo.get_detail(template_id)
+            if not template or template.user_id not in (None, user_id):
+                raise ValueError("Template not found")
+            detail = template_detail(template)
+        return detail
+
+    def list_public(self, *, limit: int, after_id: int | None = None) -> list[dict]:
+        return template_library.page(self.db, limit=limit, after_id=after_id)
+
+    def list_templates(self, user_id: int, *, limit: int, after_id: int | None = None):
+        return self.repo.list_for_user(user_id, limit=limit, after_id=after_id)
@@ -14,8 +14,36 @@ class WorkoutService:
     def create_workout(self, user_id: int, name: str | None = None, date=None, notes: str | None = None) -> Workout:
         return self.repo.create(user_id=user_id, name=name, date=date, notes=notes)
 
+    def get_workout(self, workout_id: int, *, with_sets: bool = False) -> Workout | None:
+        return self.repo.get(workout_id, with_sets=with_sets)
+
+    def list_workouts(self, user_id: int, *, limit: int, after=None) -> list[Workout]:
+        return self.repo.list_for_user(user_id, limit=limit, after=after)
+
     def add_set(self, workout_id: int, exercise_id: int, reps: int | None = None, weight: int | None = None, rest_seconds: int | None = None, order: int | None = None):
         workout = self.repo.get(workout_id)
         if not workout:
             raise ValueError("Workout not found")
         return self.repo.add_set(workout, exercise_id=exercise_id, reps=reps, weight=weight, rest_seconds=rest_seconds, order=order)
+
+    def add_sets(self, workout_id: int, sets: list[dict]) -> list[int]:
+        workout = self.repo.get(workout_id)
+        if not workout:
+            raise ValueError("Workout not found")
+        return self.repo.add_sets(workout, sets)
+
+    def create_workout_with_sets(self, user_id: int, sets: list[dict], name: str | None = None, date=None, notes: str | None = None) -> tuple[Workout, list[int]]:
+        return self.repo.create_with_sets(user_id=user_id, name=name, date=date, notes=notes, sets=sets)
+
+    def delete_set(self, workout_id: int, set_id: int) -> None:
+        workout = self.repo.get(workout_id)
+        wset = self.repo.get_set(workout, set_id) if workout else None
+        if not wset:
+            raise ValueError("Set not found")
+        self.repo.delete_set(workout, wset)
+
+    def delete_workout(self, workout_id: int) -> None:
+        workout = self.repo.get(workout_id)
+        if not workout:
+            raise ValueError("Workout not found")
+        self.repo.delete(workout)
@@ -0,0 +1,115 @@
+"""Compare the sync and async database modes under concurrent load.
+
+For each mode, starts uvicorn against a fresh SQLite file (``sqlite://`` vs
+``sqlite+aiosqlite://``), seeds a user, an exercise and a workout with sets
+(any failed seed request aborts the run), then runs
+``--concurrency`` clients for ``--duration`` seconds issuing a mix of
+``GET /workouts/{id}`` and ``POST /workouts/{id}/sets``. Prints requests/s
+and latency percentiles per mode as JSON.
+
+Usage: python -m benchmarks.async_vs_sync --concurrency 64 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+API = "/api/v1"
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def start_server(database_url: str, port: int) -> subprocess.Popen:
+    env = {**os.environ, "DATABASE_URL": database_url}
+    proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"], env=env)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs", timeout=1)
+            return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("server did not start")
+
+
+def seed_exercise(db_path: str) -> int:
+    """Add the exercise the load writes sets for; there is no endpoint for it and the server's catalog reloads on an unknown id."""
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            return conn.execute("INSERT INTO exercises (name, category) VALUES ('Squat', 'Strength')").lastrowid
+    finally:
+        conn.close()
+
+
+async def drive(base_url: str, concurrency: int, duration: float, write_ratio: float, exercise_id: int) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, limits=httpx.Limits(max_connections=concurrency), timeout=30) as client:
+        user = await client.post(f"{API}/auth/register", json={"email": "bench@example.com", "password": "bench-password"})
+        workout = await client.post(f"{API}/workouts/", json={"user_id": user.raise_for_status().json()["id"]})
+        workout_id = workout.raise_for_status().json()["id"]
+        new_set = {"exercise_id": exercise_id, "reps": 5, "weight": 100}
+        (await client.post(f"{API}/workouts/{workout_id}/sets/batch", json=[new_set] * 20)).raise_for_status()
+
+        latencies: list[float] = []
+        errors = 0
+        stop = time.perf_counter() + duration
+
+        async def worker(seed: int):
+            nonlocal errors
+            rng = random.Random(seed)
+            while time.perf_counter() < stop:
+                t0 = time.perf_counter()
+                if rng.random() < write_ratio:
+                    resp = await client.post(f"{API}/workouts/{workout_id}/sets", json=new_set)
+                else:
+                    resp = await client.get(f"{API}/workouts/{workout_id}")
+                latencies.append(time.perf_counter() - t0)
+                errors += resp.status_code >= 400
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async DB modes")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    results = {}
+    for mode, scheme in (("sync", "sqlite"), ("async", "sqlite+aiosqlite")):
+        with tempfile.TemporaryDirectory() as tmp:
+            proc = start_server(f"{scheme}:///{tmp}/bench.db", args.port)
+            try:
+                exercise_id = seed_exercise(f"{tmp}/bench.db")
+                results[mode] = asyncio.run(drive(f"http://127.0.0.1:{args.port}", args.concurrency, args.duration, args.write_ratio, exercise_id))
+            finally:
+                proc.terminate()
+                proc.wait()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Fast synthetic data generator for benchmarks.
+
+Bulk-creates users, workouts and sets with Core inserts and then rebuilds the
+daily rollup and personal records once. The shape is meant to look like real training logs:
+
+- workouts per user are log-normal around ``--workouts-per-user``, so a few
+  users are power users
+- sessions are 1-4 days apart, ending today
+- each session trains 3-6 exercises for 2-5 sets each
+- weights start from a per-user, per-exercise base and creep upward, with
+  reps falling as the load rises
+
+Every user's password is ``PASSWORD``. The hash is computed once, at the
+configured bcrypt cost.
+
+Usage: python -m benchmarks.datagen --db /tmp/gym_bench.db --users 200 --workouts-per-user 60
+"""
+import argparse
+import math
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+PASSWORD = "benchmark-password"
+MUSCLE_GROUPS = {
+    "Chest": ["Bench Press", "Incline Bench Press", "Dumbbell Fly", "Dips"],
+    "Back": ["Deadlift", "Barbell Row", "Pull Up", "Lat Pulldown", "Seated Cable Row"],
+    "Legs": ["Back Squat", "Front Squat", "Leg Press", "Romanian Deadlift", "Lunge", "Leg Curl"],
+    "Shoulders": ["Overhead Press", "Lateral Raise", "Face Pull"],
+    "Arms": ["Barbell Curl", "Hammer Curl", "Triceps Pushdown", "Skull Crusher"],
+    "Core": ["Plank", "Hanging Leg Raise", "Cable Crunch"],
+}
+BATCH = 20_000
+
+
+def user_email(index: int) -> str:
+    return f"bench-user-{index}@example.com"
+
+
+def generate(users: int, workouts_per_user: int, seed: int = 42) -> dict:
+    """Populate the database named by ``DATABASE_URL``; returns counts and timings."""
+    from sqlalchemy import insert
+
+    import app.models  # noqa: F401
+    from app.core.security import hash_password
+    from app.db.base import Base
+    from app.db.session import SessionLocal, engine
+    from app.models.exercise import Exercise
+    from app.models.user import User
+    from app.models.workout import Workout, WorkoutSet
+    from app.repositories.record_repo import PersonalRecordRepository
+    from app.repositories.rollup_repo import RollupRepository
+
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    Base.metadata.create_all(bind=engine)
+    hashed = hash_password(PASSWORD)
+    now = datetime.utcnow().replace(microsecond=0)
+    exercise_rows = [{"name": name, "muscle_group": group, "category": "Strength"} for group, names in MUSCLE_GROUPS.items() for name in names]
+
+    with SessionLocal() as db:
+        db.execute(insert(Exercise), exercise_rows)
+        db.execute(insert(User), [{"email": user_email(i), "hashed_password": hashed, "is_active": True, "created_at": now} for i in range(users)])
+        db.commit()
+
+        sigma = 0.6
+        workout_rows = []
+        plans = []
+        for user_id in range(1, users + 1):
+            count = max(1, int(rng.lognormvariate(math.log(workouts_per_user) - sigma**2 / 2, sigma)))
+            day = now
+            for _ in range(count):
+                day -= timedelta(days=rng.choice((1, 1, 2, 2, 2, 3, 4)), minutes=rng.randint(0, 240))
+                workout_rows.append({"user_id": user_id, "name": rng.choice(("Push", "Pull", "Legs", "Upper", "Lower", "Full Body")), "date": day})
+            plans.append((user_id, count))
+        for i in range(0, len(workout_rows), BATCH):
+            db.execute(insert(Workout), workout_rows[i : i + BATCH])
+        db.commit()
+
+        n_exercises = len(exercise_rows)
+        sets = []
+        n_sets = 0
+        workout_id = 0
+        for user_id, count in plans:
+            base = {e: rng.lognormvariate(math.log(50), 0.5) for e in range(1, n_exercises + 1)}
+            # rows were inserted newest first, so progression runs backwards over the ids
+            for k in range(count):
+                workout_id += 1
+                progress = 1 + 0.25 * (count - k) / count
+                order = 0
+                for exercise_id in rng.sample(range(1, n_exercises + 1), rng.randint(3, 6)):
+                    weight = base[exercise_id] * progress
+                    for _ in range(rng.randint(2, 5)):
+                        order += 1
+                        load = weight * rng.uniform(0.9, 1.05)
+                        sets.append({"workout_id": workout_id, "exercise_id": exercise_id, "reps": max(1, int(rng.gauss(14 - load / 15, 2))), "weight": int(load), "rest_seconds": rng.choice((60, 90, 120, 180)), "order": order})
+                if len(sets) >= BATCH:
+                    db.execute(insert(WorkoutSet), sets)
+                    n_sets += len(sets)
+                    sets = []
+        if sets:
+            db.execute(insert(WorkoutSet), sets)
+            n_sets += len(sets)
+        db.commit()
+        RollupRepository(db).rebuild()
+        PersonalRecordRepository(db).rebuild()
+
+    return {"users": users, "workouts": len(workout_rows), "sets": n_sets, "seconds": round(time.perf_counter() - started, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark database")
+    parser.add_argument("--db", default="/tmp/gym_bench.db")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--workouts-per-user", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(args.db + suffix):
+            os.remove(args.db + suffix)
+    os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+    print(generate(args.users, args.workouts_per_user, args.seed))
+
+
+if __name__ == "__main__":
+    main()
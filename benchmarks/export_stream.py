@@ -0,0 +1,99 @@
+"""Benchmark the streaming history export against a synthetic power user.
+
+Creates (or reuses) a SQLite database holding one user with ``--sets`` sets,
+then streams the export and reports throughput and peak RSS growth. With
+``--compare-naive`` it also measures loading everything with ``.all()``.
+
+Usage: python -m benchmarks.export_stream --sets 1000000 --compare-naive
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import time
+from datetime import datetime, timedelta
+
+parser = argparse.ArgumentParser(description="Benchmark the streaming export")
+parser.add_argument("--sets", type=int, default=1_000_000)
+parser.add_argument("--sets-per-workout", type=int, default=20)
+parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+parser.add_argument("--db", default="/tmp/gym_bench_export.db")
+parser.add_argument("--compare-naive", action="store_true")
+args = parser.parse_args()
+os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+
+from sqlalchemy import func, insert, select  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.exercise import Exercise  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.workout import Workout, WorkoutSet  # noqa: E402
+from app.services.export_service import history_query, stream_history  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def populate(db, n_sets: int, per_workout: int) -> int:
+    Base.metadata.create_all(engine)
+    user = db.scalar(select(User).where(User.email == "bench-export@example.com"))
+    if user is not None and db.scalar(select(func.count(WorkoutSet.id))) >= n_sets:
+        return user.id
+    db.close()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db.add_all(Exercise(name=f"Exercise {i}", muscle_group="Bench") for i in range(50))
+    user = User(email="bench-export@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    rng = random.Random(42)
+    n_workouts = n_sets // per_workout
+    start = datetime(2015, 1, 1)
+    db.execute(insert(Workout), [{"user_id": user.id, "name": f"Session {i}", "date": start + timedelta(hours=12 * i)} for i in range(n_workouts)])
+    batch = []
+    for workout_id in range(1, n_workouts + 1):
+        for order in range(per_workout):
+            batch.append({"workout_id": workout_id, "exercise_id": rng.randint(1, 50), "reps": rng.randint(1, 12), "weight": rng.randint(20, 250), "rest_seconds": 90, "order": order})
+        if len(batch) >= 50_000:
+            db.execute(insert(WorkoutSet), batch)
+            batch = []
+    if batch:
+        db.execute(insert(WorkoutSet), batch)
+    db.commit()
+    return user.id
+
+
+def main():
+    db = SessionLocal()
+    t0 = time.perf_counter()
+    user_id = populate(db, args.sets, args.sets_per_workout)
+    db.close()
+    print(f"data ready in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+    results = {"sets": args.sets, "format": args.format}
+    base_rss = peak_rss_mb()
+    t0 = time.perf_counter()
+    size = sum(len(chunk) for chunk in stream_history(SessionLocal, user_id, fmt=args.format))
+    elapsed = time.perf_counter() - t0
+    results["streaming"] = {"seconds": round(elapsed, 2), "rows_per_second": round(args.sets / elapsed), "bytes": size, "peak_rss_growth_mb": round(peak_rss_mb() - base_rss, 1)}
+
+    if args.compare_naive:
+        base_rss = peak_rss_mb()
+        t0 = time.perf_counter()
+        db = SessionLocal()
+        rows = db.execute(history_query(user_id, batch_size=args.sets).execution_options(yield_per=None)).all()
+        body = json.dumps([[r[0].isoformat(), *r[1:]] for r in rows])
+        db.close()
+        elapsed = time.perf_counter() - t0
+        results["naive_all"] = {"seconds": round(elapsed, 2), "rows_per_second": round(len(rows) / elapsed), "bytes": len(body), "peak_rss_growth_mb": round(peak_rss_mb() - base_rss, 1)}
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
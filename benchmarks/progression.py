@@ -0,0 +1,154 @@
+"""Benchmark for the NumPy progression analytics on one long history.
+
+Seeds a single user with ``--sets`` sets spread over ``--days`` days and
+times each step of the progression endpoints: loading the columns, each
+vectorized computation, and the same metrics computed with per-set Python
+loops over ORM rows (the way the older analytics code worked). The loop
+results double as a reference and must match. Finally, whole requests are
+timed through the app with the analytics cache disabled.
+
+Usage: python -m benchmarks.progression --sets 500000 --days 1825
+"""
+import argparse
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+parser = argparse.ArgumentParser(description="Benchmark progression analytics")
+parser.add_argument("--sets", type=int, default=500_000)
+parser.add_argument("--days", type=int, default=1825)
+parser.add_argument("--sets-per-workout", type=int, default=25)
+parser.add_argument("--requests", type=int, default=3)
+parser.add_argument("--db", default="/tmp/gym_bench_progression.db")
+parser.add_argument("--reuse", action="store_true", help="keep an existing database instead of seeding a new one")
+args = parser.parse_args()
+if not args.reuse:
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(args.db + suffix):
+            os.remove(args.db + suffix)
+os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+os.environ["ANALYTICS_CACHE_BACKEND"] = "none"
+os.environ["OUTBOX_MODE"] = "inline"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app as current_app  # noqa: E402
+from app.models.exercise import Exercise  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.workout import Workout, WorkoutSet  # noqa: E402
+from app.repositories.progression_repo import ProgressionRepository, epoch_day  # noqa: E402
+from app.services import progression_service as progression  # noqa: E402
+
+BATCH = 50_000
+EXERCISES = 20
+
+
+def seed() -> None:
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(7)
+    end = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+    workouts = args.sets // args.sets_per_workout
+    with SessionLocal() as db:
+        db.add(User(email="bench@example.com", hashed_password="x"))
+        db.add_all([Exercise(name=f"Exercise {i}") for i in range(EXERCISES)])
+        db.flush()
+        db.execute(insert(Workout), [{"user_id": 1, "date": end - timedelta(days=args.days * k / workouts)} for k in range(workouts)])
+        rows = []
+        for workout_id in range(1, workouts + 1):
+            # ids run newest first; loads creep up over the history
+            progress = 1 + 0.5 * (workouts - workout_id) / workouts
+            for order in range(args.sets_per_workout):
+                exercise_id = (workout_id + order // 5) % EXERCISES + 1
+                weight = 40 + 5 * exercise_id
+                rows.append({"workout_id": workout_id, "exercise_id": exercise_id, "reps": rng.randint(1, 15), "weight": int(weight * progress * rng.uniform(0.8, 1.05)), "order": order})
+            if len(rows) >= BATCH:
+                db.execute(insert(WorkoutSet), rows)
+                rows = []
+        if rows:
+            db.execute(insert(WorkoutSet), rows)
+        db.commit()
+
+
+def loop_metrics(user_id: int, first: date, end: date) -> dict:
+    """The three metrics computed set by set in Python."""
+    with SessionLocal() as db:
+        rows = db.execute(select(Workout.date, WorkoutSet.exercise_id, WorkoutSet.workout_id, WorkoutSet.reps, WorkoutSet.weight).join(Workout, Workout.id == WorkoutSet.workout_id).where(Workout.user_id == user_id)).all()
+    best: dict[tuple, float] = {}
+    daily: dict[date, int] = defaultdict(int)
+    weeks: dict[date, dict] = defaultdict(lambda: {"volume": 0, "sets": 0, "reps": 0, "sessions": set()})
+    for at, exercise_id, workout_id, reps, weight in rows:
+        day = at.date()
+        reps, weight = reps or 0, weight or 0
+        if 0 < reps <= progression.E1RM_MAX_REPS and weight > 0:
+            e1rm = weight if reps == 1 else weight * (1 + reps / 30)
+            key = (exercise_id, day)
+            if e1rm > best.get(key, 0):
+                best[key] = e1rm
+        daily[day] += weight * reps
+        week = weeks[day - timedelta(days=day.weekday())]
+        week["volume"] += weight * reps
+        week["sets"] += 1
+        week["reps"] += reps
+        week["sessions"].add(workout_id)
+
+    latest = {}
+    for (exercise_id, day), value in sorted(best.items()):
+        latest[exercise_id] = round(value, 1)
+    load = []
+    day = first
+    while day < end:
+        acute = sum(daily.get(day - timedelta(days=k), 0) for k in range(progression.ACUTE_DAYS))
+        chronic = sum(daily.get(day - timedelta(days=k), 0) for k in range(progression.CHRONIC_DAYS)) * progression.ACUTE_DAYS / progression.CHRONIC_DAYS
+        load.append((day, daily.get(day, 0), acute, round(chronic, 1)))
+        day += timedelta(days=1)
+    weekly = [(week, totals["volume"], totals["sets"], totals["reps"], len(totals["sessions"])) for week, totals in sorted(weeks.items())]
+    return {"latest_e1rm": latest, "load": load, "weekly": weekly}
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, round((time.perf_counter() - started) * 1000, 1)
+
+
+def main() -> None:
+    if not args.reuse:
+        seed()
+    end = datetime.utcnow().date() + timedelta(days=1)
+    results = {}
+    with SessionLocal() as db:
+        repo = ProgressionRepository(db)
+        columns, results["load_columns_ms"] = timed(lambda: repo.set_columns(1, end=end))
+        first = int(columns.day.min())
+        exercises, results["e1rm_ms"] = timed(lambda: progression.e1rm_by_exercise(columns))
+        load, results["training_load_ms"] = timed(lambda: progression.load_by_day(columns, first, epoch_day(end)))
+        weeks, results["weekly_changes_ms"] = timed(lambda: progression.weekly_changes(columns))
+    reference, results["python_loops_ms"] = timed(lambda: loop_metrics(1, date(1970, 1, 1) + timedelta(days=first), end))
+
+    assert {e["exercise_id"]: e["latest"] for e in exercises} == reference["latest_e1rm"], "e1RM mismatch"
+    assert [(p["day"], p["load"], p["acute"], p["chronic"]) for p in load] == reference["load"], "training load mismatch"
+    assert [(w["week"], w["volume"], w["sets"], w["reps"], w["sessions"]) for w in weeks] == reference["weekly"], "weekly totals mismatch"
+
+    requests = {}
+    with TestClient(current_app) as client:
+        for name in ("e1rm", "training-load", "weekly-changes"):
+            samples = []
+            for _ in range(args.requests):
+                started = time.perf_counter()
+                response = client.get(f"/api/v1/analytics/{name}/1")
+                response.raise_for_status()
+                samples.append((time.perf_counter() - started) * 1000)
+            requests[name] = {"best_ms": round(min(samples), 1), "bytes": len(response.content)}
+
+    print(json.dumps({"sets": len(columns.day), "days": args.days, "exercises": len(exercises), "compute": results, "requests": requests}, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Benchmark suite: synthetic data, load scenarios and baseline comparison.
+
+Generates a SQLite database once with ``benchmarks.datagen``, then for each
+mode runs every scenario in ``benchmarks.scenarios`` against its own copy of
+that database:
+
+- ``inprocess`` drives the FastAPI app through ``httpx.ASGITransport``
+- ``uvicorn`` starts a real server in a subprocess
+
+Results (throughput, p50/p95/p99 latency, queries per request) are printed
+as JSON and optionally written to ``--output``. With ``--baseline`` they are
+compared against a stored run, and the exit status is 1 if any scenario is
+slower, or runs more queries, than ``--tolerance`` allows.
+``--save-baseline`` stores the current run as the new baseline.
+
+Usage: python -m benchmarks.run --duration 5 --concurrency 16 --baseline benchmarks/baseline.json
+       python -m benchmarks.run --modes inprocess --scenarios mixed --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.scenarios import SCENARIOS, Fixtures, run_scenario
+
+MODES = ("inprocess", "uvicorn")
+
+
+def load_fixtures(db_path: str) -> Fixtures:
+    with contextlib.closing(sqlite3.connect(db_path)) as conn:
+        users = conn.execute("SELECT count(*) FROM users").fetchone()[0]
+        latest = dict(conn.execute("SELECT user_id, max(id) FROM workouts GROUP BY user_id").fetchall())
+        exercises = conn.execute("SELECT count(*) FROM exercises").fetchone()[0]
+    return Fixtures(users=users, latest_workout=latest, exercises=exercises)
+
+
+def copy_db(source: str, target: str) -> str:
+    shutil.copyfile(source, target)
+    return target
+
+
+def app_env(db_path: str) -> dict:
+    return {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}", "SQL_PROFILING": "1"}
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    """Run the ASGI lifespan startup/shutdown, which ``httpx.ASGITransport`` does not do."""
+    queue: asyncio.Queue = asyncio.Queue()
+    await queue.put({"type": "lifespan.startup"})
+    started, stopped = asyncio.Event(), asyncio.Event()
+
+    async def send(message):
+        if message["type"].startswith("lifespan.startup"):
+            started.set()
+        elif message["type"].startswith("lifespan.shutdown"):
+            stopped.set()
+
+    task = asyncio.create_task(app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}, queue.get, send))
+    await started.wait()
+    try:
+        yield
+    finally:
+        await queue.put({"type": "lifespan.shutdown"})
+        await stopped.wait()
+        await task
+
+
+async def run_inprocess(db_path: str, fx: Fixtures, args, log_path: str) -> dict:
+    os.environ.update(app_env(db_path))
+    sql_logger = logging.getLogger("app.sql")
+    sql_logger.addHandler(logging.FileHandler(log_path))
+    sql_logger.propagate = False
+    from app.main import app
+
+    results = {}
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            for i, name in enumerate(args.scenarios):
+                results[name] = await run_scenario(client, name, fx, concurrency=args.concurrency, duration=args.duration, seed=i)
+    return results
+
+
+async def run_uvicorn(db_path: str, fx: Fixtures, args, log_path: str) -> dict:
+    with open(log_path, "w") as log:
+        proc = subprocess.Popen([sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"], env=app_env(db_path), stdout=log, stderr=log)
+        try:
+            base_url = f"http://127.0.0.1:{args.port}"
+            deadline = time.time() + 30
+            while True:
+                try:
+                    httpx.get(f"{base_url}/docs", timeout=1)
+                    break
+                except httpx.HTTPError:
+                    if time.time() > deadline or proc.poll() is not None:
+                        raise RuntimeError(f"server did not start, see {log_path}")
+                    time.sleep(0.2)
+            results = {}
+            async with httpx.AsyncClient(base_url=base_url, limits=httpx.Limits(max_connections=args.concurrency), timeout=60) as client:
+                for i, name in enumerate(args.scenarios):
+                    results[name] = await run_scenario(client, name, fx, concurrency=args.concurrency, duration=args.duration, seed=i)
+            return results
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions of ``results`` against ``baseline``, as readable lines."""
+    regressions = []
+    for mode, scenarios in results.items():
+        for name, current in scenarios.items():
+            before = baseline.get(mode, {}).get(name)
+            if before is None:
+                continue
+            label = f"{mode}/{name}"
+            if current["requests_per_second"] < before["requests_per_second"] * (1 - tolerance):
+                regressions.append(f"{label}: throughput {current['requests_per_second']} < {before['requests_per_second']} req/s")
+            if current["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+                regressions.append(f"{label}: p95 {current['p95_ms']} > {before['p95_ms']} ms")
+            if current["queries_per_request"] and before["queries_per_request"] and current["queries_per_request"] > before["queries_per_request"] * (1 + tolerance):
+                regressions.append(f"{label}: {current['queries_per_request']} > {before['queries_per_request']} queries/request")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--workouts-per-user", type=int, default=60)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the results JSON here")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="gym-bench-") as tmp:
+        pristine = os.path.join(tmp, "pristine.db")
+        generated = subprocess.run([sys.executable, "-m", "benchmarks.datagen", "--db", pristine, "--users", str(args.users), "--workouts-per-user", str(args.workouts_per_user), "--seed", str(args.seed)], check=True, capture_output=True, text=True)
+        print(f"data: {generated.stdout.strip()}", file=sys.stderr)
+        fx = load_fixtures(pristine)
+
+        results = {}
+        for mode in args.modes:
+            db_path = copy_db(pristine, os.path.join(tmp, f"{mode}.db"))
+            runner = run_inprocess if mode == "inprocess" else run_uvicorn
+            results[mode] = asyncio.run(runner(db_path, fx, args, os.path.join(tmp, f"{mode}.log")))
+
+    report = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "users": args.users, "workouts_per_user": args.workouts_per_user, "duration": args.duration, "concurrency": args.concurrency},
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Load scenarios driven against the API through an ``httpx.AsyncClient``.
+
+Each scenario is a weighted list of operations; ``run_scenario`` keeps
+``concurrency`` workers issuing them for ``duration`` seconds and records
+latency, status and the SQL query count reported in ``Server-Timing``
+(present when the app runs with ``SQL_PROFILING=1``).
+"""
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import httpx
+
+from benchmarks.async_vs_sync import percentile
+from benchmarks.datagen import PASSWORD, user_email
+
+API = "/api/v1"
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class Fixtures:
+    """What the scenarios need to know about the generated data."""
+
+    users: int
+    latest_workout: dict[int, int]
+    exercises: int
+
+
+async def login(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    return await client.post(f"{API}/auth/login", data={"username": user_email(rng.randrange(fx.users)), "password": PASSWORD})
+
+
+async def add_set(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    workout_id = fx.latest_workout[rng.randint(1, fx.users)]
+    return await client.post(f"{API}/workouts/{workout_id}/sets", json={"exercise_id": rng.randint(1, fx.exercises), "reps": rng.randint(3, 12), "weight": rng.randint(20, 150)})
+
+
+async def add_set_batch(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    workout_id = fx.latest_workout[rng.randint(1, fx.users)]
+    sets = [{"exercise_id": rng.randint(1, fx.exercises), "reps": rng.randint(3, 12), "weight": rng.randint(20, 150)} for _ in range(10)]
+    return await client.post(f"{API}/workouts/{workout_id}/sets/batch", json=sets)
+
+
+async def weekly_volume(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    return await client.get(f"{API}/analytics/weekly-volume/{rng.randint(1, fx.users)}")
+
+
+async def monthly_sessions(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    return await client.get(f"{API}/analytics/monthly-sessions/{rng.randint(1, fx.users)}")
+
+
+async def volume_series(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    start = (datetime.utcnow() - timedelta(days=365)).isoformat()
+    return await client.get(f"{API}/analytics/series/{rng.randint(1, fx.users)}", params={"start": start, "bucket": "week", "metric": "volume"})
+
+
+async def list_workouts(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    return await client.get(f"{API}/workouts/user/{rng.randint(1, fx.users)}", params={"limit": 20})
+
+
+async def get_workout(client: httpx.AsyncClient, rng: random.Random, fx: Fixtures) -> httpx.Response:
+    return await client.get(f"{API}/workouts/{fx.latest_workout[rng.randint(1, fx.users)]}")
+
+
+SCENARIOS = {
+    "login_storm": [(login, 1)],
+    "set_ingestion": [(add_set, 3), (add_set_batch, 1)],
+    "analytics_reads": [(weekly_volume, 1), (monthly_sessions, 1), (volume_series, 1), (list_workouts, 1)],
+    "mixed": [(get_workout, 4), (list_workouts, 2), (weekly_volume, 2), (volume_series, 1), (add_set, 3), (login, 1)],
+}
+
+
+@dataclass
+class Recorder:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    def record(self, elapsed: float, response: httpx.Response) -> None:
+        self.latencies.append(elapsed)
+        self.statuses[response.status_code] = self.statuses.get(response.status_code, 0) + 1
+        match = _QUERIES.search(response.headers.get("server-timing", ""))
+        if match:
+            self.queries.append(int(match.group(1)))
+
+    def summary(self, elapsed: float) -> dict:
+        n = len(self.latencies)
+        return {
+            "requests": n,
+            "errors": sum(count for status, count in self.statuses.items() if status >= 400),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "requests_per_second": round(n / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 2),
+            "queries_per_request": round(sum(self.queries) / len(self.queries), 2) if self.queries else None,
+        }
+
+
+async def run_scenario(client: httpx.AsyncClient, name: str, fx: Fixtures, *, concurrency: int, duration: float, seed: int = 0) -> dict:
+    ops, weights = zip(*SCENARIOS[name])
+    recorder = Recorder()
+    stop = time.perf_counter() + duration
+
+    async def worker(worker_seed: int):
+        rng = random.Random(worker_seed)
+        while time.perf_counter() < stop:
+            op = rng.choices(ops, weights)[0]
+            t0 = time.perf_counter()
+            response = await op(client, rng, fx)
+            recorder.record(time.perf_counter() - t0, response)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(seed * 10_000 + i) for i in range(concurrency)))
+    return recorder.summary(time.perf_counter() - started)
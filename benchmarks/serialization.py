@@ -0,0 +1,109 @@
+"""Micro-benchmark for the workout detail serialization path.
+
+Seeds one workout with ``--sets`` sets and times ``GET /workouts/{id}``
+in-process, comparing the old path (lazy-loaded sets, hand-built dict,
+``jsonable_encoder`` + stdlib json) against the current one (selectinload,
+``WorkoutRead`` response model, orjson response class). The serialization
+step alone is also timed without the HTTP stack.
+
+Usage: python -m benchmarks.serialization --sets 200 --requests 500
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+parser = argparse.ArgumentParser(description="Benchmark workout detail serialization")
+parser.add_argument("--sets", type=int, default=200)
+parser.add_argument("--requests", type=int, default=500)
+parser.add_argument("--db", default="/tmp/gym_bench_serialization.db")
+args = parser.parse_args()
+if os.path.exists(args.db):
+    os.remove(args.db)
+os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.core.responses import ORJSONResponse  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine, get_db  # noqa: E402
+from app.main import app as current_app  # noqa: E402
+from app.models.exercise import Exercise  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.workout import Workout, WorkoutSet  # noqa: E402
+from app.repositories.workout_repo import WorkoutRepository  # noqa: E402
+from app.schemas.workout import WorkoutRead  # noqa: E402
+
+
+def seed() -> int:
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(User(email="bench@example.com", hashed_password="x"))
+        db.add_all([Exercise(name=f"Exercise {i}") for i in range(20)])
+        db.flush()
+        workout = Workout(user_id=1, name="Bench")
+        db.add(workout)
+        db.flush()
+        db.execute(insert(WorkoutSet), [{"workout_id": workout.id, "exercise_id": i % 20 + 1, "reps": 5 + i % 6, "weight": 60 + i % 40, "order": i} for i in range(args.sets)])
+        db.commit()
+        return workout.id
+
+
+def legacy_app() -> FastAPI:
+    """The pre-typed endpoint: default JSONResponse, lazy ``workout.sets``, dict built by hand."""
+    legacy = FastAPI()
+
+    @legacy.get("/workouts/{workout_id}")
+    def get_workout(workout_id: int, db: Session = Depends(get_db)):
+        workout = WorkoutRepository(db).get(workout_id)
+        return {
+            "id": workout.id,
+            "user_id": workout.user_id,
+            "date": workout.date,
+            "sets": [{"id": s.id, "exercise_id": s.exercise_id, "reps": s.reps, "weight": s.weight} for s in workout.sets],
+        }
+
+    return legacy
+
+
+def time_calls(fn, n: int) -> dict:
+    fn()
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    return {"mean_us": round(statistics.fmean(samples), 1), "p50_us": round(samples[len(samples) // 2], 1), "p95_us": round(samples[int(len(samples) * 0.95)], 1)}
+
+
+def main() -> None:
+    workout_id = seed()
+    results = {}
+
+    with SessionLocal() as db:
+        workout = WorkoutRepository(db).get(workout_id, with_sets=True)
+        as_dict = {"id": workout.id, "user_id": workout.user_id, "date": workout.date, "sets": [{"id": s.id, "exercise_id": s.exercise_id, "reps": s.reps, "weight": s.weight} for s in workout.sets]}
+        adapter = TypeAdapter(WorkoutRead)
+        results["serialize_legacy"] = time_calls(lambda: JSONResponse(jsonable_encoder(as_dict)).body, args.requests)
+        results["serialize_typed"] = time_calls(lambda: ORJSONResponse(adapter.dump_python(adapter.validate_python(workout), mode="json")).body, args.requests)
+
+    path = f"/workouts/{workout_id}"
+    with TestClient(legacy_app()) as client:
+        results["request_legacy"] = time_calls(lambda: client.get(path).raise_for_status(), args.requests)
+    with TestClient(current_app) as client:
+        results["request_typed"] = time_calls(lambda: client.get(f"/api/v1{path}").raise_for_status(), args.requests)
+
+    print(json.dumps({"sets": args.sets, "requests": args.requests, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
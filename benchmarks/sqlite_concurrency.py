@@ -0,0 +1,99 @@
+"""Concurrency check for the SQLite production mode.
+
+Starts ``--writers`` threads behind a barrier, each adding one set to a shared
+workout through ``WorkoutService.add_set`` in its own session, then verifies
+that every write landed (sets and daily rollup) and reports any
+"database is locked" errors. Exits non-zero if any write failed.
+
+Usage: python -m benchmarks.sqlite_concurrency --writers 200
+       python -m benchmarks.sqlite_concurrency --writers 200 --mode default
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+parser = argparse.ArgumentParser(description="Concurrent set writes against SQLite")
+parser.add_argument("--writers", type=int, default=200)
+parser.add_argument("--mode", choices=("production", "default"), default="production")
+parser.add_argument("--db", default="/tmp/gym_bench_sqlite_concurrency.db")
+args = parser.parse_args()
+for suffix in ("", "-wal", "-shm"):
+    if os.path.exists(args.db + suffix):
+        os.remove(args.db + suffix)
+os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+os.environ["SQLITE_PRODUCTION"] = "1" if args.mode == "production" else "0"
+# The check below reads the rollup right after the writes, so derived data must not be deferred
+os.environ["OUTBOX_MODE"] = "inline"
+
+from sqlalchemy import func, select  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.exercise import Exercise  # noqa: E402
+from app.models.rollup import DailyExerciseVolume  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.workout import Workout, WorkoutSet  # noqa: E402
+from app.services.workout_service import WorkoutService  # noqa: E402
+
+
+def seed() -> int:
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(User(email="bench@example.com", hashed_password="x"))
+        db.add(Exercise(name="Squat"))
+        db.commit()
+        workout = WorkoutService(db).create_workout(user_id=1, name="Concurrency")
+        return workout.id
+
+
+def main() -> None:
+    workout_id = seed()
+    barrier = threading.Barrier(args.writers)
+
+    def write(i: int) -> tuple[float, str | None]:
+        barrier.wait()
+        started = time.perf_counter()
+        try:
+            with SessionLocal() as db:
+                WorkoutService(db).add_set(workout_id=workout_id, exercise_id=1, reps=5, weight=100 + i % 10, order=i)
+        except Exception as exc:
+            return time.perf_counter() - started, f"{type(exc).__name__}: {str(exc):.120}"
+        return time.perf_counter() - started, None
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.writers) as pool:
+        results = list(pool.map(write, range(args.writers)))
+    elapsed = time.perf_counter() - started
+
+    errors = [err for _, err in results if err]
+    latencies = sorted(latency for latency, _ in results)
+    with SessionLocal() as db:
+        stored = db.scalar(select(func.count(WorkoutSet.id)).where(WorkoutSet.workout_id == workout_id))
+        rollup_sets = db.scalar(select(func.coalesce(func.sum(DailyExerciseVolume.sets), 0)))
+        journal_mode = db.connection().exec_driver_sql("PRAGMA journal_mode").scalar()
+    report = {
+        "mode": args.mode,
+        "journal_mode": journal_mode,
+        "writers": args.writers,
+        "elapsed_seconds": round(elapsed, 3),
+        "writes_per_second": round(args.writers / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 1),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 1),
+        "sets_stored": stored,
+        "rollup_sets": rollup_sets,
+        "errors": len(errors),
+        "lock_errors": sum("locked" in err for err in errors),
+        "sample_errors": errors[:5],
+    }
+    print(json.dumps(report, indent=2))
+    if errors or stored != args.writers or rollup_sets != args.writers:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""Process pending outbox events once, e.g. after bulk jobs run while no app worker was up."""
+import argparse
+
+from app.services.outbox_worker import OutboxWorker
+
+
+def drain(batch_size: int):
+    processed = OutboxWorker(batch_size=batch_size).drain()
+    print(f"Processed {processed} outbox events")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    drain(batch_size=args.batch_size)
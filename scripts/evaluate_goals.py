@@ -0,0 +1,23 @@
+"""Recompute goal progress from existing workouts."""
+import argparse
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.repositories.goal_repo import GoalRepository
+
+
+def evaluate(user_id: int | None = None):
+    db: Session = SessionLocal()
+    try:
+        goals = GoalRepository(db).evaluate_all(user_id=user_id)
+        print(f"Evaluated {goals} goals")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, default=None, help="only evaluate this user's goals")
+    args = parser.parse_args()
+    evaluate(user_id=args.user_id)
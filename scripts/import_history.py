@@ -0,0 +1,47 @@
+"""Import a CSV or NDJSON workout history file for one user.
+
+Usage: python -m scripts.import_history --user-id 1 history.csv
+"""
+import argparse
+import sys
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.services.import_service import FORMATS, ImportReport, ImportService, iter_records
+
+
+def print_progress(report: ImportReport):
+    print(
+        f"  {report.rows_read} rows read, {report.sets_imported} sets imported, "
+        f"{report.chunks_failed} failed chunks, {report.rows_per_second:.0f} rows/s",
+        file=sys.stderr,
+    )
+
+
+def run(path: str, user_id: int, fmt: str | None = None, chunk_size: int = 1000):
+    fmt = fmt or path.rsplit(".", 1)[-1].lower()
+    if fmt not in FORMATS:
+        raise SystemExit(f"format must be one of {', '.join(FORMATS)}")
+    db: Session = SessionLocal()
+    try:
+        with open(path, encoding="utf-8", newline="") as stream:
+            report = ImportService(db, chunk_size=chunk_size, on_progress=print_progress).import_records(user_id, iter_records(stream, fmt))
+    finally:
+        db.close()
+    print(
+        f"Imported {report.sets_imported} sets in {report.workouts_created} workouts "
+        f"({report.rows_skipped} rows skipped) in {report.elapsed_seconds:.1f}s, {report.rows_per_second:.0f} rows/s"
+    )
+    for error in report.errors:
+        print(f"  {error}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import a workout history file")
+    parser.add_argument("path")
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--format", choices=FORMATS, default=None, help="defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.path, args.user_id, fmt=args.format, chunk_size=args.chunk_size)
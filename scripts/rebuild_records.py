@@ -0,0 +1,23 @@
+"""Rebuild personal records from existing workout sets."""
+import argparse
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.repositories.record_repo import PersonalRecordRepository
+
+
+def rebuild(user_id: int | None = None):
+    db: Session = SessionLocal()
+    try:
+        rows = PersonalRecordRepository(db).rebuild(user_id=user_id)
+        print(f"Rebuilt {rows} personal records")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, default=None, help="only rebuild this user's records")
+    args = parser.parse_args()
+    rebuild(user_id=args.user_id)
@@ -1,8 +1,17 @@
-"""Seed script to populate default exercises into the DB."""
+"""Seed script to populate default exercises into the DB.
+
+Optionally takes a JSON (list of objects) or CSV catalog file with
+name, category, muscle_group and description columns; everything is
+upserted by name in bulk rather than checked one row at a time.
+"""
+import argparse
+import csv
+import json
+
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
-from app.models.exercise import Exercise
+from app.repositories.exercise_repo import ExerciseRepository
 
 
 DEFAULT_EXERCISES = [
@@ -13,18 +22,25 @@ DEFAULT_EXERCISES = [
 ]
 
 
-def seed():
+def load_catalog(path: str) -> list[dict]:
+    with open(path, encoding="utf-8", newline="") as fh:
+        if path.endswith(".json"):
+            return json.load(fh)
+        return list(csv.DictReader(fh))
+
+
+def seed(path: str | None = None):
+    items = DEFAULT_EXERCISES + (load_catalog(path) if path else [])
     db: Session = SessionLocal()
     try:
-        for item in DEFAULT_EXERCISES:
-            exists = db.query(Exercise).filter(Exercise.name == item["name"]).first()
-            if not exists:
-                db.add(Exercise(**item))
-        db.commit()
-        print("Seeded exercises")
+        count = ExerciseRepository(db).upsert_many(items)
+        print(f"Seeded {count} exercises")
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    seed()
+    parser = argparse.ArgumentParser(description="Seed the exercise catalog")
+    parser.add_argument("catalog", nargs="?", default=None, help="optional JSON or CSV catalog file")
+    args = parser.parse_args()
+    seed(args.catalog)
@@ -0,0 +1,59 @@
+"""Shared test setup.
+
+Settings are read from the environment when ``app`` is imported, so they are
+pinned here first: a throwaway SQLite database in production mode (WAL, one
+writer connection) and derived data updated inline, so tests can read
+rollups right after a write.
+"""
+import os
+import tempfile
+
+import pytest
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='gym_tests_'), 'test.db')}"
+os.environ["SQLITE_PRODUCTION"] = "1"
+os.environ["OUTBOX_MODE"] = "inline"
+os.environ["ANALYTICS_CACHE_BACKEND"] = "none"
+
+import app.models  # noqa: E402,F401
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.exercise import Exercise  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.exercise_catalog import exercise_catalog  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    Base.metadata.create_all(bind=engine)
+    yield
+    engine.dispose()
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def make_user(db):
+    def make(email: str) -> int:
+        user = User(email=email, hashed_password="x")
+        db.add(user)
+        db.commit()
+        return user.id
+
+    return make
+
+
+@pytest.fixture
+def make_exercise(db):
+    def make(name: str) -> int:
+        exercise = Exercise(name=name)
+        db.add(exercise)
+        db.commit()
+        exercise_catalog.invalidate()
+        return exercise.id
+
+    return make
@@ -0,0 +1,50 @@
+"""Analytics endpoints."""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def test_series_accepts_timezone_aware_bounds(client, make_user, make_exercise):
+    user_id = make_user("series-tz@example.com")
+    exercise_id = make_exercise("Series Deadlift")
+    client.post("/api/v1/workouts/with-sets", json={"user_id": user_id, "date": "2024-01-10T12:00:00", "sets": [{"exercise_id": exercise_id, "reps": 5, "weight": 100}]})
+
+    aware = client.get(f"/api/v1/analytics/series/{user_id}", params={"start": "2024-01-01T02:00:00+02:00", "end": "2024-02-01T00:00:00Z"})
+    naive = client.get(f"/api/v1/analytics/series/{user_id}", params={"start": "2024-01-01T00:00:00", "end": "2024-02-01T00:00:00"})
+    assert aware.status_code == 200
+    assert aware.json()["start"] == naive.json()["start"] == "2024-01-01T00:00:00"
+    assert aware.json()["points"] == naive.json()["points"]
+    assert sum(point["value"] for point in aware.json()["points"]) == 500
+
+
+def test_series_etag_depends_on_the_query(client, make_user):
+    user_id = make_user("series-etag@example.com")
+    window = {"start": "2024-01-01T00:00:00", "end": "2024-02-01T00:00:00"}
+    volume = client.get(f"/api/v1/analytics/series/{user_id}", params={**window, "metric": "volume"})
+    etag = volume.headers["ETag"]
+
+    assert client.get(f"/api/v1/analytics/series/{user_id}", params={**window, "metric": "volume"}, headers={"If-None-Match": etag}).status_code == 304
+    sets = client.get(f"/api/v1/analytics/series/{user_id}", params={**window, "metric": "sets"}, headers={"If-None-Match": etag})
+    assert sets.status_code == 200
+    assert sets.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize("endpoint, first, second", [
+    ("e1rm", {"exercise_id": 1}, {"exercise_id": 2}),
+    ("training-load", {"start": "2024-01-01"}, {"start": "2024-01-15"}),
+    ("weekly-changes", {"start": "2024-01-01"}, {"start": "2024-01-15"}),
+])
+def test_progression_etags_depend_on_the_query(client, make_user, endpoint, first, second):
+    user_id = make_user(f"{endpoint}-etag@example.com")
+    end = {"end": "2024-02-01"}
+    etag = client.get(f"/api/v1/analytics/{endpoint}/{user_id}", params={**first, **end}).headers["ETag"]
+
+    assert client.get(f"/api/v1/analytics/{endpoint}/{user_id}", params={**first, **end}, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(f"/api/v1/analytics/{endpoint}/{user_id}", params={**second, **end}, headers={"If-None-Match": etag}).status_code == 200
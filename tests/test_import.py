@@ -0,0 +1,56 @@
+"""Streaming history import."""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.exercise import Exercise
+from app.repositories.exercise_catalog import exercise_catalog
+
+BAD_LINES = {
+    "malformed": '{"date": "2023-03-05", "exercise": ',
+    "array": "[1, 2]",
+    "string": '"Import Row"',
+    "number": "42",
+}
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def _record(day: int, exercise: str) -> str:
+    return json.dumps({"date": f"2023-03-{day:02d}", "workout": "Pull", "exercise": exercise, "reps": 8, "weight": 60})
+
+
+@pytest.mark.parametrize("kind", BAD_LINES)
+def test_unparseable_or_non_object_lines_are_skipped(client, make_user, make_exercise, kind):
+    user_id = make_user(f"import-{kind}@example.com")
+    exercise = f"Import Row {kind}"
+    make_exercise(exercise)
+    body = "\n".join([_record(1, exercise), _record(2, exercise), BAD_LINES[kind], _record(3, exercise)])
+
+    response = client.post(f"/api/v1/workouts/import/{user_id}", files={"file": ("log.ndjson", body.encode())}, params={"chunk_size": 2})
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows_read"], report["rows_skipped"], report["sets_imported"], report["chunks_failed"]) == (4, 1, 3, 0)
+    assert len(report["errors"]) == 1 and report["errors"][0].startswith("record 3: ")
+
+
+def test_exercise_added_elsewhere_is_found_by_one_catalog_reload(client, db, make_user):
+    user_id = make_user("import-reload@example.com")
+    exercise_catalog.load(db)
+    # Written behind the cache's back, as another worker process would
+    db.add(Exercise(name="Import Late Addition"))
+    db.commit()
+    body = "\n".join([_record(1, "Import Late Addition"), _record(2, "Import Never Added")])
+
+    response = client.post(f"/api/v1/workouts/import/{user_id}", files={"file": ("log.ndjson", body.encode())})
+
+    report = response.json()
+    assert (report["sets_imported"], report["rows_skipped"]) == (1, 1)
+    assert "unknown exercise 'Import Never Added'" in report["errors"][0]
@@ -0,0 +1,33 @@
+"""Batch set inserts and the ids they return."""
+from sqlalchemy import event, select
+
+from app.db.session import engine
+from app.models.workout import WorkoutSet
+from app.services.workout_service import WorkoutService
+
+# More rows than one insertmanyvalues page, so the batch spans several INSERT statements
+BATCH = 2500
+
+
+def test_batch_ids_follow_input_order(db, make_user, make_exercise):
+    user_id = make_user("batch@example.com")
+    exercise_id = make_exercise("Batch Curl")
+    workout_id = WorkoutService(db).create_workout(user_id=user_id, name="Batch").id
+    sets = [{"exercise_id": exercise_id, "reps": 1 + i % 12, "weight": 10_000 + i, "order": i} for i in range(BATCH)]
+
+    inserts = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO workout_sets"):
+            inserts.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        ids = WorkoutService(db).add_sets(workout_id, sets)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert 1 < len(inserts) < BATCH
+    assert len(ids) == len(set(ids)) == BATCH
+    stored = {row.id: (row.order, row.weight, row.reps) for row in db.execute(select(WorkoutSet.id, WorkoutSet.order, WorkoutSet.weight, WorkoutSet.reps).where(WorkoutSet.workout_id == workout_id))}
+    assert [stored[set_id] for set_id in ids] == [(s["order"], s["weight"], s["reps"]) for s in sets]
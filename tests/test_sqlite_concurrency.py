@@ -0,0 +1,41 @@
+"""Concurrent writes against the SQLite production mode."""
+import threading
+
+from sqlalchemy import func, select
+
+from app.db.session import SessionLocal
+from app.models.rollup import DailyExerciseVolume
+from app.models.workout import WorkoutSet
+from app.services.workout_service import WorkoutService
+
+WRITERS = 200
+
+
+def test_concurrent_set_writes_all_land(db, make_user, make_exercise):
+    user_id = make_user("concurrency@example.com")
+    exercise_id = make_exercise("Concurrency Squat")
+    workout_id = WorkoutService(db).create_workout(user_id=user_id, name="Concurrency").id
+    barrier = threading.Barrier(WRITERS)
+    errors = []
+
+    def write(i: int) -> None:
+        barrier.wait()
+        try:
+            with SessionLocal() as session:
+                WorkoutService(session).add_set(workout_id=workout_id, exercise_id=exercise_id, reps=5, weight=100 + i, order=i)
+        except Exception as exc:
+            errors.append(f"{type(exc).__name__}: {exc}")
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not [err for err in errors if "database is locked" in err]
+    assert not errors
+    assert db.scalar(select(func.count(WorkoutSet.id)).where(WorkoutSet.workout_id == workout_id)) == WRITERS
+    sets, reps, volume = db.execute(
+        select(func.sum(DailyExerciseVolume.sets), func.sum(DailyExerciseVolume.reps), func.sum(DailyExerciseVolume.volume)).where(DailyExerciseVolume.user_id == user_id, DailyExerciseVolume.exercise_id == exercise_id)
+    ).one()
+    assert (sets, reps, volume) == (WRITERS, 5 * WRITERS, sum(5 * (100 + i) for i in range(WRITERS)))
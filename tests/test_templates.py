@@ -0,0 +1,37 @@
+"""Template detail reads and their visibility rules."""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def test_private_template_is_only_visible_to_its_owner(client, make_user, make_exercise):
+    owner = make_user("owner@example.com")
+    other = make_user("other@example.com")
+    exercise_id = make_exercise("Template Row")
+    response = client.post("/api/v1/templates/", json={"user_id": owner, "name": "Mine", "exercises": [{"exercise_id": exercise_id, "sets": 3, "reps": 8}]})
+    template_id = response.json()["id"]
+
+    detail = client.get(f"/api/v1/templates/{template_id}", params={"user_id": owner})
+    assert detail.status_code == 200
+    assert [(e["exercise_name"], e["sets"], e["reps"]) for e in detail.json()["exercises"]] == [("Template Row", 3, 8)]
+    assert client.get(f"/api/v1/templates/{template_id}", params={"user_id": other}).status_code == 404
+    assert client.get(f"/api/v1/templates/{template_id}").status_code == 404
+
+
+def test_public_template_is_visible_to_everyone(client, make_user, make_exercise):
+    user_id = make_user("reader@example.com")
+    exercise_ids = [make_exercise("Library Press"), make_exercise("Library Squat")]
+    response = client.post("/api/v1/templates/", json={"name": "Library", "exercises": [{"exercise_id": exercise_ids[1], "order": 2}, {"exercise_id": exercise_ids[0], "order": 1}]})
+    template_id = response.json()["id"]
+
+    for params in ({}, {"user_id": user_id}):
+        detail = client.get(f"/api/v1/templates/{template_id}", params=params)
+        assert detail.status_code == 200
+        assert [e["exercise_name"] for e in detail.json()["exercises"]] == ["Library Press", "Library Squat"]